@@ -10,6 +10,7 @@ from typing import Optional, List, Any
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel, Field
 
+from api.cache import invalidates
 from api.errors import handle_api_errors, NotFoundError, ValidationError
 from db.brain import (
     # Identity
@@ -57,7 +58,12 @@ from db.brain import (
     # Composite
     get_full_brain_context,
     get_session_brief,
+    get_recent_observations,
+    get_recent_patterns,
+    get_recent_synthesis,
 )
+from db.neon import db_cursor
+from utils.context_loader import cleanup_expired_rules
 
 logger = logging.getLogger("athena.api.brain")
 
@@ -157,7 +163,7 @@ class BrainStatusUpdate(BaseModel):
 
 @router.get("/identity")
 @handle_api_errors("get identity")
-async def get_identity():
+def get_identity():
     """Get all core identity values."""
     identity = get_core_identity()
     return {"identity": identity}
@@ -165,7 +171,7 @@ async def get_identity():
 
 @router.get("/identity/{key}")
 @handle_api_errors("get identity key")
-async def get_identity_key(key: str):
+def get_identity_key(key: str):
     """Get a specific identity value."""
     value = get_identity_value(key)
     if value is None:
@@ -175,7 +181,8 @@ async def get_identity_key(key: str):
 
 @router.put("/identity/{key}")
 @handle_api_errors("update identity key")
-async def update_identity_key(key: str, update: IdentityUpdate):
+@invalidates("brain")
+def update_identity_key(key: str, update: IdentityUpdate):
     """Update a mutable identity value."""
     success = update_identity_value(key, update.value, update.description)
     if not success:
@@ -185,7 +192,7 @@ async def update_identity_key(key: str, update: IdentityUpdate):
 
 @router.get("/boundaries")
 @handle_api_errors("get boundaries")
-async def list_boundaries(
+def list_boundaries(
     boundary_type: Optional[str] = None,
     active_only: bool = True
 ):
@@ -196,7 +203,7 @@ async def list_boundaries(
 
 @router.post("/boundaries/check")
 @handle_api_errors("check boundary")
-async def check_action_boundary(check: BoundaryCheck):
+def check_action_boundary(check: BoundaryCheck):
     """Check if an action is allowed based on boundaries."""
     result = check_boundary(check.category, check.action)
     return result
@@ -204,7 +211,7 @@ async def check_action_boundary(check: BoundaryCheck):
 
 @router.get("/values")
 @handle_api_errors("get values")
-async def list_values():
+def list_values():
     """Get all active values ordered by priority."""
     values = get_values()
     return {"count": len(values), "values": values}
@@ -216,7 +223,7 @@ async def list_values():
 
 @router.get("/preferences")
 @handle_api_errors("get preferences")
-async def list_preferences(category: Optional[str] = None):
+def list_preferences(category: Optional[str] = None):
     """Get all preferences, optionally filtered by category."""
     preferences = get_preferences(category)
     return {"count": len(preferences), "preferences": preferences}
@@ -224,7 +231,7 @@ async def list_preferences(category: Optional[str] = None):
 
 @router.get("/workflows")
 @handle_api_errors("get workflows")
-async def list_workflows(enabled_only: bool = True):
+def list_workflows(enabled_only: bool = True):
     """Get all workflows."""
     workflows = get_workflows(enabled_only)
     return {"count": len(workflows), "workflows": workflows}
@@ -232,7 +239,7 @@ async def list_workflows(enabled_only: bool = True):
 
 @router.get("/workflows/{workflow_name}")
 @handle_api_errors("get workflow")
-async def get_workflow_by_name(workflow_name: str):
+def get_workflow_by_name(workflow_name: str):
     """Get a specific workflow by name."""
     workflow = get_workflow(workflow_name)
     if not workflow:
@@ -242,7 +249,8 @@ async def get_workflow_by_name(workflow_name: str):
 
 @router.post("/workflows")
 @handle_api_errors("create workflow")
-async def create_new_workflow(workflow: WorkflowCreate):
+@invalidates("brain")
+def create_new_workflow(workflow: WorkflowCreate):
     """Create a new workflow."""
     workflow_id = create_workflow(
         workflow.workflow_name,
@@ -257,7 +265,8 @@ async def create_new_workflow(workflow: WorkflowCreate):
 
 @router.post("/workflows/{workflow_name}/executed")
 @handle_api_errors("record workflow execution")
-async def record_workflow_execution(workflow_name: str, success: bool = True):
+@invalidates("brain")
+def record_workflow_execution(workflow_name: str, success: bool = True):
     """Record that a workflow was executed."""
     update_workflow_execution(workflow_name, success)
     return {"status": "recorded", "workflow_name": workflow_name, "success": success}
@@ -269,7 +278,7 @@ async def record_workflow_execution(workflow_name: str, success: bool = True):
 
 @router.get("/context/{session_id}")
 @handle_api_errors("get context")
-async def get_session_context(session_id: str, context_type: Optional[str] = None):
+def get_session_context(session_id: str, context_type: Optional[str] = None):
     """Get context windows for a session."""
     contexts = get_context_window(session_id, context_type)
     return {"count": len(contexts), "contexts": contexts}
@@ -277,7 +286,7 @@ async def get_session_context(session_id: str, context_type: Optional[str] = Non
 
 @router.post("/context")
 @handle_api_errors("create context")
-async def create_context_window(context: ContextWindowCreate):
+def create_context_window(context: ContextWindowCreate):
     """Create a new context window."""
     context_id = set_context_window(
         context.session_id,
@@ -291,7 +300,7 @@ async def create_context_window(context: ContextWindowCreate):
 
 @router.delete("/context/{session_id}")
 @handle_api_errors("clear context")
-async def clear_session_context(session_id: str):
+def clear_session_context(session_id: str):
     """Clear all context windows for a session."""
     count = clear_context_windows(session_id)
     return {"status": "cleared", "count": count}
@@ -299,7 +308,7 @@ async def clear_session_context(session_id: str):
 
 @router.get("/actions/pending")
 @handle_api_errors("get pending actions")
-async def list_pending_actions(
+def list_pending_actions(
     status: str = "pending",
     priority: Optional[str] = None
 ):
@@ -310,7 +319,8 @@ async def list_pending_actions(
 
 @router.post("/actions")
 @handle_api_errors("create action")
-async def create_action(action: PendingActionCreate):
+@invalidates("brain")
+def create_action(action: PendingActionCreate):
     """Create a new pending action."""
     action_id = create_pending_action(
         action.action_type,
@@ -326,7 +336,8 @@ async def create_action(action: PendingActionCreate):
 
 @router.post("/actions/{action_id}/approve")
 @handle_api_errors("approve action")
-async def approve_action(action_id: str, approval: ActionApproval):
+@invalidates("brain")
+def approve_action(action_id: str, approval: ActionApproval):
     """Approve a pending action."""
     success = approve_pending_action(action_id, approval.approved_by, approval.reason)
     if not success:
@@ -336,7 +347,8 @@ async def approve_action(action_id: str, approval: ActionApproval):
 
 @router.post("/actions/{action_id}/reject")
 @handle_api_errors("reject action")
-async def reject_action(action_id: str, approval: ActionApproval):
+@invalidates("brain")
+def reject_action(action_id: str, approval: ActionApproval):
     """Reject a pending action."""
     success = reject_pending_action(action_id, approval.approved_by, approval.reason)
     if not success:
@@ -346,7 +358,8 @@ async def reject_action(action_id: str, approval: ActionApproval):
 
 @router.post("/actions/{action_id}/execute")
 @handle_api_errors("execute action")
-async def execute_action(action_id: str, result: Optional[dict] = None):
+@invalidates("brain")
+def execute_action(action_id: str, result: Optional[dict] = None):
     """Mark an action as executed."""
     success = execute_pending_action(action_id, result)
     if not success:
@@ -356,7 +369,7 @@ async def execute_action(action_id: str, result: Optional[dict] = None):
 
 @router.get("/session/{session_type}")
 @handle_api_errors("get session state")
-async def get_session(session_type: str, session_date: Optional[date] = None):
+def get_session(session_type: str, session_date: Optional[date] = None):
     """Get session state."""
     state = get_session_state(session_type, session_date)
     if not state:
@@ -366,7 +379,7 @@ async def get_session(session_type: str, session_date: Optional[date] = None):
 
 @router.post("/session")
 @handle_api_errors("update session state")
-async def update_session(state: SessionStateUpdate):
+def update_session(state: SessionStateUpdate):
     """Create or update session state."""
     session_id = set_session_state(
         state.session_type,
@@ -385,7 +398,7 @@ async def update_session(state: SessionStateUpdate):
 
 @router.get("/evolution/proposals")
 @handle_api_errors("get evolution proposals")
-async def list_evolution_proposals(status: str = "proposed"):
+def list_evolution_proposals(status: str = "proposed"):
     """Get evolution proposals."""
     proposals = get_evolution_proposals(status)
     return {"count": len(proposals), "proposals": proposals}
@@ -393,7 +406,8 @@ async def list_evolution_proposals(status: str = "proposed"):
 
 @router.post("/evolution")
 @handle_api_errors("create evolution proposal")
-async def create_evolution_proposal(evolution: EvolutionLog):
+@invalidates("brain")
+def create_evolution_proposal(evolution: EvolutionLog):
     """Log a new evolution proposal."""
     evolution_id = log_evolution(
         evolution.evolution_type,
@@ -409,7 +423,8 @@ async def create_evolution_proposal(evolution: EvolutionLog):
 
 @router.post("/evolution/{evolution_id}/approve")
 @handle_api_errors("approve evolution")
-async def approve_evolution_proposal(evolution_id: str, approved_by: str):
+@invalidates("brain")
+def approve_evolution_proposal(evolution_id: str, approved_by: str):
     """Approve an evolution proposal."""
     success = approve_evolution(evolution_id, approved_by)
     if not success:
@@ -419,7 +434,8 @@ async def approve_evolution_proposal(evolution_id: str, approved_by: str):
 
 @router.post("/evolution/{evolution_id}/apply")
 @handle_api_errors("apply evolution")
-async def apply_evolution_proposal(evolution_id: str):
+@invalidates("brain")
+def apply_evolution_proposal(evolution_id: str):
     """Apply an approved evolution."""
     success = apply_evolution(evolution_id)
     if not success:
@@ -430,7 +446,7 @@ async def apply_evolution_proposal(evolution_id: str):
 
 @router.get("/metrics")
 @handle_api_errors("get metrics")
-async def list_metrics(
+def list_metrics(
     metric_type: Optional[str] = None,
     since: Optional[datetime] = None
 ):
@@ -441,7 +457,7 @@ async def list_metrics(
 
 @router.post("/metrics")
 @handle_api_errors("record metric")
-async def create_metric(metric: MetricRecord):
+def create_metric(metric: MetricRecord):
     """Record a performance metric."""
     metric_id = record_metric(
         metric.metric_type,
@@ -456,7 +472,7 @@ async def create_metric(metric: MetricRecord):
 
 @router.get("/feedback")
 @handle_api_errors("get feedback")
-async def list_unprocessed_feedback():
+def list_unprocessed_feedback():
     """Get unprocessed feedback."""
     feedback = get_unprocessed_feedback()
     return {"count": len(feedback), "feedback": feedback}
@@ -464,7 +480,7 @@ async def list_unprocessed_feedback():
 
 @router.post("/feedback")
 @handle_api_errors("record feedback")
-async def create_feedback(feedback: FeedbackRecord):
+def create_feedback(feedback: FeedbackRecord):
     """Record user feedback."""
     feedback_id = record_feedback(
         feedback.feedback_type,
@@ -478,7 +494,7 @@ async def create_feedback(feedback: FeedbackRecord):
 
 @router.post("/feedback/{feedback_id}/processed")
 @handle_api_errors("mark feedback processed")
-async def mark_feedback_as_processed(feedback_id: str, evolution_id: Optional[str] = None):
+def mark_feedback_as_processed(feedback_id: str, evolution_id: Optional[str] = None):
     """Mark feedback as processed."""
     success = mark_feedback_processed(feedback_id, evolution_id)
     if not success:
@@ -492,7 +508,7 @@ async def mark_feedback_as_processed(feedback_id: str, evolution_id: Optional[st
 
 @router.get("/analytics")
 @handle_api_errors("get learning analytics")
-async def get_analytics():
+def get_analytics():
     """
     Get comprehensive learning analytics.
     
@@ -508,7 +524,7 @@ async def get_analytics():
 
 @router.get("/analytics/insights")
 @handle_api_errors("get learning insights")
-async def get_insights():
+def get_insights():
     """
     Get human-readable insights from learning analytics.
     
@@ -524,7 +540,8 @@ async def get_insights():
 
 @router.post("/rules/cleanup")
 @handle_api_errors("cleanup expired rules")
-async def cleanup_rules():
+@invalidates("brain")
+def cleanup_rules():
     """
     Clean up expired rules from the database.
     Marks expired boundaries and canonical memory as inactive.
@@ -532,7 +549,6 @@ async def cleanup_rules():
     
     Returns counts of cleaned up rules by table.
     """
-    from utils.context_loader import cleanup_expired_rules
     counts = cleanup_expired_rules()
     total = sum(counts.values())
     return {
@@ -544,7 +560,8 @@ async def cleanup_rules():
 
 @router.post("/boundaries/{boundary_id}/expire")
 @handle_api_errors("set boundary expiration")
-async def set_boundary_expiration(boundary_id: str, expires_at: datetime):
+@invalidates("brain")
+def set_boundary_expiration(boundary_id: str, expires_at: datetime):
     """
     Set an expiration date for a boundary.
     
@@ -552,7 +569,6 @@ async def set_boundary_expiration(boundary_id: str, expires_at: datetime):
         boundary_id: UUID of the boundary
         expires_at: When the boundary should expire
     """
-    from db.neon import db_cursor
     with db_cursor() as cur:
         cur.execute("""
             UPDATE boundaries SET expires_at = %s, updated_at = NOW()
@@ -565,7 +581,7 @@ async def set_boundary_expiration(boundary_id: str, expires_at: datetime):
 
 @router.post("/preferences/{preference_key}/expire")
 @handle_api_errors("set preference expiration")
-async def set_preference_expiration(preference_key: str, expires_at: datetime):
+def set_preference_expiration(preference_key: str, expires_at: datetime):
     """
     Set an expiration date for a preference.
     
@@ -573,7 +589,6 @@ async def set_preference_expiration(preference_key: str, expires_at: datetime):
         preference_key: Key of the preference
         expires_at: When the preference should expire
     """
-    from db.neon import db_cursor
     with db_cursor() as cur:
         cur.execute("""
             UPDATE preferences SET expires_at = %s, updated_at = NOW()
@@ -590,7 +605,7 @@ async def set_preference_expiration(preference_key: str, expires_at: datetime):
 
 @router.get("/status")
 @handle_api_errors("get brain status")
-async def get_status():
+def get_status():
     """Get brain status."""
     status = get_brain_status()
     if not status:
@@ -600,7 +615,8 @@ async def get_status():
 
 @router.put("/status")
 @handle_api_errors("update brain status")
-async def update_status(update: BrainStatusUpdate):
+@invalidates("brain")
+def update_status(update: BrainStatusUpdate):
     """Update brain status."""
     success = update_brain_status(update.status, update.config)
     if not success:
@@ -614,7 +630,7 @@ async def update_status(update: BrainStatusUpdate):
 
 @router.get("/full-context")
 @handle_api_errors("get full brain context")
-async def get_full_context():
+def get_full_context():
     """
     Get the complete brain context.
     This is the primary endpoint for loading Athena's brain into a Manus session.
@@ -625,7 +641,7 @@ async def get_full_context():
 
 @router.get("/session-brief/{session_type}")
 @handle_api_errors("get session brief")
-async def get_brief_for_session(session_type: str):
+def get_brief_for_session(session_type: str):
     """
     Get a brief for starting a specific session type.
     This provides the essential context needed to start a session.
@@ -647,7 +663,7 @@ class MemoryApprovalRequest(BaseModel):
 
 @router.post("/memory/approve")
 @handle_api_errors("approve memory proposal")
-async def approve_memory_proposal_endpoint(request: MemoryApprovalRequest):
+def approve_memory_proposal_endpoint(request: MemoryApprovalRequest):
     """
     Approve a memory proposal from synthesis.
     Moves it from proposals to canonical_memory.
@@ -655,8 +671,6 @@ async def approve_memory_proposal_endpoint(request: MemoryApprovalRequest):
     This endpoint is part of the evolution system, allowing memory proposals
     generated during synthesis to be approved and added to canonical memory.
     """
-    from db.neon import db_cursor
-    
     logger.info(f"Approving memory proposal: {request.memory_id}")
     
     try:
@@ -726,7 +740,7 @@ async def approve_memory_proposal_endpoint(request: MemoryApprovalRequest):
 
 @router.get("/observations")
 @handle_api_errors("get observations")
-async def get_observations(limit: int = 50, hours: int = None):
+def get_observations(limit: int = 50, hours: int = None):
     """
     Get recent observations from the brain.
     
@@ -734,8 +748,6 @@ async def get_observations(limit: int = 50, hours: int = None):
         limit: Maximum number of observations to return (default 50)
         hours: If specified, only return observations from the last N hours
     """
-    from db.brain.composite import get_recent_observations
-    
     observations = get_recent_observations(limit=limit, hours=hours)
     return {
         "count": len(observations),
@@ -747,15 +759,13 @@ async def get_observations(limit: int = 50, hours: int = None):
 
 @router.get("/patterns")
 @handle_api_errors("get patterns")
-async def get_patterns(limit: int = 20):
+def get_patterns(limit: int = 20):
     """
     Get detected patterns from the brain.
     
     Args:
         limit: Maximum number of patterns to return (default 20)
     """
-    from db.brain.composite import get_recent_patterns
-    
     patterns = get_recent_patterns(limit=limit)
     return {
         "count": len(patterns),
@@ -766,15 +776,13 @@ async def get_patterns(limit: int = 20):
 
 @router.get("/synthesis")
 @handle_api_errors("get synthesis")
-async def get_synthesis(limit: int = 10):
+def get_synthesis(limit: int = 10):
     """
     Get synthesis/conclusions from the brain.
     
     Args:
         limit: Maximum number of synthesis records to return (default 10)
     """
-    from db.brain.composite import get_recent_synthesis
-    
     synthesis = get_recent_synthesis(limit=limit)
     return {
         "count": len(synthesis),
@@ -0,0 +1,438 @@
+"""
+Athena Server v2 - Response Caching
+
+Cache-aside for read-only GET endpoints: a per-process TTL cache (L1) in front
+of an optional shared Redis cache (L2). Redis is used only when REDIS_URL is
+set and the redis package is installed; otherwise only L1 is used.
+
+Cached endpoints are tagged with the data they read (observations, patterns,
+...). Mutations call invalidate(tag) so the next read recomputes instead of
+serving stale data until the TTL runs out.
+
+Endpoints that take a `fmt: ResponseFormat` parameter also answer in msgpack
+when the client sends `Accept: application/x-msgpack`; each format is cached
+under its own key.
+"""
+
+import asyncio
+import logging
+from concurrent.futures import Future
+from functools import wraps
+from typing import Annotated, Callable, Any, Dict, Iterable, Literal, Optional, Set, Tuple
+
+import anyio.from_thread
+import msgspec
+import orjson
+from cachetools import TTLCache
+from fastapi import Depends, Header, Response
+from fastapi.encoders import ENCODERS_BY_TYPE, jsonable_encoder
+from pydantic import BaseModel
+
+from api.middleware.http_cache import compute_etag
+from config import settings
+
+logger = logging.getLogger("athena.api.cache")
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+KEY_NAMESPACE = "athena:cache"
+L1_MAXSIZE = 512
+L1_MAX_TTL = 30  # seconds; keeps workers from serving stale L1 entries for long
+LOCK_TTL = 5  # seconds a recompute lock is held in Redis
+TAG_TTL = 3600  # seconds; outlives any cached key, stale members are harmless
+LOCK_WAIT_STEPS = 10
+LOCK_WAIT_INTERVAL = 0.1  # seconds
+MSGPACK_MEDIA_TYPE = "application/x-msgpack"
+MEDIA_TYPES = {"json": "application/json", "msgpack": MSGPACK_MEDIA_TYPE}
+
+# One L1 cache per decorated endpoint, keyed by prefix
+_local_caches: Dict[str, TTLCache] = {}
+# Tag -> prefixes of the endpoints that depend on it
+_tag_prefixes: Dict[str, Set[str]] = {}
+# Pending post-job invalidations (kept referenced until they finish)
+_pending_invalidations: Set[asyncio.Task] = set()
+
+class _KeyLock:
+    """Single-flight lock for one cache key, with a count of its users."""
+
+    __slots__ = ("lock", "users")
+
+    def __init__(self):
+        self.lock = asyncio.Lock()
+        self.users = 0  # requests holding or waiting for the lock
+
+
+# In-process single-flight locks, keyed by cache key; dropped when unused
+_key_locks: Dict[str, _KeyLock] = {}
+_redis = None
+
+
+def get_redis():
+    """Get the shared Redis client, or None if Redis is not configured."""
+    global _redis
+    if _redis is None and aioredis is not None and settings.REDIS_URL:
+        _redis = aioredis.from_url(settings.REDIS_URL)
+    return _redis
+
+
+async def close_cache():
+    """Close the shared Redis client."""
+    global _redis
+    if _redis is not None:
+        await _redis.aclose()
+        _redis = None
+
+
+def local_cache(key_prefix: str, ttl: int, tags: Iterable[str] = (), maxsize: int = L1_MAXSIZE) -> TTLCache:
+    """
+    Get a per-process TTL cache that invalidate(tag) clears.
+
+    Backs @cached's L1, and can hold values other than whole responses (e.g.
+    a generated prompt). The TTL is capped at L1_MAX_TTL, since invalidation
+    only reaches this worker. Only touch the cache from the event loop.
+
+    Args:
+        key_prefix: Cache namespace; the same prefix returns the same cache
+        ttl: Seconds an entry stays valid
+        tags: Data the cached values are built from
+        maxsize: Maximum number of entries
+    """
+    local = _local_caches.setdefault(
+        key_prefix, TTLCache(maxsize=maxsize, ttl=min(ttl, L1_MAX_TTL))
+    )
+    for tag in tags:
+        _tag_prefixes.setdefault(tag, set()).add(key_prefix)
+    return local
+
+
+def _cache_key(prefix: str, params: Dict[str, Any]) -> str:
+    """Build a deterministic cache key from the endpoint prefix and query params."""
+    query = "&".join(f"{k}={v}" for k, v in sorted(params.items()))
+    return f"{KEY_NAMESPACE}:{prefix}:{query}"
+
+
+def orjson_default(obj: Any) -> Any:
+    """
+    orjson fallback for types it can't encode natively (Decimal, timedelta,
+    models, ...), producing the same values jsonable_encoder would.
+    """
+    encoder = ENCODERS_BY_TYPE.get(type(obj))
+    if encoder is not None:
+        return encoder(obj)
+    return jsonable_encoder(obj)
+
+
+# Datetimes, UUIDs and Decimals are native to msgspec; anything else goes
+# through the same fallback as JSON
+msgpack_encoder = msgspec.msgpack.Encoder(enc_hook=orjson_default, decimal_format="number")
+
+
+async def response_format(accept: Optional[str] = Header(None)) -> str:
+    """Negotiate the body format from the Accept header: "msgpack" or "json"."""
+    if accept and MSGPACK_MEDIA_TYPE in accept:
+        return "msgpack"
+    return "json"
+
+
+ResponseFormat = Annotated[Literal["json", "msgpack"], Depends(response_format)]
+
+
+def _serialize(result: Any, fmt: str = "json") -> bytes:
+    """Serialize a handler result to the JSON the app's ORJSONResponse would send, or msgpack."""
+    if fmt == "msgpack":
+        if isinstance(result, BaseModel):
+            result = result.model_dump()
+        return msgpack_encoder.encode(result)
+    if isinstance(result, BaseModel):
+        # Typed response models serialize straight to JSON in pydantic-core
+        return result.__pydantic_serializer__.to_json(result)
+    # orjson walks rows in C; only unknown types call back into Python
+    return orjson.dumps(result, default=orjson_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def serialized_response(content: Any, fmt: str = "json", status_code: int = 200) -> Response:
+    """
+    Return a handler result as a pre-serialized JSON (or msgpack) body.
+
+    FastAPI runs plain dict results through jsonable_encoder before the
+    response class encodes them; returning a Response skips that walk, so hot
+    uncached endpoints get the same one-pass encoding as cached ones.
+    """
+    return Response(
+        content=_serialize(content, fmt),
+        status_code=status_code,
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Vary": "Accept"},
+    )
+
+
+def _cached_response(entry: Tuple[bytes, str], status: str, fmt: Optional[str]) -> Response:
+    payload, etag = entry
+    headers = {"X-Cache": status, "ETag": etag}
+    if fmt is not None:
+        headers["Vary"] = "Accept"
+    return Response(
+        content=payload,
+        media_type=MEDIA_TYPES[fmt or "json"],
+        headers=headers,
+    )
+
+
+def _entry(payload: bytes) -> Tuple[bytes, str]:
+    """Pair a payload with its ETag, hashed once when the entry is stored."""
+    return payload, compute_etag(payload).decode("ascii")
+
+
+async def _redis_get(key: str) -> Optional[bytes]:
+    client = get_redis()
+    if client is None:
+        return None
+    try:
+        return await client.get(key)
+    except Exception as e:
+        logger.warning(f"Redis get failed for {key}: {e}")
+        return None
+
+
+async def _redis_set(key: str, payload: bytes, ttl: int):
+    client = get_redis()
+    if client is None:
+        return
+    try:
+        await client.setex(key, ttl, payload)
+    except Exception as e:
+        logger.warning(f"Redis set failed for {key}: {e}")
+
+
+def _tag_key(tag: str) -> str:
+    return f"{KEY_NAMESPACE}:tag:{tag}"
+
+
+async def _redis_tag(key: str, tags: Iterable[str]):
+    """Record a key under each of its tags so invalidate() can find it."""
+    client = get_redis()
+    if client is None or not tags:
+        return
+    try:
+        async with client.pipeline(transaction=False) as pipe:
+            for tag in tags:
+                pipe.sadd(_tag_key(tag), key)
+                pipe.expire(_tag_key(tag), TAG_TTL)
+            await pipe.execute()
+    except Exception as e:
+        logger.warning(f"Redis tagging failed for {key}: {e}")
+
+
+async def invalidate(*tags: str):
+    """
+    Drop every cached response tagged with any of the given tags.
+
+    Clears this process's L1 caches for the dependent endpoints and deletes
+    the tagged keys from Redis. Other workers' L1 entries expire within
+    L1_MAX_TTL.
+
+    Args:
+        *tags: Data tags, e.g. "observations", "synthesis"
+    """
+    for tag in tags:
+        for prefix in _tag_prefixes.get(tag, ()):
+            _local_caches[prefix].clear()
+
+    client = get_redis()
+    if client is None:
+        return
+    try:
+        for tag in tags:
+            keys = await client.smembers(_tag_key(tag))
+            if keys:
+                await client.delete(*keys)
+            await client.delete(_tag_key(tag))
+    except Exception as e:
+        logger.warning(f"Redis invalidation failed for {tags}: {e}")
+    logger.debug(f"Invalidated cache tags: {tags}")
+
+
+def invalidate_after(future: Future, *tags: str):
+    """
+    Invalidate tags once an offloaded job finishes, without blocking the caller.
+
+    Args:
+        future: Future returned by jobs.offload.submit_job
+        *tags: Data tags the job writes to
+    """
+    async def _wait_and_invalidate():
+        try:
+            await asyncio.wrap_future(future)
+        except Exception:
+            pass  # Failure is logged by the job runner; partial writes still count
+        await invalidate(*tags)
+
+    task = asyncio.create_task(_wait_and_invalidate())
+    _pending_invalidations.add(task)
+    task.add_done_callback(_pending_invalidations.discard)
+
+
+def invalidates(*tags: str):
+    """
+    Decorator for mutation handlers: invalidate tags after a successful call.
+
+    Works on both `async def` and plain `def` handlers; a plain handler runs
+    in FastAPI's threadpool and hands the invalidation back to the event
+    loop. Nothing is invalidated if the handler raises.
+
+    Usage:
+        @router.put("/identity/{key}")
+        @handle_api_errors("update identity key")
+        @invalidates("brain")
+        def update_identity_key(key: str, update: IdentityUpdate):
+            ...
+
+    Args:
+        *tags: Data tags the handler writes to
+    """
+    def decorator(func: Callable) -> Callable:
+        if not asyncio.iscoroutinefunction(func):
+            @wraps(func)
+            def sync_wrapper(*args, **kwargs) -> Any:
+                result = func(*args, **kwargs)
+                try:
+                    anyio.from_thread.run(invalidate, *tags)
+                except RuntimeError:
+                    pass  # Called outside a worker thread (scripts): no event loop, no cache
+                return result
+            return sync_wrapper
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs) -> Any:
+            result = await func(*args, **kwargs)
+            await invalidate(*tags)
+            return result
+        return wrapper
+    return decorator
+
+
+async def _acquire_redis_lock(key: str) -> bool:
+    """
+    Try to take the cross-worker recompute lock for a key.
+
+    Returns True when this worker should compute the value (lock taken, or
+    Redis unavailable), False when another worker is already computing it.
+    """
+    client = get_redis()
+    if client is None:
+        return True
+    try:
+        return bool(await client.set(f"{key}:lock", b"1", nx=True, ex=LOCK_TTL))
+    except Exception as e:
+        logger.warning(f"Redis lock failed for {key}: {e}")
+        return True
+
+
+async def _release_redis_lock(key: str):
+    client = get_redis()
+    if client is None:
+        return
+    try:
+        await client.delete(f"{key}:lock")
+    except Exception as e:
+        logger.warning(f"Redis unlock failed for {key}: {e}")
+
+
+def cached(
+    ttl: int,
+    key_prefix: str,
+    tags: Iterable[str] = (),
+    vary: Optional[Callable[[], Any]] = None,
+):
+    """
+    Decorator for cache-aside on read-only GET handlers.
+
+    The handler's keyword arguments (its query params) form the cache key.
+    Hits are returned as pre-serialized JSON with an `X-Cache: HIT` header;
+    misses call the handler, store the JSON in both tiers and return it with
+    `X-Cache: MISS`. Exceptions are never cached. Every cached response
+    carries an ETag computed once per stored entry, which HttpCacheMiddleware
+    reuses instead of hashing the body again. A handler parameter
+    `fmt: ResponseFormat` selects msgpack or JSON and is part of the key.
+
+    Concurrent misses for the same key are collapsed: in-process with an
+    asyncio lock, and across workers with a short `SET NX EX` lock in Redis.
+
+    Usage:
+        @router.get("/brief")
+        @cached(ttl=60, key_prefix="brief", tags=("synthesis", "patterns"))
+        async def get_morning_brief():
+            ...
+
+    Args:
+        ttl: Seconds a cached response stays valid in Redis
+        key_prefix: Cache namespace for the endpoint
+        tags: Data the endpoint reads; invalidate(tag) drops its entries
+        vary: Optional callable whose result is added to the key, for
+            responses that depend on something other than the query params
+            (e.g. today's date)
+    """
+    tags = tuple(tags)
+    local = local_cache(key_prefix, ttl, tags)
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        async def wrapper(*args, **kwargs) -> Any:
+            params = kwargs if vary is None else {**kwargs, "_vary": vary()}
+            key = _cache_key(key_prefix, params)
+            fmt = kwargs.get("fmt")
+
+            entry = local.get(key)
+            if entry is not None:
+                return _cached_response(entry, "HIT", fmt)
+
+            key_lock = _key_locks.get(key)
+            if key_lock is None:
+                key_lock = _key_locks[key] = _KeyLock()
+            key_lock.users += 1
+            try:
+                async with key_lock.lock:
+                    # Another request may have filled L1 while we waited
+                    entry = local.get(key)
+                    if entry is not None:
+                        return _cached_response(entry, "HIT", fmt)
+
+                    payload = await _redis_get(key)
+                    if payload is not None:
+                        entry = local[key] = _entry(payload)
+                        return _cached_response(entry, "HIT", fmt)
+
+                    owns_lock = await _acquire_redis_lock(key)
+                    if not owns_lock:
+                        # Another worker is recomputing; wait briefly for its result
+                        for _ in range(LOCK_WAIT_STEPS):
+                            await asyncio.sleep(LOCK_WAIT_INTERVAL)
+                            payload = await _redis_get(key)
+                            if payload is not None:
+                                entry = local[key] = _entry(payload)
+                                return _cached_response(entry, "HIT", fmt)
+
+                    try:
+                        result = await func(*args, **kwargs)
+                        if isinstance(result, Response):
+                            return result
+                        payload = _serialize(result, fmt or "json")
+                        entry = local[key] = _entry(payload)
+                        await _redis_set(key, payload, ttl)
+                        await _redis_tag(key, tags)
+                    finally:
+                        if owns_lock:
+                            await _release_redis_lock(key)
+            finally:
+                # Only drop the lock once no other request is queued on it,
+                # or a newcomer would get a fresh lock and run alongside them
+                key_lock.users -= 1
+                if key_lock.users == 0:
+                    del _key_locks[key]
+
+            return _cached_response(entry, "MISS", fmt)
+        return wrapper
+    return decorator
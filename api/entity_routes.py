@@ -88,7 +88,7 @@ class NoteCreate(BaseModel):
 
 @router.post("", status_code=201)
 @handle_api_errors("create entity")
-async def create_entity_endpoint(entity: EntityCreate):
+def create_entity_endpoint(entity: EntityCreate):
     """Create a new entity."""
     entity_id = create_entity(
         entity_type=entity.entity_type,
@@ -105,7 +105,7 @@ async def create_entity_endpoint(entity: EntityCreate):
 
 @router.get("")
 @handle_api_errors("list entities")
-async def list_entities(
+def list_entities(
     query: Optional[str] = Query(None, description="Search query"),
     entity_type: Optional[str] = Query(None, description="Filter by type"),
     access_tier: Optional[str] = Query(None, description="Filter by access tier"),
@@ -123,7 +123,7 @@ async def list_entities(
 
 @router.get("/vip")
 @handle_api_errors("get VIP entities")
-async def list_vip_entities():
+def list_vip_entities():
     """Get all VIP entities."""
     entities = get_vip_entities()
     return {"entities": entities, "count": len(entities)}
@@ -131,7 +131,7 @@ async def list_vip_entities():
 
 @router.get("/by-name/{name}")
 @handle_api_errors("get entity by name")
-async def get_entity_by_name_endpoint(
+def get_entity_by_name_endpoint(
     name: str,
     entity_type: Optional[str] = Query(None)
 ):
@@ -144,7 +144,7 @@ async def get_entity_by_name_endpoint(
 
 @router.get("/type/{entity_type}")
 @handle_api_errors("list entities by type")
-async def list_entities_by_type(entity_type: str):
+def list_entities_by_type(entity_type: str):
     """Get all entities of a specific type."""
     entities = get_entities_by_type(entity_type)
     return {"entities": entities, "count": len(entities)}
@@ -152,7 +152,7 @@ async def list_entities_by_type(entity_type: str):
 
 @router.get("/{entity_id}")
 @handle_api_errors("get entity")
-async def get_entity_endpoint(entity_id: str):
+def get_entity_endpoint(entity_id: str):
     """Get an entity by ID."""
     entity = get_entity(entity_id)
     if not entity:
@@ -162,7 +162,7 @@ async def get_entity_endpoint(entity_id: str):
 
 @router.get("/{entity_id}/context")
 @handle_api_errors("get entity context")
-async def get_entity_context_endpoint(entity_id: str):
+def get_entity_context_endpoint(entity_id: str):
     """Get complete context for an entity including relationships and notes."""
     context = get_entity_context(entity_id)
     if not context:
@@ -172,7 +172,7 @@ async def get_entity_context_endpoint(entity_id: str):
 
 @router.put("/{entity_id}")
 @handle_api_errors("update entity")
-async def update_entity_endpoint(entity_id: str, entity: EntityUpdate):
+def update_entity_endpoint(entity_id: str, entity: EntityUpdate):
     """Update an entity."""
     success = update_entity(
         entity_id=entity_id,
@@ -190,7 +190,7 @@ async def update_entity_endpoint(entity_id: str, entity: EntityUpdate):
 
 @router.delete("/{entity_id}")
 @handle_api_errors("delete entity")
-async def delete_entity_endpoint(entity_id: str, hard_delete: bool = Query(False)):
+def delete_entity_endpoint(entity_id: str, hard_delete: bool = Query(False)):
     """Delete an entity (soft delete by default)."""
     success = delete_entity(entity_id, soft_delete=not hard_delete)
     if not success:
@@ -204,7 +204,7 @@ async def delete_entity_endpoint(entity_id: str, hard_delete: bool = Query(False
 
 @router.post("/relationships", status_code=201)
 @handle_api_errors("create relationship")
-async def create_relationship_endpoint(relationship: RelationshipCreate):
+def create_relationship_endpoint(relationship: RelationshipCreate):
     """Create a relationship between two entities."""
     rel_id = create_relationship(
         source_entity_id=relationship.source_entity_id,
@@ -222,7 +222,7 @@ async def create_relationship_endpoint(relationship: RelationshipCreate):
 
 @router.get("/{entity_id}/relationships")
 @handle_api_errors("get relationships")
-async def get_relationships_endpoint(
+def get_relationships_endpoint(
     entity_id: str,
     direction: str = Query("both", description="'outgoing', 'incoming', or 'both'")
 ):
@@ -237,7 +237,7 @@ async def get_relationships_endpoint(
 
 @router.post("/{entity_id}/notes", status_code=201)
 @handle_api_errors("add note")
-async def add_note_endpoint(entity_id: str, note: NoteCreate):
+def add_note_endpoint(entity_id: str, note: NoteCreate):
     """Add a note to an entity."""
     note_id = add_entity_note(
         entity_id=entity_id,
@@ -252,7 +252,7 @@ async def add_note_endpoint(entity_id: str, note: NoteCreate):
 
 @router.get("/{entity_id}/notes")
 @handle_api_errors("get notes")
-async def get_notes_endpoint(
+def get_notes_endpoint(
     entity_id: str,
     note_type: Optional[str] = Query(None),
     include_expired: bool = Query(False)
@@ -4,6 +4,7 @@ Athena Server v2 - Error Handling Utilities
 Standardized error handling for API routes.
 """
 
+import asyncio
 import logging
 from functools import wraps
 from typing import Callable, Any
@@ -28,10 +29,27 @@ class OperationError(Exception):
     pass
 
 
+def _to_http_exception(operation_name: str, error: Exception) -> HTTPException:
+    """Map an exception raised by a route handler to the HTTPException to raise."""
+    if isinstance(error, HTTPException):
+        # Re-raise FastAPI HTTP exceptions as-is
+        return error
+    if isinstance(error, NotFoundError):
+        return HTTPException(status_code=404, detail=str(error))
+    if isinstance(error, (ValidationError, OperationError)):
+        return HTTPException(status_code=400, detail=str(error))
+    logger.error(f"Failed to {operation_name}: {error}")
+    return HTTPException(status_code=500, detail=str(error))
+
+
 def handle_api_errors(operation_name: str):
     """
     Decorator for standardized API error handling.
 
+    Works on both `async def` and plain `def` handlers. Handlers that only
+    make synchronous DB calls should be plain `def`: FastAPI runs those in
+    its threadpool instead of blocking the event loop.
+
     Catches exceptions and converts them to appropriate HTTP responses:
     - HTTPException: re-raised as-is
     - NotFoundError: 404 response
@@ -42,7 +60,7 @@ def handle_api_errors(operation_name: str):
     Usage:
         @router.get("/items/{item_id}")
         @handle_api_errors("get item")
-        async def get_item(item_id: str):
+        def get_item(item_id: str):
             item = get_item_from_db(item_id)
             if not item:
                 raise NotFoundError("Item not found")
@@ -52,22 +70,21 @@ def handle_api_errors(operation_name: str):
         operation_name: Human-readable name for the operation (used in error logs)
     """
     def decorator(func: Callable) -> Callable:
+        if not asyncio.iscoroutinefunction(func):
+            @wraps(func)
+            def sync_wrapper(*args, **kwargs) -> Any:
+                try:
+                    return func(*args, **kwargs)
+                except Exception as e:
+                    raise _to_http_exception(operation_name, e)
+            return sync_wrapper
+
         @wraps(func)
         async def wrapper(*args, **kwargs) -> Any:
             try:
                 return await func(*args, **kwargs)
-            except HTTPException:
-                # Re-raise FastAPI HTTP exceptions as-is
-                raise
-            except NotFoundError as e:
-                raise HTTPException(status_code=404, detail=str(e))
-            except ValidationError as e:
-                raise HTTPException(status_code=400, detail=str(e))
-            except OperationError as e:
-                raise HTTPException(status_code=400, detail=str(e))
             except Exception as e:
-                logger.error(f"Failed to {operation_name}: {e}")
-                raise HTTPException(status_code=500, detail=str(e))
+                raise _to_http_exception(operation_name, e)
         return wrapper
     return decorator
 
@@ -14,8 +14,10 @@ import json
 from fastapi import APIRouter, HTTPException, Depends, Query
 from pydantic import BaseModel, Field
 
+from api.cache import invalidates
 from api.errors import handle_api_errors, NotFoundError, ValidationError, OperationError
 from db.neon import db_cursor
+from jobs.evolution_engine import run_evolution_engine
 from db.brain import (
     get_evolution_proposals,
     get_core_identity,
@@ -226,7 +228,7 @@ def mark_proposal_applied(proposal_id: str, result: dict) -> bool:
 
 @router.get("/proposals")
 @handle_api_errors("list proposals")
-async def list_proposals(
+def list_proposals(
     status: Optional[str] = Query(None, description="Filter by status: proposed, approved, rejected, applied"),
     category: Optional[str] = Query(None, description="Filter by category"),
     limit: int = Query(50, ge=1, le=200)
@@ -255,7 +257,7 @@ async def list_proposals(
 
 @router.get("/proposals/pending")
 @handle_api_errors("list pending proposals")
-async def list_pending_proposals():
+def list_pending_proposals():
     """List all pending proposals awaiting approval."""
     with db_cursor() as cursor:
         cursor.execute("""
@@ -270,7 +272,7 @@ async def list_pending_proposals():
 
 @router.get("/proposals/{proposal_id}")
 @handle_api_errors("get proposal")
-async def get_proposal(proposal_id: str):
+def get_proposal(proposal_id: str):
     """Get a specific evolution proposal."""
     proposal = get_proposal_by_id(proposal_id)
     if not proposal:
@@ -280,7 +282,8 @@ async def get_proposal(proposal_id: str):
 
 @router.post("/proposals/{proposal_id}/review")
 @handle_api_errors("review proposal")
-async def review_proposal(proposal_id: str, approval: ApprovalRequest):
+@invalidates("brain")
+def review_proposal(proposal_id: str, approval: ApprovalRequest):
     """
     Review (approve or reject) an evolution proposal.
 
@@ -316,7 +319,8 @@ async def review_proposal(proposal_id: str, approval: ApprovalRequest):
 
 @router.post("/proposals/{proposal_id}/apply")
 @handle_api_errors("apply proposal")
-async def apply_proposal(proposal_id: str):
+@invalidates("brain")
+def apply_proposal(proposal_id: str):
     """
     Apply an approved evolution proposal.
 
@@ -346,7 +350,8 @@ async def apply_proposal(proposal_id: str):
 
 @router.post("/proposals")
 @handle_api_errors("create proposal")
-async def create_manual_proposal(proposal: ManualProposal):
+@invalidates("brain")
+def create_manual_proposal(proposal: ManualProposal):
     """
     Create a manual evolution proposal.
 
@@ -376,6 +381,7 @@ async def create_manual_proposal(proposal: ManualProposal):
 
 @router.post("/run")
 @handle_api_errors("run evolution engine")
+@invalidates("brain")
 async def trigger_evolution_engine():
     """
     Manually trigger the evolution engine.
@@ -383,14 +389,13 @@ async def trigger_evolution_engine():
     This runs the same analysis as the weekly scheduled job but can be
     triggered on demand.
     """
-    from jobs.evolution_engine import run_evolution_engine
     result = await run_evolution_engine()
     return result
 
 
 @router.get("/stats")
 @handle_api_errors("get evolution stats")
-async def get_evolution_stats():
+def get_evolution_stats():
     """Get statistics about evolution proposals."""
     with db_cursor() as cursor:
         cursor.execute("""
@@ -0,0 +1,237 @@
+"""
+Athena Server v2 - Trigger Idempotency
+
+Deduplicates repeated POSTs to expensive endpoints (job triggers). The first
+call in a window claims the key with `SET NX EX` and gets a run id; repeats
+within the window return that run id instead of starting another run.
+
+Uses the shared Redis client from api.cache when configured, so the window
+holds across workers; otherwise falls back to a per-process map.
+
+A claim only outlives the handler call when the handler offloads its work
+and calls hold_until_done(future); the claim then lasts while the job runs and
+for the window after. Handlers that do their work inline (sync/debug triggers)
+or return early without starting anything drop their claim when they return.
+"""
+
+import time
+import uuid
+import asyncio
+import logging
+from concurrent.futures import Future
+from contextvars import ContextVar
+from functools import wraps
+from typing import Callable, Any, Dict, Optional, Set, Tuple
+
+from api.cache import get_redis
+
+logger = logging.getLogger("athena.api.idempotency")
+
+KEY_NAMESPACE = "athena:idem"
+
+# In-process fallback: key -> (expires_at, run_id)
+_local_claims: Dict[str, Tuple[float, str]] = {}
+# Claim held by the handler currently running under @idempotent: (claim_key, run_id, ttl)
+_current_claim: ContextVar[Optional[Tuple[str, str, int]]] = ContextVar("idempotency_claim", default=None)
+# Claim keep-alive tasks (kept referenced until their job finishes)
+_keepalive_tasks: Set[asyncio.Task] = set()
+# Run ids whose handler called hold_until_done, i.e. left a job running
+_held_runs: Set[str] = set()
+
+
+def _claim_key(key: str, params: Dict[str, Any]) -> str:
+    """Build the claim key; distinct arguments (e.g. force=True) claim separately."""
+    if not params:
+        return f"{KEY_NAMESPACE}:{key}"
+    query = "&".join(f"{k}={v}" for k, v in sorted(params.items()))
+    return f"{KEY_NAMESPACE}:{key}:{query}"
+
+
+def _claim_local(claim_key: str, run_id: str, ttl: int) -> Optional[str]:
+    now = time.monotonic()
+    existing = _local_claims.get(claim_key)
+    if existing and existing[0] > now:
+        return existing[1]
+    _local_claims[claim_key] = (now + ttl, run_id)
+    return None
+
+
+async def claim(key: str, ttl: int, params: Optional[Dict[str, Any]] = None) -> Tuple[bool, str]:
+    """
+    Try to claim an idempotency key for a new run.
+
+    Args:
+        key: Operation name, e.g. "trigger:synthesis"
+        ttl: Seconds the claim blocks duplicates
+        params: Arguments that distinguish runs of the same operation
+
+    Returns:
+        (claimed, run_id) - run_id is the new run's id when claimed, else the
+        id of the run that already holds the key
+    """
+    claim_key = _claim_key(key, params or {})
+    run_id = uuid.uuid4().hex
+
+    client = get_redis()
+    if client is not None:
+        try:
+            if await client.set(claim_key, run_id, nx=True, ex=ttl):
+                return True, run_id
+            existing = await client.get(claim_key)
+            if existing is not None:
+                return False, existing.decode() if isinstance(existing, bytes) else existing
+            # Expired between SET and GET - take it
+            await client.set(claim_key, run_id, ex=ttl)
+            return True, run_id
+        except Exception as e:
+            logger.warning(f"Redis idempotency claim failed for {claim_key}: {e}")
+
+    existing_run = _claim_local(claim_key, run_id, ttl)
+    if existing_run is not None:
+        return False, existing_run
+    return True, run_id
+
+
+async def release(key: str, params: Optional[Dict[str, Any]] = None):
+    """Release a claim early, e.g. when the run failed to start."""
+    claim_key = _claim_key(key, params or {})
+    _local_claims.pop(claim_key, None)
+    client = get_redis()
+    if client is not None:
+        try:
+            await client.delete(claim_key)
+        except Exception as e:
+            logger.warning(f"Redis idempotency release failed for {claim_key}: {e}")
+
+
+# Compare-and-delete / compare-and-expire, atomic in Redis so a claim that
+# expired and was taken by a new run is never dropped or extended by the old one
+_RELEASE_IF_OWNER = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+_REFRESH_IF_OWNER = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+
+def _owns_local(claim_key: str, run_id: str) -> bool:
+    """Whether run_id holds an unexpired local claim on claim_key."""
+    existing = _local_claims.get(claim_key)
+    return existing is not None and existing[1] == run_id and existing[0] > time.monotonic()
+
+
+async def _release_run(claim_key: str, run_id: str):
+    """Drop a claim, but only if this run still holds it."""
+    if _owns_local(claim_key, run_id):
+        del _local_claims[claim_key]
+    client = get_redis()
+    if client is not None:
+        try:
+            await client.eval(_RELEASE_IF_OWNER, 1, claim_key, run_id)
+        except Exception as e:
+            logger.warning(f"Redis idempotency release failed for {claim_key}: {e}")
+
+
+async def _refresh(claim_key: str, run_id: str, ttl: int):
+    """
+    Push a claim's expiry out by ttl if this run still holds it.
+
+    Never recreates a claim that expired, was released or was taken over.
+    """
+    if _owns_local(claim_key, run_id):
+        _local_claims[claim_key] = (time.monotonic() + ttl, run_id)
+    client = get_redis()
+    if client is not None:
+        try:
+            await client.eval(_REFRESH_IF_OWNER, 1, claim_key, run_id, int(ttl * 1000))
+        except Exception as e:
+            logger.warning(f"Redis idempotency refresh failed for {claim_key}: {e}")
+
+
+def hold_until_done(future: Future):
+    """
+    Keep the current @idempotent claim alive until an offloaded job finishes.
+
+    Without this, a job that runs longer than the decorator's ttl could be
+    started a second time by a repeat trigger. Once the job is done the claim
+    simply expires after its normal window. No-op outside an @idempotent handler.
+
+    Args:
+        future: Future returned by jobs.offload.submit_job
+    """
+    claim = _current_claim.get()
+    if claim is None:
+        return
+    claim_key, run_id, ttl = claim
+    _held_runs.add(run_id)
+
+    async def _keep_alive():
+        waiter = asyncio.wrap_future(future)
+        while True:
+            try:
+                await asyncio.wait_for(asyncio.shield(waiter), timeout=ttl / 2)
+                return
+            except asyncio.TimeoutError:
+                await _refresh(claim_key, run_id, ttl)
+            except Exception:
+                return  # Job failed; let the claim expire
+
+    task = asyncio.create_task(_keep_alive())
+    _keepalive_tasks.add(task)
+    task.add_done_callback(_keepalive_tasks.discard)
+
+
+def idempotent(key: str, ttl: int = 60):
+    """
+    Decorator that drops duplicate calls to a POST handler within a window.
+
+    The handler's keyword arguments are part of the key. A dict response from
+    the first call gets a "run_id"; duplicates return
+    {"message": "already running", "status": "duplicate", "run_id": ...}
+    without calling the handler.
+
+    The claim is kept after the handler returns only if it called
+    hold_until_done() for an offloaded job. Otherwise - the handler raised,
+    ran its work inline, or returned a failure or no-op result - the claim is
+    released as soon as the call finishes, so the caller can retry at once.
+
+    Usage:
+        @router.post("/trigger/synthesis")
+        @idempotent("trigger:synthesis", ttl=300)
+        async def trigger_synthesis():
+            ...
+
+    Args:
+        key: Operation name for the idempotency key
+        ttl: Seconds during which repeats are treated as duplicates
+    """
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        async def wrapper(*args, **kwargs) -> Any:
+            claimed, run_id = await claim(key, ttl, kwargs)
+            if not claimed:
+                logger.info(f"Duplicate {key} call ignored (run {run_id})")
+                return {"message": "already running", "status": "duplicate", "run_id": run_id}
+
+            claim_key = _claim_key(key, kwargs)
+            token = _current_claim.set((claim_key, run_id, ttl))
+            try:
+                result = await func(*args, **kwargs)
+            finally:
+                _current_claim.reset(token)
+                # Nothing left running: free the key for the next call
+                if run_id in _held_runs:
+                    _held_runs.discard(run_id)
+                else:
+                    await _release_run(claim_key, run_id)
+            if isinstance(result, dict):
+                result.setdefault("run_id", run_id)
+            return result
+        return wrapper
+    return decorator
@@ -17,6 +17,7 @@ from learning import (
     update_working_context,
     get_current_context,
 )
+from api.cache import invalidates
 from api.errors import handle_api_errors
 
 logger = logging.getLogger("athena.api.learning")
@@ -64,6 +65,7 @@ class ContextUpdateRequest(BaseModel):
 
 @router.post("/quick")
 @handle_api_errors("quick_learn")
+@invalidates("brain")
 async def api_quick_learn(request: QuickLearnRequest):
     """
     Quick learn something. Use for statements like:
@@ -89,6 +91,7 @@ async def api_quick_learn(request: QuickLearnRequest):
 
 @router.post("/task-completed")
 @handle_api_errors("learn_from_task")
+@invalidates("brain")
 async def api_learn_from_task(request: TaskCompletionRequest):
     """
     Learn from a completed task.
@@ -158,7 +161,7 @@ async def api_update_context(request: ContextUpdateRequest):
 
 @router.get("/context")
 @handle_api_errors("get_context")
-async def api_get_context():
+def api_get_context():
     """
     Get Bradley's current working context.
     """
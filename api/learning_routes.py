@@ -14,6 +14,7 @@ from typing import List, Dict, Any, Optional
 from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel
 
+from api.cache import invalidates
 from api.errors import handle_api_errors, NotFoundError, ValidationError
 from db.neon import db_cursor
 from api.auth import verify_api_key
@@ -50,7 +51,8 @@ class LearningApproval(BaseModel):
 
 @router.post("/submit-report")
 @handle_api_errors("submit session report")
-async def submit_session_report(report: SessionReport, api_key: str = Depends(verify_api_key)):
+@invalidates("brain")
+def submit_session_report(report: SessionReport, api_key: str = Depends(verify_api_key)):
     """
     Submit a session report with learnings.
     Creates evolution proposals for each learning that requires approval.
@@ -111,7 +113,8 @@ async def submit_session_report(report: SessionReport, api_key: str = Depends(ve
 
 @router.post("/approve/{proposal_id}")
 @handle_api_errors("approve learning")
-async def approve_learning(proposal_id: str, approval: LearningApproval,
+@invalidates("brain")
+def approve_learning(proposal_id: str, approval: LearningApproval,
                           api_key: str = Depends(verify_api_key)):
     """
     Approve or reject a learning proposal.
@@ -198,7 +201,7 @@ async def approve_learning(proposal_id: str, approval: LearningApproval,
 
 @router.get("/pending")
 @handle_api_errors("get pending learnings")
-async def get_pending_learnings(api_key: str = Depends(verify_api_key)):
+def get_pending_learnings(api_key: str = Depends(verify_api_key)):
     """Get all pending learning proposals awaiting approval."""
     with db_cursor() as cur:
         cur.execute("""
@@ -231,7 +234,7 @@ async def get_pending_learnings(api_key: str = Depends(verify_api_key)):
 
 @router.get("/active-rules")
 @handle_api_errors("get active rules")
-async def get_active_rules(api_key: str = Depends(verify_api_key)):
+def get_active_rules(api_key: str = Depends(verify_api_key)):
     """
     Get all active rules from boundaries, preferences, and canonical memory.
     This is what sessions should fetch to apply learned rules.
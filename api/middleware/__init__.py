@@ -1,4 +1,6 @@
 """Athena Server v2 - Middleware Module"""
 from api.middleware.boundary_check import BoundaryCheckMiddleware
+from api.middleware.error_handler import UnhandledErrorMiddleware
+from api.middleware.http_cache import HttpCacheMiddleware
 
-__all__ = ["BoundaryCheckMiddleware"]
+__all__ = ["BoundaryCheckMiddleware", "HttpCacheMiddleware", "UnhandledErrorMiddleware"]
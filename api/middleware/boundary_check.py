@@ -5,6 +5,10 @@ This middleware intercepts all API requests and checks them against the
 boundaries defined in the brain's boundaries table. This ensures that
 all actions, regardless of origin, are subject to the same rules.
 
+It is implemented as a pure ASGI middleware: the method and path are read
+straight from the scope and audit headers are injected by wrapping `send`,
+so no Request object is built per request.
+
 Boundary Types:
 - hard: Absolute restrictions that cannot be bypassed
 - soft: Guidelines that can be overridden with approval
@@ -14,13 +18,13 @@ Boundary Types:
 import logging
 import json
 import re
+import sys
+from collections import defaultdict
+from dataclasses import dataclass, field
 from typing import Dict, Any, Optional, Tuple
 from datetime import datetime
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import JSONResponse
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from db.brain import get_boundaries
 
@@ -60,8 +64,95 @@ ACTION_CATEGORY_MAP = {
     (r"/api/.*", "DELETE"): "data_deletion",
 }
 
+# ACTION_CATEGORY_MAP partitioned by HTTP method, preserving match order,
+# so a request only scans the patterns registered for its method. Patterns
+# are compiled case-insensitively once here rather than on every match.
+ACTION_PATTERNS_BY_METHOD = defaultdict(list)
+for (_pattern, _method), _category in ACTION_CATEGORY_MAP.items():
+    ACTION_PATTERNS_BY_METHOD[_method].append((re.compile(_pattern, re.IGNORECASE), _category))
+ACTION_PATTERNS_BY_METHOD = dict(ACTION_PATTERNS_BY_METHOD)
+
+# Closed set of action categories, interned so category matches against
+# cached boundaries compare by pointer in the common case
+ACTION_CATEGORIES = frozenset(sys.intern(c) for c in ACTION_CATEGORY_MAP.values())
+
+# Read-only methods that cannot violate boundaries (CORS preflights, probes)
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# Raw ASGI headers added to responses, encoded once at import
+HEADER_CHECK_PASSED = (b"x-athena-boundary-check", b"passed")
+HEADER_REQUIRES_APPROVAL = (b"x-athena-requires-approval", b"true")
+PASSED_HEADERS = (HEADER_CHECK_PASSED,)
+HEADER_CONTENT_TYPE_JSON = (b"content-type", b"application/json")
+
+# Evaluation order for boundary types: hard first, then soft, then contextual
+BOUNDARY_TYPE_ORDER = {"hard": 0, "soft": 1, "contextual": 2}
+
+
+def _violation_response(content: Dict) -> Tuple[tuple, bytes]:
+    """Serialize a 403 payload the way JSONResponse would, with its raw headers."""
+    body = json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return ((HEADER_CONTENT_TYPE_JSON, (b"content-length", str(len(body)).encode())), body)
+
+
+@dataclass(frozen=True, slots=True)
+class Boundary:
+    """Immutable, slotted snapshot of a boundaries row held in the middleware cache."""
+    
+    id: Any
+    category: str
+    boundary_type: str
+    rule: str
+    description: Optional[str]
+    requires_approval: bool
+    exceptions: tuple
+    # Raw headers sent when this soft boundary requires approval
+    approval_headers: tuple = field(default=(), repr=False)
+    # Serialized 403 (headers, body) keyed by request category, for hard violations
+    violation_responses: Dict[str, Tuple[tuple, bytes]] = field(default_factory=dict, repr=False, compare=False)
+    
+    @classmethod
+    def from_row(cls, row: Dict) -> "Boundary":
+        """Build a Boundary from a boundaries row, interning repeated strings."""
+        exceptions = row.get('exceptions') or ()
+        if isinstance(exceptions, str):
+            try:
+                exceptions = json.loads(exceptions)
+            except ValueError:
+                exceptions = ()
+        
+        category = row.get('category')
+        boundary_type = row.get('boundary_type') or 'soft'
+        warning = (row.get('rule') or 'Approval required').encode('latin-1', 'replace')
+        
+        # Boundaries in the 'all' category answer for every action category
+        categories = ACTION_CATEGORIES if category == 'all' else (category,)
+        violation_responses = {}
+        if boundary_type == 'hard':
+            for c in categories:
+                violation_responses[c] = _violation_response({
+                    "error": "boundary_violation",
+                    "type": "hard",
+                    "category": c,
+                    "rule": row.get('rule'),
+                    "message": f"This action is not allowed: {row.get('description') or row.get('rule')}",
+                    "boundary_id": str(row.get('id')),
+                })
+        
+        return cls(
+            id=row.get('id'),
+            category=sys.intern(category) if isinstance(category, str) else category,
+            boundary_type=sys.intern(boundary_type),
+            rule=row.get('rule'),
+            description=row.get('description'),
+            requires_approval=bool(row.get('requires_approval')),
+            exceptions=tuple(exceptions),
+            approval_headers=((b"x-athena-boundary-warning", warning), HEADER_REQUIRES_APPROVAL),
+            violation_responses=violation_responses,
+        )
+
 
-class BoundaryCheckMiddleware(BaseHTTPMiddleware):
+class BoundaryCheckMiddleware:
     """
     Middleware that enforces boundaries on all API requests.
     
@@ -73,8 +164,11 @@ class BoundaryCheckMiddleware(BaseHTTPMiddleware):
     5. Logs all boundary checks for audit purposes
     """
     
+    # Flip on once _boundary_applies / _exception_applies implement real rules
+    advanced_rules_enabled = False
+    
     def __init__(self, app: ASGIApp, excluded_paths: list = None):
-        super().__init__(app)
+        self.app = app
         self.excluded_paths = excluded_paths or [
             "/api/health",
             "/api/status",
@@ -86,38 +180,46 @@ class BoundaryCheckMiddleware(BaseHTTPMiddleware):
         self._cache_timestamp = None
         self._cache_ttl_seconds = 60  # Refresh boundaries every minute
     
-    async def dispatch(self, request: Request, call_next):
-        """Process each request through boundary checks."""
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Process each HTTP request through boundary checks."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
         
         # Skip excluded paths
-        path = request.url.path
+        path = scope["path"]
         if any(path.startswith(excluded) for excluded in self.excluded_paths):
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
         
-        # Skip GET requests (read-only operations)
-        if request.method == "GET":
-            return await call_next(request)
+        # Skip safe requests (read-only operations)
+        method = scope["method"]
+        if method in SAFE_METHODS:
+            await self.app(scope, receive, send)
+            return
         
         # Determine the action category
-        category = self._get_action_category(path, request.method)
+        category = self._get_action_category(path, method)
         
         if not category:
             # No specific category, allow the request
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
         
         # Get boundaries for this category
         boundaries = self._get_cached_boundaries()
         relevant_boundaries = [
             b for b in boundaries 
-            if b.get('category') == category or b.get('category') == 'all'
+            if b.category == category or b.category == 'all'
         ]
         
         if not relevant_boundaries:
             # No boundaries for this category
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
         
         # Check boundaries
-        violation = self._check_boundaries(relevant_boundaries, request, category)
+        violation = self._check_boundaries(relevant_boundaries, scope, category)
         
         if violation:
             boundary_type, boundary = violation
@@ -126,44 +228,40 @@ class BoundaryCheckMiddleware(BaseHTTPMiddleware):
                 # Log the violation
                 logger.warning(
                     f"HARD BOUNDARY VIOLATION: {category} | "
-                    f"Path: {path} | Rule: {boundary.get('rule')}"
+                    f"Path: {path} | Rule: {boundary.rule}"
                 )
                 
-                # Return 403 Forbidden
-                return JSONResponse(
-                    status_code=403,
-                    content={
-                        "error": "boundary_violation",
-                        "type": "hard",
-                        "category": category,
-                        "rule": boundary.get('rule'),
-                        "message": f"This action is not allowed: {boundary.get('description', boundary.get('rule'))}",
-                        "boundary_id": str(boundary.get('id')),
-                    }
-                )
+                # Return 403 Forbidden with the body serialized at cache refresh
+                headers, body = boundary.violation_responses[category]
+                await send({"type": "http.response.start", "status": 403, "headers": headers})
+                await send({"type": "http.response.body", "body": body})
+                return
             
             elif boundary_type == "soft":
                 # Log the soft boundary trigger
                 logger.info(
                     f"SOFT BOUNDARY TRIGGERED: {category} | "
-                    f"Path: {path} | Rule: {boundary.get('rule')}"
+                    f"Path: {path} | Rule: {boundary.rule}"
                 )
                 
                 # Check if approval is required
-                if boundary.get('requires_approval'):
+                if boundary.requires_approval:
                     # Add a header indicating approval is needed
-                    response = await call_next(request)
-                    response.headers["X-Athena-Boundary-Warning"] = boundary.get('rule', 'Approval required')
-                    response.headers["X-Athena-Requires-Approval"] = "true"
-                    return response
-        
-        # No violations, proceed with the request
-        response = await call_next(request)
+                    await self.app(scope, receive, self._with_headers(send, boundary.approval_headers))
+                    return
         
-        # Add audit header
-        response.headers["X-Athena-Boundary-Check"] = "passed"
+        # No violations, proceed with the request and add audit header
+        await self.app(scope, receive, self._with_headers(send, PASSED_HEADERS))
+    
+    @staticmethod
+    def _with_headers(send: Send, headers: tuple) -> Send:
+        """Wrap `send` so the given raw headers are appended to the response start."""
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *headers]
+            await send(message)
         
-        return response
+        return send_with_headers
     
     def _get_action_category(self, path: str, method: str) -> Optional[str]:
         """
@@ -172,17 +270,17 @@ class BoundaryCheckMiddleware(BaseHTTPMiddleware):
         Returns:
             Category string or None if no category matches
         """
-        for (pattern, req_method), category in ACTION_CATEGORY_MAP.items():
-            if method == req_method and re.match(pattern, path, re.IGNORECASE):
+        for pattern, category in ACTION_PATTERNS_BY_METHOD.get(method, ()):
+            if pattern.match(path):
                 return category
         return None
     
-    def _get_cached_boundaries(self) -> list:
+    def _get_cached_boundaries(self) -> Tuple[Boundary, ...]:
         """
         Get boundaries from cache or refresh from database.
         
         Returns:
-            List of boundary dictionaries
+            Tuple of Boundary records, sorted by boundary type priority
         """
         now = datetime.now()
         
@@ -191,66 +289,85 @@ class BoundaryCheckMiddleware(BaseHTTPMiddleware):
             (now - self._cache_timestamp).total_seconds() > self._cache_ttl_seconds):
             
             try:
-                self._boundary_cache = get_boundaries(active_only=True)
+                # Snapshot rows and keep only boundaries that can ever match
+                # a request category
+                boundaries = [
+                    b for b in map(Boundary.from_row, get_boundaries(active_only=True))
+                    if b.category in ACTION_CATEGORIES or b.category == 'all'
+                ]
+                
+                # Presort once per refresh: hard first, then soft, then contextual
+                self._boundary_cache = tuple(sorted(
+                    boundaries,
+                    key=lambda b: BOUNDARY_TYPE_ORDER.get(b.boundary_type, 3)
+                ))
                 self._cache_timestamp = now
                 logger.debug(f"Refreshed boundary cache: {len(self._boundary_cache)} boundaries")
             except Exception as e:
                 logger.error(f"Failed to fetch boundaries: {e}")
                 if self._boundary_cache is None:
-                    self._boundary_cache = []
+                    self._boundary_cache = ()
         
         return self._boundary_cache
     
     def _check_boundaries(
         self, 
         boundaries: list, 
-        request: Request, 
+        scope: Scope, 
         category: str
-    ) -> Optional[Tuple[str, Dict]]:
+    ) -> Optional[Tuple[str, Boundary]]:
         """
         Check if any boundaries are violated.
         
+        Boundaries arrive presorted (hard, soft, contextual) from the cache.
+        Until condition and exception logic exists, the highest-priority
+        boundary always wins, so no per-boundary evaluation is done.
+        
         Args:
             boundaries: List of relevant boundaries
-            request: The incoming request
+            scope: The ASGI scope of the incoming request
             category: The action category
             
         Returns:
-            Tuple of (boundary_type, boundary_dict) if violated, None otherwise
+            Tuple of (boundary_type, boundary) if violated, None otherwise
         """
-        # Sort boundaries: hard first, then soft, then contextual
-        type_order = {"hard": 0, "soft": 1, "contextual": 2}
-        sorted_boundaries = sorted(
-            boundaries, 
-            key=lambda b: type_order.get(b.get('boundary_type', 'contextual'), 3)
-        )
+        if not boundaries:
+            return None
         
-        for boundary in sorted_boundaries:
-            boundary_type = boundary.get('boundary_type', 'soft')
-            
+        if self.advanced_rules_enabled:
+            return self._apply_advanced_rules(boundaries, scope, category)
+        
+        boundary = boundaries[0]
+        return (boundary.boundary_type, boundary)
+    
+    def _apply_advanced_rules(
+        self, 
+        boundaries: list, 
+        scope: Scope, 
+        category: str
+    ) -> Optional[Tuple[str, Boundary]]:
+        """
+        Evaluate per-boundary conditions and exceptions.
+        
+        Only used when advanced_rules_enabled is set, i.e. once
+        _boundary_applies and _exception_applies carry real logic.
+        """
+        for boundary in boundaries:
             # Check if this boundary applies
-            if self._boundary_applies(boundary, request, category):
-                # Check for exceptions
-                exceptions = boundary.get('exceptions', [])
-                if isinstance(exceptions, str):
-                    try:
-                        exceptions = json.loads(exceptions)
-                    except:
-                        exceptions = []
-                
+            if self._boundary_applies(boundary, scope, category):
                 # Check if any exception applies
                 exception_applies = False
-                for exception in exceptions:
-                    if self._exception_applies(exception, request):
+                for exception in boundary.exceptions:
+                    if self._exception_applies(exception, scope):
                         exception_applies = True
                         break
                 
                 if not exception_applies:
-                    return (boundary_type, boundary)
+                    return (boundary.boundary_type, boundary)
         
         return None
     
-    def _boundary_applies(self, boundary: Dict, request: Request, category: str) -> bool:
+    def _boundary_applies(self, boundary: Boundary, scope: Scope, category: str) -> bool:
         """
         Check if a specific boundary applies to this request.
         
@@ -260,7 +377,7 @@ class BoundaryCheckMiddleware(BaseHTTPMiddleware):
         # All boundaries in the category apply by default
         return True
     
-    def _exception_applies(self, exception: Dict, request: Request) -> bool:
+    def _exception_applies(self, exception: Dict, scope: Scope) -> bool:
         """
         Check if an exception to a boundary applies.
         
@@ -0,0 +1,57 @@
+"""
+Athena Server v2 - Unhandled Error Middleware
+
+Turns any uncaught handler error into a 500 with the error as detail,
+replacing the per-endpoint `except Exception: raise HTTPException(500)`
+blocks. HTTPExceptions are answered by FastAPI before they get here.
+
+An app-level `exception_handler(Exception)` would be served by Starlette's
+outermost error middleware, outside CORSMiddleware, so browser clients would
+see an opaque CORS failure instead of the 500 body. This middleware is added
+inside CORS so the 500 gets the usual CORS headers.
+"""
+
+import logging
+
+from fastapi.responses import ORJSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import sentry_sdk
+except ImportError:  # error monitoring is optional
+    sentry_sdk = None
+
+logger = logging.getLogger("athena.middleware.errors")
+
+
+class UnhandledErrorMiddleware:
+    """Pure ASGI middleware answering uncaught exceptions with a JSON 500."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def tracking_send(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, tracking_send)
+        except Exception as exc:
+            if response_started:
+                # Too late for a 500: let the server close the connection
+                raise
+            logger.error("Failed %s %s: %s", scope["method"], scope["path"], exc)
+            # The exception no longer reaches Sentry's ASGI wrapper
+            if sentry_sdk is not None:
+                sentry_sdk.capture_exception(exc)
+            response = ORJSONResponse({"detail": str(exc)}, status_code=500)
+            await response(scope, receive, send)
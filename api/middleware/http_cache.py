@@ -0,0 +1,171 @@
+"""
+Athena Server v2 - HTTP Cache Headers Middleware
+
+Adds a strong ETag and a per-route Cache-Control header to successful GET
+responses on the routes listed in CACHEABLE_ROUTES, and answers matching
+`If-None-Match` requests with an empty 304. Polling clients (dashboards, the
+THINKING session hitting /thinking/live) then revalidate for the cost of a
+hash instead of re-downloading the body.
+
+Like the boundary middleware it is pure ASGI: uncached routes pass straight
+through, and cacheable responses are buffered only until the body is complete.
+Responses that already carry an ETag (e.g. @cached hits, tagged when stored)
+are not buffered or re-hashed at all.
+"""
+
+import hashlib
+import logging
+from typing import Dict, List, Optional, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger("athena.middleware.http_cache")
+
+
+DEFAULT_CACHE_CONTROL = "private, max-age=30, stale-while-revalidate=60"
+# Status probes: short freshness so a degraded state shows up within seconds
+STATUS_CACHE_CONTROL = "private, max-age=5, stale-while-revalidate=30"
+
+# Path -> Cache-Control for routes that get ETag/304 handling
+CACHEABLE_ROUTES: Dict[str, str] = {
+    "/api/observations": DEFAULT_CACHE_CONTROL,
+    "/api/patterns": DEFAULT_CACHE_CONTROL,
+    "/api/synthesis": DEFAULT_CACHE_CONTROL,
+    "/api/drafts": DEFAULT_CACHE_CONTROL,
+    "/api/brief": DEFAULT_CACHE_CONTROL,
+    "/api/sessions/active": DEFAULT_CACHE_CONTROL,
+    "/api/sessions/thinking": DEFAULT_CACHE_CONTROL,
+    "/api/sessions/bundle": DEFAULT_CACHE_CONTROL,
+    "/api/broadcasts/recent": DEFAULT_CACHE_CONTROL,
+    "/api/broadcasts/stats": DEFAULT_CACHE_CONTROL,
+    # Live feed: always revalidate, but unchanged polls still cost only a 304
+    "/api/thinking/live": "private, no-cache",
+    # Brain context: revalidated on every session start, 304 until the brain changes
+    "/api/session/context/full": "private, no-cache",
+    "/api/session/context/identity": "private, no-cache",
+    "/api/session/health": STATUS_CACHE_CONTROL,
+    "/webhooks/github/status": STATUS_CACHE_CONTROL,
+}
+
+# Pre-encoded Cache-Control header values, built once at import
+_CACHE_CONTROL_HEADERS = {
+    path: (b"cache-control", value.encode("latin-1"))
+    for path, value in CACHEABLE_ROUTES.items()
+}
+
+
+def compute_etag(body: bytes) -> bytes:
+    """Compute a strong ETag for a response body."""
+    return b'"' + hashlib.blake2b(body, digest_size=16).hexdigest().encode("ascii") + b'"'
+
+
+def _header(headers, wanted: bytes) -> Optional[bytes]:
+    for name, value in headers:
+        if name == wanted:
+            return value
+    return None
+
+
+def _etag_matches(header: bytes, etag: bytes) -> bool:
+    """Check an If-None-Match header (possibly a list or weak tags) against an ETag."""
+    if header.strip() == b"*":
+        return True
+    for candidate in header.split(b","):
+        candidate = candidate.strip()
+        if candidate.startswith(b"W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+class HttpCacheMiddleware:
+    """
+    Pure ASGI middleware emitting ETag and Cache-Control on cacheable GET routes.
+
+    Only 200 responses are tagged; anything else is forwarded unchanged.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        cache_control = _CACHE_CONTROL_HEADERS.get(scope["path"])
+        if cache_control is None:
+            await self.app(scope, receive, send)
+            return
+
+        inm = _header(scope["headers"], b"if-none-match")
+        start: Optional[Message] = None
+        chunks: List[bytes] = []
+        passthrough = False
+        drop_body = False
+
+        async def send_not_modified(headers: List[Tuple[bytes, bytes]]) -> None:
+            not_modified = [
+                (name, value) for name, value in headers
+                if name not in (b"content-length", b"content-type")
+            ]
+            await send({"type": "http.response.start", "status": 304, "headers": not_modified})
+            await send({"type": "http.response.body", "body": b""})
+
+        async def buffered_send(message: Message) -> None:
+            nonlocal start, passthrough, drop_body
+            if drop_body:
+                return
+            if passthrough:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                if message["status"] != 200:
+                    passthrough = True
+                    await send(message)
+                    return
+                etag = _header(message["headers"], b"etag")
+                if etag is not None:
+                    # Pre-tagged response: no need to buffer or hash the body
+                    headers = [
+                        (name, value) for name, value in message["headers"]
+                        if name != b"cache-control"
+                    ]
+                    headers.append(cache_control)
+                    if inm is not None and _etag_matches(inm, etag):
+                        drop_body = True
+                        await send_not_modified(headers)
+                        return
+                    passthrough = True
+                    await send({**message, "headers": headers})
+                    return
+                start = message
+                return
+
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            body = b"".join(chunks)
+            etag = compute_etag(body)
+            headers: List[Tuple[bytes, bytes]] = [
+                (name, value) for name, value in start["headers"]
+                if name not in (b"etag", b"cache-control")
+            ]
+            headers.append((b"etag", etag))
+            headers.append(cache_control)
+
+            if inm is not None and _etag_matches(inm, etag):
+                await send_not_modified(headers)
+                return
+
+            await send({**start, "headers": headers})
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, buffered_send)
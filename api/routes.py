@@ -3,28 +3,132 @@ Athena Server v2 - API Routes
 REST endpoints for Athena data and manual triggers.
 """
 
+import asyncio
+import json
 import logging
-from datetime import datetime
-from typing import Optional
-
-from fastapi import APIRouter, HTTPException, BackgroundTasks
-
+from datetime import date, datetime, timedelta, timezone
+from operator import itemgetter
+from typing import Annotated, Any, Literal, Optional
+
+import msgspec
+import orjson
+from fastapi import APIRouter, Body, HTTPException, Query, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+from psycopg.rows import dict_row
+from pydantic import BaseModel, ConfigDict, Field, PlainSerializer
+
+from api.cache import (
+    MSGPACK_MEDIA_TYPE,
+    ResponseFormat,
+    cached,
+    get_redis,
+    invalidate,
+    invalidate_after,
+    msgpack_encoder,
+    orjson_default,
+    serialized_response,
+)
+from api.idempotency import hold_until_done, idempotent
+from config import settings
 from db.neon import (
+    PREPARE_HOT_QUERIES,
+    db_cursor,
+    get_db_connection,
+    async_db_connection,
+    async_db_cursor,
     check_db_health,
-    get_recent_observations,
-    get_recent_patterns,
-    get_latest_synthesis,
-    get_pending_drafts,
-    get_canonical_memory,
-    get_all_active_sessions,
-    get_todays_thinking_session,
+    get_recent_observations_async,
+    stream_observations_async,
+    stream_recent_thoughts_async,
+    store_observations,
+    get_recent_patterns_async,
+    get_latest_synthesis_async,
+    get_pending_drafts_async,
+    batch_brief_queries,
+    get_all_active_sessions_async,
+    get_todays_thinking_session_async,
+    get_sessions_bundle_async,
     ensure_active_sessions_table,
+    ensure_broadcasts_table,
+    get_active_session,
+    get_recent_broadcasts,
+    claim_unread_broadcasts,
+    # Aliased: the route handlers below use this name
+    get_broadcast_stats as fetch_broadcast_stats,
 )
+from integrations.http_client import get_http_client, upstream_slot
+from integrations.manus_api import MANUS_HEADERS, create_manus_task
+from jobs.athena_thinking import run_athena_thinking
+from jobs.editing_session import run_editing_session
+from jobs.hourly_broadcast import run_hourly_broadcast
+from jobs.morning_sessions import run_morning_sessions
+from jobs.offload import submit_job
+from jobs.teaching_session import run_teaching_session
+from utils.clock import iso_now
 
 logger = logging.getLogger("athena.api")
 
 router = APIRouter()
 
+MAX_OBSERVATIONS_LIMIT = 1000
+MAX_THOUGHTS_STREAM_LIMIT = 1000
+# Values the observation jobs write (gmail, calendar) plus the deploy check's "email"
+SourceType = Literal["gmail", "calendar", "email"]
+
+
+# =============================================================================
+# RESPONSE MODELS
+# =============================================================================
+
+# Untyped row (SELECT *): serialized exactly as before via jsonable_encoder
+DbRow = Annotated[dict, PlainSerializer(jsonable_encoder, when_used="json")]
+
+
+class Observation(BaseModel):
+    """An observations row; known columns are typed, any others pass through."""
+    model_config = ConfigDict(extra="allow")
+
+    id: Any = None
+    source_type: Optional[str] = None
+    source_id: Optional[str] = None
+    observed_at: Optional[datetime] = None
+    category: Optional[str] = None
+    priority: Optional[str] = None
+    requires_action: Optional[bool] = None
+    title: Optional[str] = None
+    summary: Optional[str] = None
+    raw_metadata: Any = None
+
+
+class ObservationsResponse(BaseModel):
+    """Response for /observations."""
+    count: int
+    observations: list[Observation]
+
+
+class ObservationIn(BaseModel):
+    """An observation submitted to /observations/batch."""
+    source_type: SourceType
+    source_id: str
+    observed_at: datetime = Field(default_factory=datetime.utcnow)
+    category: Optional[str] = None
+    priority: Optional[str] = None
+    requires_action: bool = False
+    title: Optional[str] = None
+    summary: Optional[str] = None
+    raw_metadata: Optional[dict] = None
+
+
+class BriefResponse(BaseModel):
+    """Response for /brief."""
+    generated_at: datetime
+    synthesis: Optional[DbRow] = None
+    patterns: list[DbRow]
+    pending_drafts: list[DbRow]
+    action_items: list[Observation]
+    canonical_memory_count: int
+
 
 # Health check
 @router.get("/health")
@@ -34,7 +138,7 @@ async def health_check():
     
     return {
         "status": "healthy" if db_healthy else "degraded",
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": iso_now(),
         "components": {
             "database": "ok" if db_healthy else "error",
             "scheduler": "ok"
@@ -43,240 +147,223 @@ async def health_check():
 
 
 # Data endpoints
-@router.get("/observations")
-async def list_observations(limit: int = 50, source_type: Optional[str] = None):
+# Response models are documented through responses= with response_model=None,
+# so FastAPI never re-validates and re-encodes a result that is already typed
+@router.get("/observations", response_model=None, responses={200: {"model": ObservationsResponse}})
+@cached(ttl=30, key_prefix="observations", tags=("observations",))
+async def list_observations(
+    fmt: ResponseFormat,
+    limit: int = Query(50, ge=1, le=MAX_OBSERVATIONS_LIMIT),
+    source_type: Optional[SourceType] = None,
+):
     """Get recent observations."""
-    try:
-        observations = get_recent_observations(limit=limit, source_type=source_type)
-        return {
-            "count": len(observations),
-            "observations": observations
-        }
-    except Exception as e:
-        logger.error(f"Failed to get observations: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    observations = await get_recent_observations_async(limit=limit, source_type=source_type)
+    return ObservationsResponse(count=len(observations), observations=observations)
+
+
+@router.get("/observations/stream")
+async def stream_observations(
+    limit: int = Query(100, ge=1, le=MAX_OBSERVATIONS_LIMIT),
+    source_type: Optional[SourceType] = None,
+):
+    """
+    Stream recent observations as NDJSON, one row per line.
+    Rows are written as Postgres returns them, so large pulls start
+    immediately and are never held in memory as a whole.
+    """
+    async def ndjson():
+        async for row in stream_observations_async(limit=limit, source_type=source_type):
+            yield orjson.dumps(row, default=orjson_default) + b"\n"
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+
+@router.post("/observations/batch")
+async def batch_observations(
+    observations: list[ObservationIn] = Body(..., max_length=MAX_OBSERVATIONS_LIMIT),
+):
+    """
+    Store many observations at once.
+    Upserts on (source_type, source_id) like the observation jobs, in a single
+    pipelined round trip.
+    """
+    rows = []
+    for obs in observations:
+        row = obs.model_dump()
+        row['raw_metadata'] = json.dumps(row['raw_metadata']) if row['raw_metadata'] is not None else None
+        rows.append(row)
+    inserted = await asyncio.to_thread(store_observations, rows)
+    await invalidate("observations")
+    return {"inserted": inserted}
 
 
 @router.get("/patterns")
-async def list_patterns(limit: int = 20):
+@cached(ttl=120, key_prefix="patterns", tags=("patterns",))
+async def list_patterns(fmt: ResponseFormat, limit: int = 20):
     """Get recent patterns."""
-    try:
-        patterns = get_recent_patterns(limit=limit)
-        return {
-            "count": len(patterns),
-            "patterns": patterns
-        }
-    except Exception as e:
-        logger.error(f"Failed to get patterns: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    patterns = await get_recent_patterns_async(limit=limit)
+    return {
+        "count": len(patterns),
+        "patterns": patterns
+    }
 
 
 @router.get("/synthesis")
+@cached(ttl=120, key_prefix="synthesis", tags=("synthesis",))
 async def get_synthesis():
     """Get the latest synthesis."""
-    try:
-        synthesis = get_latest_synthesis()
-        if not synthesis:
-            return {"message": "No synthesis available yet"}
-        return synthesis
-    except Exception as e:
-        logger.error(f"Failed to get synthesis: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    synthesis = await get_latest_synthesis_async()
+    if not synthesis:
+        return {"message": "No synthesis available yet"}
+    return synthesis
 
 
 @router.get("/drafts")
 async def list_drafts():
     """Get pending email drafts."""
-    try:
-        drafts = get_pending_drafts()
-        return {
-            "count": len(drafts),
-            "drafts": drafts
-        }
-    except Exception as e:
-        logger.error(f"Failed to get drafts: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    drafts = await get_pending_drafts_async()
+    return {
+        "count": len(drafts),
+        "drafts": drafts
+    }
 
 
 @router.post("/drafts/{draft_id}/reject")
 async def reject_draft(draft_id: str, reason: Optional[str] = None):
     """Reject a pending email draft."""
-    from db.neon import db_cursor
-    
-    try:
-        with db_cursor() as cursor:
-            # Check if draft exists
-            cursor.execute("SELECT id, status FROM email_drafts WHERE id = %s", (draft_id,))
-            draft = cursor.fetchone()
-            
-            if not draft:
-                raise HTTPException(status_code=404, detail="Draft not found")
-            
-            # Update status to rejected
-            cursor.execute("""
-                UPDATE email_drafts 
-                SET status = 'rejected', 
-                    reviewed_at = NOW(),
-                    review_notes = %s
-                WHERE id = %s
-            """, (reason or "Rejected by user", draft_id))
-            
-        return {
-            "success": True,
-            "draft_id": draft_id,
-            "status": "rejected",
-            "reason": reason
-        }
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to reject draft {draft_id}: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    async with async_db_cursor() as cursor:
+        # Check if draft exists
+        await cursor.execute("SELECT id, status FROM email_drafts WHERE id = %s", (draft_id,))
+        draft = await cursor.fetchone()
+        
+        if not draft:
+            raise HTTPException(status_code=404, detail="Draft not found")
+        
+        # Update status to rejected
+        await cursor.execute("""
+            UPDATE email_drafts 
+            SET status = 'rejected', 
+                reviewed_at = NOW(),
+                review_notes = %s
+            WHERE id = %s
+        """, (reason or "Rejected by user", draft_id))
+        
+    await invalidate("drafts")
+    return {
+        "success": True,
+        "draft_id": draft_id,
+        "status": "rejected",
+        "reason": reason
+    }
 
 
 @router.post("/drafts/{draft_id}/approve")
 async def approve_draft(draft_id: str):
     """Approve a pending email draft for sending."""
-    from db.neon import db_cursor
-    
-    try:
-        with db_cursor() as cursor:
-            # Check if draft exists
-            cursor.execute("SELECT id, status FROM email_drafts WHERE id = %s", (draft_id,))
-            draft = cursor.fetchone()
-            
-            if not draft:
-                raise HTTPException(status_code=404, detail="Draft not found")
-            
-            # Update status to approved
-            cursor.execute("""
-                UPDATE email_drafts 
-                SET status = 'approved', 
-                    reviewed_at = NOW()
-                WHERE id = %s
-            """, (draft_id,))
-            
-        return {
-            "success": True,
-            "draft_id": draft_id,
-            "status": "approved"
-        }
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to approve draft {draft_id}: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    async with async_db_cursor() as cursor:
+        # Check if draft exists
+        await cursor.execute("SELECT id, status FROM email_drafts WHERE id = %s", (draft_id,))
+        draft = await cursor.fetchone()
+        
+        if not draft:
+            raise HTTPException(status_code=404, detail="Draft not found")
+        
+        # Update status to approved
+        await cursor.execute("""
+            UPDATE email_drafts 
+            SET status = 'approved', 
+                reviewed_at = NOW()
+            WHERE id = %s
+        """, (draft_id,))
+        
+    await invalidate("drafts")
+    return {
+        "success": True,
+        "draft_id": draft_id,
+        "status": "approved"
+    }
 
 
 @router.post("/drafts/reject-bulk")
 async def reject_drafts_bulk(draft_ids: list[str], reason: Optional[str] = None):
     """Reject multiple drafts at once."""
-    from db.neon import db_cursor
-    
-    try:
-        rejected = []
-        with db_cursor() as cursor:
-            for draft_id in draft_ids:
-                cursor.execute("""
-                    UPDATE email_drafts 
-                    SET status = 'rejected', 
-                        reviewed_at = NOW(),
-                        review_notes = %s
-                    WHERE id = %s AND status = 'pending_review'
-                    RETURNING id
-                """, (reason or "Bulk rejected", draft_id))
-                result = cursor.fetchone()
-                if result:
-                    rejected.append(draft_id)
-            
-        return {
-            "success": True,
-            "rejected_count": len(rejected),
-            "rejected_ids": rejected,
-            "reason": reason
-        }
-    except Exception as e:
-        logger.error(f"Failed to bulk reject drafts: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    async with async_db_cursor() as cursor:
+        # One statement for the whole batch instead of an UPDATE per draft
+        await cursor.execute("""
+            UPDATE email_drafts 
+            SET status = 'rejected', 
+                reviewed_at = NOW(),
+                review_notes = %s
+            WHERE id = ANY(%s::uuid[]) AND status = 'pending_review'
+            RETURNING id
+        """, (reason or "Bulk rejected", draft_ids))
+        rejected = [str(row['id']) for row in await cursor.fetchall()]
+        
+    await invalidate("drafts")
+    return {
+        "success": True,
+        "rejected_count": len(rejected),
+        "rejected_ids": rejected,
+        "reason": reason
+    }
 
 
-@router.get("/brief")
-async def get_morning_brief():
+@router.get("/brief", response_model=None, responses={200: {"model": BriefResponse}})
+@cached(ttl=60, key_prefix="brief", tags=("synthesis", "patterns", "drafts", "observations"))
+async def get_morning_brief(fmt: ResponseFormat):
     """
     Get the morning brief data.
     Combines synthesis, patterns, drafts, and calendar for the daily brief.
     """
-    try:
-        synthesis = get_latest_synthesis()
-        patterns = get_recent_patterns(limit=10)
-        drafts = get_pending_drafts()
-        canonical = get_canonical_memory()
-        
-        # Get today's observations
-        observations = get_recent_observations(limit=100)
-        
-        # Filter for action items
-        action_items = [
-            obs for obs in observations 
-            if obs.get('priority') in ['high', 'urgent']
-        ]
-        
-        return {
-            "generated_at": datetime.utcnow().isoformat(),
-            "synthesis": synthesis,
-            "patterns": patterns,
-            "pending_drafts": drafts,
-            "action_items": action_items,
-            "canonical_memory_count": len(canonical)
-        }
-    except Exception as e:
-        logger.error(f"Failed to generate brief: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    # All five reads go out in one pipelined round trip
+    brief = await batch_brief_queries(patterns_limit=10, action_items_limit=20)
+    return BriefResponse(generated_at=datetime.now(timezone.utc), **brief)
 
 
 # Manual trigger endpoints
 @router.post("/trigger/observation")
-async def trigger_observation_burst(background_tasks: BackgroundTasks):
+@idempotent("trigger:observation", ttl=60)
+async def trigger_observation_burst():
     """Manually trigger an observation burst."""
-    from jobs.observation_burst import run_observation_burst
-    
-    background_tasks.add_task(run_observation_burst)
+    job = submit_job("jobs.observation_burst:run_observation_burst")
+    hold_until_done(job)
+    invalidate_after(job, "observations")
     return {"message": "Observation burst triggered", "status": "running"}
 
 
 @router.post("/trigger/pattern")
-async def trigger_pattern_detection(background_tasks: BackgroundTasks):
+@idempotent("trigger:pattern", ttl=120)
+async def trigger_pattern_detection():
     """Manually trigger pattern detection."""
-    from jobs.pattern_detection import run_pattern_detection
-    
-    background_tasks.add_task(run_pattern_detection)
+    # Pattern detection also marks observations as processed
+    job = submit_job("jobs.pattern_detection:run_pattern_detection")
+    hold_until_done(job)
+    invalidate_after(job, "patterns", "observations")
     return {"message": "Pattern detection triggered", "status": "running"}
 
 
 @router.post("/trigger/synthesis")
-async def trigger_synthesis(background_tasks: BackgroundTasks):
+@idempotent("trigger:synthesis", ttl=300)
+async def trigger_synthesis():
     """Manually trigger synthesis."""
-    from jobs.synthesis import run_synthesis
-    
-    background_tasks.add_task(run_synthesis)
+    job = submit_job("jobs.synthesis:run_synthesis")
+    hold_until_done(job)
+    invalidate_after(job, "synthesis")
     return {"message": "Synthesis triggered", "status": "running"}
 
 
 @router.post("/trigger/athena-thinking")
-async def trigger_athena_thinking(background_tasks: BackgroundTasks, force: bool = False):
+@idempotent("trigger:athena-thinking", ttl=300)
+async def trigger_athena_thinking(force: bool = False):
     """
     Manually trigger ATHENA THINKING session (hybrid: server-side + Manus broadcast).
 
     Args:
         force: If True, create new session even if one exists today.
     """
-    from jobs.athena_thinking import run_athena_thinking
-
-    # Can't pass force to background task easily, so check here first
+    # Check here first so the caller gets an immediate answer
     if not force:
-        from db.neon import get_active_session
-        from datetime import datetime
-        existing = get_active_session('athena_thinking')
+        existing = await asyncio.to_thread(get_active_session, 'athena_thinking')
         if existing and existing.get('session_date') == datetime.now().date():
             return {
                 "message": "ATHENA THINKING session already exists for today",
@@ -285,11 +372,14 @@ async def trigger_athena_thinking(background_tasks: BackgroundTasks, force: bool
                 "hint": "Use force=true to create a new session"
             }
 
-    background_tasks.add_task(run_athena_thinking, force)
+    job = submit_job("jobs.athena_thinking:run_athena_thinking", force=force)
+    hold_until_done(job)
+    invalidate_after(job, "sessions", "broadcasts")
     return {"message": "ATHENA THINKING triggered", "status": "running"}
 
 
 @router.post("/trigger/athena-thinking-sync")
+@idempotent("trigger:athena-thinking-sync", ttl=300)
 async def trigger_athena_thinking_sync(force: bool = False):
     """
     Synchronously trigger ATHENA THINKING for debugging.
@@ -297,103 +387,164 @@ async def trigger_athena_thinking_sync(force: bool = False):
     Args:
         force: If True, create new session even if one exists today.
     """
-    from jobs.athena_thinking import run_athena_thinking
 
     try:
         result = await run_athena_thinking(force=force)
+        await invalidate("sessions", "broadcasts")
         return {"message": "ATHENA THINKING completed", "result": result}
     except Exception as e:
         return {"message": "ATHENA THINKING failed", "error": str(e)}
 
 
+# Connectors for the debug task: Notion only
+MANUS_TEST_CONNECTORS = ("9c27c684-2f4f-4d33-8fcf-51664ea15c00",)
+
+
 @router.post("/trigger/manus-test")
+@idempotent("trigger:manus-test", ttl=60)
 async def trigger_manus_test():
     """Direct Manus API test for debugging."""
-    from integrations.manus_api import create_manus_task
-    
     try:
         result = await create_manus_task(
             task_prompt="This is a test session. Please acknowledge and confirm you can see this message.",
             model="manus-1.6",
-            connectors=["9c27c684-2f4f-4d33-8fcf-51664ea15c00"],
+            connectors=MANUS_TEST_CONNECTORS,
             session_type="general"
         )
         return {"message": "Manus test completed", "result": result}
     except Exception as e:
-        import traceback
-        return {"message": "Manus test failed", "error": str(e), "traceback": traceback.format_exc()}
+        logger.exception("Manus test failed")
+        return {"message": "Manus test failed", "error": str(e)}
+
+
+# /thinking/live queries, polled constantly: prepared server-side so repeat
+# polls skip parse/plan
+SQL_LIVE_THOUGHTS = """
+    WITH s AS (
+        SELECT manus_task_id, manus_task_url, session_date, updated_at
+        FROM active_sessions
+        WHERE session_type = 'athena_thinking'
+        AND session_date = CURRENT_DATE
+        ORDER BY updated_at DESC
+        LIMIT 1
+    )
+    SELECT s.manus_task_id, s.manus_task_url, s.session_date, s.updated_at,
+           t.id, t.session_id, t.thought_type, t.content_preview, t.truncated,
+           t.confidence, t.phase, t.created_at
+    FROM (SELECT 1) AS one
+    LEFT JOIN s ON TRUE
+    LEFT JOIN LATERAL (
+        SELECT id, session_id, thought_type, LEFT(content, 200) AS content_preview,
+               LENGTH(LEFT(content, 201)) > 200 AS truncated,
+               confidence, phase, created_at
+        FROM thinking_log
+        WHERE created_at > %s
+        ORDER BY created_at DESC
+        LIMIT 20
+    ) t ON TRUE
+    ORDER BY t.created_at DESC
+"""
+
+SQL_THOUGHT_COUNTS = """
+    SELECT thought_type, COUNT(*) as count
+    FROM thinking_log
+    WHERE created_at > CURRENT_DATE
+    GROUP BY thought_type
+"""
+
+# Pulls a live row's thought columns in one C call instead of seven lookups
+_live_thought_columns = itemgetter(
+    'id', 'session_id', 'thought_type', 'content_preview', 'truncated', 'confidence', 'phase', 'created_at'
+)
 
 
 @router.get("/thinking/live")
-async def get_live_thinking():
+async def get_live_thinking(fmt: ResponseFormat):
     """
     Get live thinking status - shows what Athena is currently thinking.
     This is a convenience endpoint that combines session info with recent thoughts.
+    
+    The session block carries everything /sessions/thinking returns, so
+    pollers only need this endpoint.
     """
-    from db.neon import db_cursor
-    from datetime import datetime, timedelta
+    since = datetime.utcnow() - timedelta(hours=2)
     
-    with db_cursor() as cursor:
-        # Get today's active thinking session
-        cursor.execute("""
-            SELECT manus_task_id, manus_task_url, updated_at
-            FROM active_sessions
-            WHERE session_type = 'athena_thinking'
-            AND session_date = CURRENT_DATE
-            ORDER BY updated_at DESC
-            LIMIT 1
-        """)
-        session_row = cursor.fetchone()
-        
-        session_info = None
-        if session_row:
-            session_info = {
-                "task_id": session_row['manus_task_id'],
-                "task_url": session_row['manus_task_url'],
-                "updated_at": session_row['updated_at'].isoformat() if session_row['updated_at'] else None
-            }
+    async with async_db_connection() as conn:
+        live_cur = conn.cursor(row_factory=dict_row)
+        counts_cur = conn.cursor(row_factory=dict_row)
         
-        # Get recent thoughts (last 2 hours)
-        since = datetime.utcnow() - timedelta(hours=2)
-        cursor.execute("""
-            SELECT id, session_id, thought_type, content, confidence, phase, created_at
-            FROM thinking_log
-            WHERE created_at > %s
-            ORDER BY created_at DESC
-            LIMIT 20
-        """, (since,))
-        
-        thoughts = [
-            {
-                "id": str(row['id']),
-                "session_id": row['session_id'],
-                "type": row['thought_type'],
-                "content": row['content'][:200] + "..." if len(row['content']) > 200 else row['content'],
-                "confidence": row['confidence'],
-                "phase": row['phase'],
-                "timestamp": row['created_at'].isoformat() if row['created_at'] else None
-            }
-            for row in cursor.fetchall()
-        ]
+        # Pipeline mode: both queries go out in a single round trip
+        async with conn.pipeline():
+            # Today's active thinking session joined with recent thoughts
+            # (last 2 hours). Always returns at least one row: session
+            # columns are NULL without a session, thought columns are NULL
+            # without thoughts. Content arrives cut to the preview length,
+            # with a flag saying whether it was cut.
+            await live_cur.execute(SQL_LIVE_THOUGHTS, (since,), prepare=PREPARE_HOT_QUERIES)
+            
+            # Get thought type counts for today
+            await counts_cur.execute(SQL_THOUGHT_COUNTS, prepare=PREPARE_HOT_QUERIES)
         
-        # Get thought type counts for today
-        cursor.execute("""
-            SELECT thought_type, COUNT(*) as count
-            FROM thinking_log
-            WHERE created_at > CURRENT_DATE
-            GROUP BY thought_type
-        """)
-        type_counts = {row['thought_type']: row['count'] for row in cursor.fetchall()}
+        live_rows = await live_cur.fetchall()
+        count_rows = await counts_cur.fetchall()
     
-    return {
+    session_info = None
+    first = live_rows[0] if live_rows else None
+    if first and first['manus_task_id'] is not None:
+        session_info = {
+            "task_id": first['manus_task_id'],
+            "task_url": first['manus_task_url'],
+            "session_date": str(first['session_date']),
+            "updated_at": first['updated_at']
+        }
+    
+    thoughts = []
+    for row in live_rows:
+        thought_id, session_id, thought_type, preview, truncated, confidence, phase, created_at = _live_thought_columns(row)
+        if thought_id is None:
+            continue
+        thoughts.append({
+            "id": str(thought_id),
+            "session_id": session_id,
+            "type": thought_type,
+            "content": preview + "..." if truncated else preview,
+            "confidence": confidence,
+            "phase": phase,
+            "timestamp": created_at
+        })
+    
+    type_counts = {row['thought_type']: row['count'] for row in count_rows}
+    
+    # Polled constantly: encode once with orjson instead of via jsonable_encoder
+    return serialized_response({
         "status": "active" if thoughts else "idle",
         "session": session_info,
         "thought_counts_today": type_counts,
         "recent_thoughts": thoughts
-    }
+    }, fmt)
+
+
+@router.get("/thinking/live/stream")
+async def stream_live_thinking(
+    hours: int = Query(2, ge=1, le=24),
+    limit: int = Query(100, ge=1, le=MAX_THOUGHTS_STREAM_LIMIT),
+):
+    """
+    Stream recent thoughts as length-prefixed msgpack frames.
+    Each frame is a 4-byte big-endian length followed by one msgpack-encoded
+    thought (same fields as /thinking/live), written as Postgres returns the
+    rows, so larger windows than the live endpoint's 20 are never buffered.
+    """
+    async def frames():
+        async for row in stream_recent_thoughts_async(hours=hours, limit=limit):
+            payload = msgpack_encoder.encode(row)
+            yield len(payload).to_bytes(4, "big") + payload
+
+    return StreamingResponse(frames(), media_type=MSGPACK_MEDIA_TYPE)
 
 
 @router.post("/trigger/morning-sessions")
+@idempotent("trigger:morning-sessions", ttl=300)
 async def trigger_morning_sessions(force: bool = False):
     """
     Manually trigger the Workspace & Agenda session.
@@ -401,100 +552,113 @@ async def trigger_morning_sessions(force: bool = False):
     Args:
         force: If True, create new session even if one exists today.
     """
-    from jobs.morning_sessions import run_morning_sessions
-    import asyncio
 
     # Run the async function directly and return result
     try:
         result = await run_morning_sessions(force=force)
+        await invalidate("sessions")
         return {
             "message": "Morning session (Workspace & Agenda) created",
             "status": "success",
             "result": result
         }
     except Exception as e:
-        import traceback
+        logger.exception("Morning session failed")
         return {
             "message": "Morning session failed",
             "status": "error",
-            "error": str(e),
-            "traceback": traceback.format_exc()
+            "error": str(e)
         }
 
 
 # Active Sessions endpoints
 @router.get("/sessions/active")
+@cached(ttl=60, key_prefix="sessions_active", tags=("sessions",))
 async def get_active_sessions():
     """
     Get all active Manus sessions.
     Returns session IDs that Athena can use throughout the day.
+    
+    Deprecated: use /sessions/bundle, which also returns the THINKING session.
     """
-    try:
-        sessions = get_all_active_sessions()
-        return {
-            "count": len(sessions),
-            "sessions": sessions
-        }
-    except Exception as e:
-        logger.error(f"Failed to get active sessions: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    sessions = await get_all_active_sessions_async()
+    return {
+        "count": len(sessions),
+        "sessions": sessions
+    }
 
 
 @router.get("/sessions/thinking")
+# Today's session is stable for the day; the date in the key rolls it over at midnight
+@cached(ttl=3600, key_prefix="sessions_thinking", tags=("sessions",), vary=date.today)
 async def get_thinking_session():
     """
     Get today's ATHENA THINKING session.
     This is the session Athena should use for deeper analysis throughout the day.
+    
+    Deprecated: use /sessions/bundle, which also returns all active sessions.
     """
-    try:
-        session = get_todays_thinking_session()
-        if not session:
-            return {
-                "status": "no_session",
-                "message": "No ATHENA THINKING session found for today",
-                "hint": "The morning session may not have run yet, or it's a new day"
-            }
+    session = await get_todays_thinking_session_async()
+    if not session:
         return {
-            "status": "active",
-            "task_id": session['manus_task_id'],
-            "task_url": session['manus_task_url'],
-            "session_date": str(session['session_date']),
-            "updated_at": str(session['updated_at'])
+            "status": "no_session",
+            "message": "No ATHENA THINKING session found for today",
+            "hint": "The morning session may not have run yet, or it's a new day"
         }
-    except Exception as e:
-        logger.error(f"Failed to get thinking session: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return {
+        "status": "active",
+        "task_id": session['manus_task_id'],
+        "task_url": session['manus_task_url'],
+        "session_date": str(session['session_date']),
+        "updated_at": str(session['updated_at'])
+    }
+
+
+@router.get("/sessions/bundle")
+@cached(ttl=60, key_prefix="sessions_bundle", tags=("sessions",), vary=date.today)
+async def get_sessions_bundle():
+    """
+    Get all active sessions and today's ATHENA THINKING session in one call.
+    Replaces polling /sessions/active and /sessions/thinking separately.
+    """
+    rows = await get_sessions_bundle_async()
+    thinking = None
+    active = []
+    for row in rows:
+        if row.pop('is_thinking'):
+            thinking = {
+                "status": "active",
+                "task_id": row['manus_task_id'],
+                "task_url": row['manus_task_url'],
+                "session_date": str(row['session_date']),
+                "updated_at": str(row['updated_at'])
+            }
+        active.append(row)
+    return {
+        "count": len(active),
+        "active": active,
+        "thinking": thinking or {"status": "no_session"}
+    }
 
 
 @router.post("/sessions/init-table")
 async def init_sessions_table():
     """Initialize the active_sessions table if it doesn't exist."""
-    try:
-        ensure_active_sessions_table()
-        return {"status": "ok", "message": "active_sessions table initialized"}
-    except Exception as e:
-        logger.error(f"Failed to initialize sessions table: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    await asyncio.to_thread(ensure_active_sessions_table)
+    await invalidate("sessions")
+    return {"status": "ok", "message": "active_sessions table initialized"}
 
 
 @router.post("/migrations/broadcasts-table")
-async def run_broadcasts_migration():
+def run_broadcasts_migration():
     """Create the broadcasts table if it doesn't exist."""
-    from db.neon import ensure_broadcasts_table
-    
-    try:
-        ensure_broadcasts_table()
-        return {"status": "ok", "message": "broadcasts table created/verified"}
-    except Exception as e:
-        logger.error(f"Failed to create broadcasts table: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    ensure_broadcasts_table()
+    return {"status": "ok", "message": "broadcasts table created/verified"}
 
 
 @router.post("/migrations/canonical-memory-columns")
-async def run_canonical_memory_columns_migration():
+def run_canonical_memory_columns_migration():
     """Add missing columns to canonical_memory table (content, source, confidence)."""
-    from db.neon import db_cursor
-    
     columns_to_add = [
         ("content", "TEXT"),
         ("source", "TEXT"),
@@ -524,7 +688,7 @@ async def run_canonical_memory_columns_migration():
                 """)
             added.append(col_name)
         except Exception as e:
-            logger.error(f"Failed to add column {col_name}: {e}")
+            logger.error("Failed to add column %s: %s", col_name, e)
             skipped.append(f"{col_name} (error: {str(e)})")
     
     return {
@@ -536,69 +700,56 @@ async def run_canonical_memory_columns_migration():
 
 
 @router.post("/migrations/broadcast-idempotency")
-async def run_broadcast_idempotency_migration():
+def run_broadcast_idempotency_migration():
     """Add unique constraint on broadcasts.session_id for idempotency."""
-    from db.neon import db_cursor
-    
-    try:
-        with db_cursor() as cursor:
-            # Check if constraint already exists
-            cursor.execute("""
-                SELECT 1 FROM information_schema.table_constraints
-                WHERE constraint_name = 'unique_broadcast_session'
-                AND table_name = 'broadcasts'
-            """)
-            if cursor.fetchone():
-                return {"status": "ok", "message": "Constraint already exists"}
+    # One pooled connection and one transaction: if the constraint fails,
+    # the duplicate cleanup is rolled back with it
+    with db_cursor() as cursor:
+        # Check if constraint already exists
+        cursor.execute("""
+            SELECT 1 FROM information_schema.table_constraints
+            WHERE constraint_name = 'unique_broadcast_session'
+            AND table_name = 'broadcasts'
+        """)
+        if cursor.fetchone():
+            return {"status": "ok", "message": "Constraint already exists"}
         
-        # Clean up duplicates first
-        with db_cursor() as cursor:
-            cursor.execute("""
-                SELECT session_id, COUNT(*) as count
-                FROM broadcasts
-                GROUP BY session_id
-                HAVING COUNT(*) > 1
+        conn = cursor.connection
+        delete_cur = conn.cursor()
+        # Pipeline mode: the cleanup and the ALTER go out in one round
+        # trip. It stays inside this transaction and uses no named
+        # prepared statements, so it also works through Neon's pooler.
+        with conn.pipeline():
+            # Keep the newest broadcast per session, in a single statement
+            # (NULL session_ids never conflict, so are kept)
+            delete_cur.execute("""
+                DELETE FROM broadcasts b
+                USING (
+                    SELECT id, ROW_NUMBER() OVER (
+                        PARTITION BY session_id ORDER BY created_at DESC
+                    ) AS rn
+                    FROM broadcasts
+                    WHERE session_id IS NOT NULL
+                ) ranked
+                WHERE b.id = ranked.id AND ranked.rn > 1
             """)
-            duplicates = cursor.fetchall()
-            
-            cleaned = 0
-            for dup in duplicates:
-                session_id = dup['session_id']
-                cursor.execute("""
-                    DELETE FROM broadcasts
-                    WHERE session_id = %s
-                    AND id NOT IN (
-                        SELECT id FROM broadcasts
-                        WHERE session_id = %s
-                        ORDER BY created_at DESC
-                        LIMIT 1
-                    )
-                """, (session_id, session_id))
-                cleaned += cursor.rowcount
-        
-        # Add the constraint
-        with db_cursor() as cursor:
             cursor.execute("""
                 ALTER TABLE broadcasts
                 ADD CONSTRAINT unique_broadcast_session UNIQUE (session_id)
             """)
-        
-        return {
-            "status": "ok",
-            "message": "Unique constraint added",
-            "duplicates_cleaned": cleaned
-        }
-    except Exception as e:
-        logger.error(f"Migration failed: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+        cleaned = delete_cur.rowcount
+    
+    return {
+        "status": "ok",
+        "message": "Unique constraint added",
+        "duplicates_cleaned": cleaned
+    }
 
 
 @router.post("/migrations/add-indexes")
-async def run_indexes_migration():
+def run_indexes_migration():
     """Add performance indexes to the database (each index in separate transaction)."""
-    from db.neon import db_cursor
-    
-    # Each index as a separate statement - will run in separate transactions
+    # Each index as a separate statement - autocommitted one by one
     INDEXES = [
         "CREATE INDEX IF NOT EXISTS idx_session_state_type ON session_state(session_type)",
         "CREATE INDEX IF NOT EXISTS idx_session_state_date ON session_state(session_date)",
@@ -607,6 +758,8 @@ async def run_indexes_migration():
         "CREATE INDEX IF NOT EXISTS idx_observations_category ON observations(category)",
         "CREATE INDEX IF NOT EXISTS idx_observations_collected ON observations(collected_at)",
         "CREATE INDEX IF NOT EXISTS idx_observations_source ON observations(source_type)",
+        # Partial index for /brief action items; matches SQL_ACTION_ITEMS' predicate
+        "CREATE INDEX IF NOT EXISTS idx_observations_action_items ON observations(observed_at DESC) WHERE priority IN ('high', 'urgent')",
         "CREATE INDEX IF NOT EXISTS idx_patterns_type ON patterns(pattern_type)",
         "CREATE INDEX IF NOT EXISTS idx_patterns_detected ON patterns(detected_at)",
         "CREATE INDEX IF NOT EXISTS idx_patterns_confidence ON patterns(confidence)",
@@ -619,6 +772,13 @@ async def run_indexes_migration():
         "CREATE INDEX IF NOT EXISTS idx_entity_notes_valid_until ON entity_notes(valid_until)",
         "CREATE INDEX IF NOT EXISTS idx_entity_notes_created ON entity_notes(created_at)",
         "CREATE INDEX IF NOT EXISTS idx_thinking_log_session_phase ON thinking_log(session_id, phase)",
+        # thinking_log takes writes during think bursts, so build these without
+        # blocking inserts (allowed here because each statement autocommits).
+        # Newest-first per session for /thinking/status and its question list.
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_thinking_log_session_created ON thinking_log(session_id, created_at DESC)",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_thinking_log_questions ON thinking_log(session_id, created_at DESC) WHERE thought_type = 'question'",
+        # Time-window scans for /thinking/recent and /thinking/sessions/active
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_thinking_log_created ON thinking_log(created_at)",
         "CREATE INDEX IF NOT EXISTS idx_performance_metrics_name ON performance_metrics(metric_name)",
         "CREATE INDEX IF NOT EXISTS idx_evolution_log_confidence ON evolution_log(confidence)",
         "CREATE INDEX IF NOT EXISTS idx_evolution_log_category ON evolution_log(category)",
@@ -632,15 +792,24 @@ async def run_indexes_migration():
     created = []
     skipped = []
     
-    for statement in INDEXES:
-        idx_name = statement.split('idx_')[1].split(' ')[0] if 'idx_' in statement else 'unknown'
-        try:
-            # Each index in its own transaction
-            with db_cursor() as cursor:
-                cursor.execute(statement)
-            created.append(f"idx_{idx_name}")
-        except Exception as e:
-            skipped.append({"index": f"idx_{idx_name}", "reason": str(e)})
+    # One dedicated connection for all statements instead of a pool checkout
+    # (health check + BEGIN/COMMIT) per index. Autocommit gives each index its
+    # own transaction, so a failure doesn't abort the ones after it.
+    conn = get_db_connection()
+    if conn is None:
+        raise HTTPException(status_code=503, detail="Database unavailable")
+    try:
+        conn.autocommit = True
+        with conn.cursor() as cursor:
+            for statement in INDEXES:
+                idx_name = statement.split('idx_')[1].split(' ')[0] if 'idx_' in statement else 'unknown'
+                try:
+                    cursor.execute(statement)
+                    created.append(f"idx_{idx_name}")
+                except Exception as e:
+                    skipped.append({"index": f"idx_{idx_name}", "reason": str(e)})
+    finally:
+        conn.close()
     
     return {
         "status": "ok",
@@ -651,28 +820,30 @@ async def run_indexes_migration():
 
 
 @router.post("/trigger/hourly-broadcast")
-async def trigger_hourly_broadcast(background_tasks: BackgroundTasks):
+@idempotent("trigger:hourly-broadcast", ttl=300)
+async def trigger_hourly_broadcast():
     """Manually trigger an hourly thought broadcast."""
-    from jobs.hourly_broadcast import run_hourly_broadcast
-    
-    background_tasks.add_task(run_hourly_broadcast)
+    job = submit_job("jobs.hourly_broadcast:run_hourly_broadcast")
+    hold_until_done(job)
+    invalidate_after(job, "broadcasts")
     return {"message": "Hourly broadcast triggered", "status": "running"}
 
 
 @router.post("/trigger/hourly-broadcast-sync")
+@idempotent("trigger:hourly-broadcast-sync", ttl=300)
 async def trigger_hourly_broadcast_sync():
     """Synchronously trigger an hourly thought broadcast (for testing)."""
-    from jobs.hourly_broadcast import run_hourly_broadcast
-    
     try:
         result = await run_hourly_broadcast()
+        await invalidate("broadcasts")
         return {"message": "Hourly broadcast completed", "result": result}
     except Exception as e:
-        import traceback
-        return {"message": "Hourly broadcast failed", "error": str(e), "traceback": traceback.format_exc()}
+        logger.exception("Hourly broadcast failed")
+        return {"message": "Hourly broadcast failed", "error": str(e)}
 
 
 @router.post("/trigger/editing-session")
+@idempotent("trigger:editing-session", ttl=300)
 async def trigger_editing_session(force: bool = False):
     """
     Trigger an Athena Editing Session for making safe configuration changes.
@@ -684,10 +855,10 @@ async def trigger_editing_session(force: bool = False):
     Args:
         force: If True, create new session even if one exists today.
     """
-    from jobs.editing_session import run_editing_session
 
     try:
         result = await run_editing_session(force=force)
+        await invalidate("sessions")
 
         if result.get("status") == "already_exists":
             return {
@@ -709,15 +880,15 @@ async def trigger_editing_session(force: bool = False):
             "manus_result": result.get("manus_result")
         }
     except Exception as e:
-        import traceback
+        logger.exception("Editing session failed")
         return {
             "message": "Editing session failed",
-            "error": str(e),
-            "traceback": traceback.format_exc()
+            "error": str(e)
         }
 
 
 @router.post("/trigger/teaching-session")
+@idempotent("trigger:teaching-session", ttl=300)
 async def trigger_teaching_session(force: bool = False):
     """
     Trigger an Athena Teaching Session for actively teaching Athena.
@@ -731,10 +902,10 @@ async def trigger_teaching_session(force: bool = False):
     Args:
         force: If True, create new session even if one exists today.
     """
-    from jobs.teaching_session import run_teaching_session
 
     try:
         result = await run_teaching_session(force=force)
+        await invalidate("sessions")
 
         if result.get("status") == "already_exists":
             return {
@@ -753,11 +924,10 @@ async def trigger_teaching_session(force: bool = False):
             "session_name": result.get("session_name")
         }
     except Exception as e:
-        import traceback
+        logger.exception("Teaching session failed")
         return {
             "message": "Teaching session failed",
-            "error": str(e),
-            "traceback": traceback.format_exc()
+            "error": str(e)
         }
 
 
@@ -774,11 +944,8 @@ async def send_message_to_session(
         session_type: Type of session (workspace_agenda, athena_thinking)
         message: The message content to send
     """
-    from db.neon import get_active_session
-    import httpx
-    
     # Get the active session
-    session = get_active_session(session_type)
+    session = await asyncio.to_thread(get_active_session, session_type)
     if not session:
         raise HTTPException(
             status_code=404, 
@@ -793,90 +960,196 @@ async def send_message_to_session(
         )
     
     # Send message to the Manus session
-    try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"{settings.MANUS_API_BASE}/tasks/{task_id}/messages",
-                headers={
-                    "API_KEY": settings.MANUS_API_KEY,
-                    "Content-Type": "application/json"
-                },
-                json={"content": message}
-            )
-            
-            if response.status_code in [200, 201]:
-                return {
-                    "status": "sent",
-                    "task_id": task_id,
-                    "message_length": len(message)
-                }
-            else:
-                logger.warning(f"Failed to send message to Manus: {response.status_code}")
-                return {
-                    "status": "failed",
-                    "error": f"Manus API returned {response.status_code}",
-                    "task_id": task_id
-                }
-    except Exception as e:
-        logger.error(f"Error sending message to session: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    client = get_http_client()
+    async with upstream_slot("manus"):
+        response = await client.post(
+            f"{settings.MANUS_API_BASE}/tasks/{task_id}/messages",
+            headers=MANUS_HEADERS,
+            json={"content": message}
+        )
+    
+    if response.status_code in [200, 201]:
+        return {
+            "status": "sent",
+            "task_id": task_id,
+            "message_length": len(message)
+        }
+    else:
+        logger.warning("Failed to send message to Manus: %s", response.status_code)
+        return {
+            "status": "failed",
+            "error": f"Manus API returned {response.status_code}",
+            "task_id": task_id
+        }
 
 
-@router.get("/broadcasts/notion")
-async def get_notion_broadcasts():
+class NotionText(msgspec.Struct):
+    content: str = ""
+
+
+class NotionRichText(msgspec.Struct):
+    # Only "text" items carry a text object (mentions and equations don't)
+    text: Optional[NotionText] = None
+
+
+class NotionTitleProperty(msgspec.Struct):
+    title: list[NotionRichText] = []
+
+
+class NotionSelect(msgspec.Struct):
+    name: str = ""
+
+
+class NotionSelectProperty(msgspec.Struct):
+    select: Optional[NotionSelect] = None
+
+
+class NotionDate(msgspec.Struct):
+    start: Optional[str] = None
+
+
+class NotionDateProperty(msgspec.Struct):
+    date: Optional[NotionDate] = None
+
+
+class BroadcastProps(msgspec.Struct):
+    """The properties of a broadcasts database page that the API returns."""
+    name: Optional[NotionTitleProperty] = msgspec.field(name="Name", default=None)
+    type: Optional[NotionSelectProperty] = msgspec.field(name="Type", default=None)
+    priority: Optional[NotionSelectProperty] = msgspec.field(name="Priority", default=None)
+    status: Optional[NotionSelectProperty] = msgspec.field(name="Status", default=None)
+    timestamp: Optional[NotionDateProperty] = msgspec.field(name="Timestamp", default=None)
+
+
+class BroadcastPage(msgspec.Struct):
+    """A broadcasts database page; other keys and properties are skipped."""
+    id: str = ""
+    properties: BroadcastProps = msgspec.field(default_factory=BroadcastProps)
+
+
+class NotionQueryResult(msgspec.Struct):
+    """A Notion database query response; other top-level keys are skipped."""
+    results: list[BroadcastPage] = []
+
+
+_notion_query_decoder = msgspec.json.Decoder(NotionQueryResult)
+
+
+def _select_name(prop: Optional[NotionSelectProperty]) -> str:
+    if prop is None or prop.select is None:
+        return ""
+    return prop.select.name
+
+
+def _broadcast_row(page: BroadcastPage) -> dict:
     """
-    Get recent broadcasts from the Athena Broadcasts Notion database.
-    This is a legacy endpoint - prefer /broadcasts/recent for database broadcasts.
+    Flatten a decoded broadcasts page, defaulting unset properties to "".
+    
+    The typed decode already did the traversal in C; this only reads
+    attributes (Notion returns null selects and empty title arrays).
     """
-    import httpx
+    props = page.properties
+    title = props.name.title if props.name is not None else []
+    when = props.timestamp.date if props.timestamp is not None else None
+    return {
+        "id": page.id,
+        "title": title[0].text.content if title and title[0].text is not None else "",
+        "type": _select_name(props.type),
+        "priority": _select_name(props.priority),
+        "status": _select_name(props.status),
+        "timestamp": (when.start or "") if when is not None else "",
+    }
+
+
+NOTION_BROADCASTS_DB_ID = "70b8cb6eff9845d98492ce16c4e2e9aa"
+NOTION_BROADCASTS_KEY = "athena:notion:broadcasts"
+# Several refresh intervals, so a stalled refresher falls back to live fetches
+NOTION_BROADCASTS_TTL = 180  # seconds
+
+
+async def fetch_notion_broadcasts() -> dict:
+    """
+    Query the Athena Broadcasts Notion database for the latest 10 pages.
     
+    Raises:
+        HTTPException: If the API key is missing or Notion returns an error
+    """
     notion_api_key = settings.NOTION_API_KEY
     if not notion_api_key:
         raise HTTPException(status_code=500, detail="NOTION_API_KEY not configured")
     
-    broadcasts_db_id = "70b8cb6eff9845d98492ce16c4e2e9aa"
+    client = get_http_client()
+    async with upstream_slot("notion"):
+        response = await client.post(
+            f"https://api.notion.com/v1/databases/{NOTION_BROADCASTS_DB_ID}/query",
+            headers={
+                "Authorization": f"Bearer {notion_api_key}",
+                "Content-Type": "application/json",
+                "Notion-Version": "2022-06-28"
+            },
+            json={
+                "sorts": [{"property": "Timestamp", "direction": "descending"}],
+                "page_size": 10
+            }
+        )
+    
+    if response.status_code != 200:
+        raise HTTPException(
+            status_code=response.status_code,
+            detail=f"Notion API error: {response.text}"
+        )
+    # Typed decode in C; unused top-level keys are never materialized
+    data = _notion_query_decoder.decode(response.content)
+    broadcasts = [_broadcast_row(page) for page in data.results]
+    return {"count": len(broadcasts), "broadcasts": broadcasts}
+
+
+async def refresh_notion_broadcasts():
+    """
+    Fetch Notion broadcasts and store the JSON in Redis for /broadcasts/notion.
     
+    Run every minute by the scheduler, so request latency and Notion's rate
+    limit no longer depend on how often the endpoint is polled. No-op without
+    Redis or a Notion key.
+    """
+    client = get_redis()
+    if client is None or not settings.NOTION_API_KEY:
+        return
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"https://api.notion.com/v1/databases/{broadcasts_db_id}/query",
-                headers={
-                    "Authorization": f"Bearer {notion_api_key}",
-                    "Content-Type": "application/json",
-                    "Notion-Version": "2022-06-28"
-                },
-                json={
-                    "sorts": [{"property": "Timestamp", "direction": "descending"}],
-                    "page_size": 10
-                }
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                broadcasts = []
-                for page in data.get("results", []):
-                    props = page.get("properties", {})
-                    broadcasts.append({
-                        "id": page.get("id"),
-                        "title": props.get("Name", {}).get("title", [{}])[0].get("text", {}).get("content", ""),
-                        "type": props.get("Type", {}).get("select", {}).get("name", ""),
-                        "priority": props.get("Priority", {}).get("select", {}).get("name", ""),
-                        "status": props.get("Status", {}).get("select", {}).get("name", ""),
-                        "timestamp": props.get("Timestamp", {}).get("date", {}).get("start", "")
-                    })
-                return {"count": len(broadcasts), "broadcasts": broadcasts}
-            else:
-                raise HTTPException(
-                    status_code=response.status_code,
-                    detail=f"Notion API error: {response.text}"
-                )
-    except HTTPException:
-        raise
+        result = await fetch_notion_broadcasts()
+        await client.setex(NOTION_BROADCASTS_KEY, NOTION_BROADCASTS_TTL, orjson.dumps(result))
     except Exception as e:
-        logger.error(f"Error fetching broadcasts: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+        logger.warning("Notion broadcasts refresh failed: %s", e)
 
 
+@router.get("/broadcasts/notion")
+async def get_notion_broadcasts():
+    """
+    Get recent broadcasts from the Athena Broadcasts Notion database.
+    This is a legacy endpoint - prefer /broadcasts/recent for database broadcasts.
+    
+    Served from the copy the scheduler keeps in Redis; falls back to a live
+    Notion query when Redis is not configured or the copy is missing.
+    """
+    client = get_redis()
+    if client is not None:
+        try:
+            payload = await client.get(NOTION_BROADCASTS_KEY)
+        except Exception as e:
+            logger.warning("Redis get failed for %s: %s", NOTION_BROADCASTS_KEY, e)
+            payload = None
+        if payload is not None:
+            return Response(content=payload, media_type="application/json")
+    
+    result = await fetch_notion_broadcasts()
+    
+    if client is not None:
+        try:
+            await client.setex(NOTION_BROADCASTS_KEY, NOTION_BROADCASTS_TTL, orjson.dumps(result))
+        except Exception as e:
+            logger.warning("Redis set failed for %s: %s", NOTION_BROADCASTS_KEY, e)
+    return result
+
 
 # =============================================================================
 # DATABASE BROADCASTS - For ATHENA THINKING to fetch hourly broadcasts
@@ -888,44 +1161,31 @@ async def get_unread_broadcasts():
     Get broadcasts that haven't been read by ATHENA THINKING yet.
     This is the primary endpoint for the THINKING session to check for new broadcasts.
     """
-    from db.neon import get_unread_broadcasts, mark_broadcasts_read
+    # Fetched and marked as read in one UPDATE ... RETURNING
+    broadcasts = await asyncio.to_thread(claim_unread_broadcasts, limit=20)
+    if broadcasts:
+        await invalidate("broadcasts")
     
-    try:
-        broadcasts = get_unread_broadcasts(limit=20)
-        
-        # Mark them as read
-        if broadcasts:
-            broadcast_ids = [b['id'] for b in broadcasts]
-            mark_broadcasts_read(broadcast_ids)
-        
-        return {
-            "count": len(broadcasts),
-            "broadcasts": broadcasts,
-            "marked_as_read": len(broadcasts)
-        }
-    except Exception as e:
-        logger.error(f"Failed to get unread broadcasts: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return {
+        "count": len(broadcasts),
+        "broadcasts": broadcasts,
+        "marked_as_read": len(broadcasts)
+    }
 
 
 @router.get("/broadcasts/recent")
-async def get_recent_db_broadcasts(hours: int = 24, limit: int = 20):
+@cached(ttl=60, key_prefix="broadcasts_recent", tags=("broadcasts",))
+async def get_recent_db_broadcasts(fmt: ResponseFormat, hours: int = 24, limit: int = 20):
     """
     Get recent broadcasts from the database within a time window.
     Useful for reviewing broadcast history.
     """
-    from db.neon import get_recent_broadcasts
-    
-    try:
-        broadcasts = get_recent_broadcasts(hours=hours, limit=limit)
-        return {
-            "count": len(broadcasts),
-            "hours": hours,
-            "broadcasts": broadcasts
-        }
-    except Exception as e:
-        logger.error(f"Failed to get recent broadcasts: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    broadcasts = await asyncio.to_thread(get_recent_broadcasts, hours=hours, limit=limit)
+    return {
+        "count": len(broadcasts),
+        "hours": hours,
+        "broadcasts": broadcasts
+    }
 
 
 @router.get("/broadcasts/stats")
@@ -933,14 +1193,8 @@ async def get_broadcast_stats():
     """
     Get broadcast statistics for monitoring.
     """
-    from db.neon import get_broadcast_stats
-    
-    try:
-        stats = get_broadcast_stats()
-        return stats
-    except Exception as e:
-        logger.error(f"Failed to get broadcast stats: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    stats = await asyncio.to_thread(fetch_broadcast_stats)
+    return stats
 
 
 @router.get("/sentry-test")
@@ -4,6 +4,7 @@ Provides brain-driven context for Manus sessions at startup.
 This replaces the Notion-dependent initialization flow.
 """
 
+import asyncio
 import logging
 from datetime import datetime
 from typing import Optional
@@ -11,19 +12,24 @@ from typing import Optional
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
 
+from api.cache import L1_MAX_TTL, cached, local_cache, serialized_response
 from db.brain import (
     get_full_brain_context,
     get_session_brief,
     get_brain_status,
     get_core_identity,
     get_boundaries,
+    get_boundary_counts,
     get_values,
     get_workflows,
+    get_workflow_counts,
     get_pending_actions,
     get_evolution_proposals,
     get_session_state,
     update_session_state,
 )
+from integrations.brain_context import generate_brain_system_prompt
+from utils.clock import iso_now
 
 logger = logging.getLogger("athena.api.session_init")
 
@@ -61,7 +67,35 @@ class SessionHandoffRequest(BaseModel):
 # ENDPOINTS
 # =============================================================================
 
-@router.get("/init/{session_type}", response_model=SessionInitResponse)
+# session_type -> generated system prompt. The prompt is rebuilt from every
+# brain layer, so reuse it for up to L1_MAX_TTL (30s; the local cache cap) or
+# until a brain mutation invalidates the tag. Its "Generated:" line is when
+# that snapshot was built, not the request time; initialized_at carries the
+# request time.
+_system_prompts = local_cache("session_system_prompt", ttl=L1_MAX_TTL, tags=("brain",), maxsize=16)
+
+
+def _session_init_data(session_type: str) -> dict:
+    """Blocking brain reads for /session/init (run in a worker thread)."""
+    status = get_brain_status()
+    if not status:
+        raise HTTPException(status_code=503, detail="Brain not available")
+    
+    # Counts are aggregated in SQL rather than loading every row
+    boundary_counts = get_boundary_counts()
+    workflow_counts = get_workflow_counts()
+    return {
+        "status": status,
+        "brief": get_session_brief(session_type),
+        "hard_count": boundary_counts['hard'],
+        "soft_count": boundary_counts['soft'],
+        "enabled_count": workflow_counts['enabled'],
+    }
+
+
+# Documented through responses= so the result skips re-validation; the dict is
+# encoded once by orjson
+@router.get("/init/{session_type}", response_model=None, responses={200: {"model": SessionInitResponse}})
 async def initialize_session(session_type: str):
     """
     Initialize a Manus session with brain context.
@@ -77,49 +111,34 @@ async def initialize_session(session_type: str):
     """
     logger.info(f"Initializing session: {session_type}")
     
-    try:
-        # Get brain status
-        status = get_brain_status()
-        if not status:
-            raise HTTPException(status_code=503, detail="Brain not available")
-        
-        # Get session brief
-        brief = get_session_brief(session_type)
-        
-        # Generate system prompt
-        from integrations.brain_context import generate_brain_system_prompt
-        system_prompt = generate_brain_system_prompt(session_type)
-        
-        # Get counts
-        boundaries = get_boundaries()
-        hard_count = len([b for b in boundaries if b['boundary_type'] == 'hard'])
-        soft_count = len([b for b in boundaries if b['boundary_type'] == 'soft'])
-        
-        workflows = get_workflows()
-        enabled_count = len([w for w in workflows if w['enabled']])
-        
-        return SessionInitResponse(
-            session_type=session_type,
-            brain_version=status.get('version', '2.0'),
-            brain_status=status.get('status', 'unknown'),
-            identity=brief['identity'],
-            boundaries_summary={'hard': hard_count, 'soft': soft_count},
-            values_count=len(brief['values']),
-            workflows_enabled=enabled_count,
-            pending_actions_count=brief['pending_actions_count'],
-            evolution_proposals_count=brief['evolution_proposals_count'],
-            handoff_context=brief.get('handoff_context'),
-            system_prompt=system_prompt,
-            initialized_at=datetime.utcnow().isoformat()
-        )
-        
-    except Exception as e:
-        logger.error(f"Session initialization failed: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    data = await asyncio.to_thread(_session_init_data, session_type)
+    status = data["status"]
+    brief = data["brief"]
+    
+    # Generate system prompt (cached per session type)
+    system_prompt = _system_prompts.get(session_type)
+    if system_prompt is None:
+        system_prompt = await asyncio.to_thread(generate_brain_system_prompt, session_type)
+        _system_prompts[session_type] = system_prompt
+    
+    return serialized_response({
+        "session_type": session_type,
+        "brain_version": status.get('version', '2.0'),
+        "brain_status": status.get('status', 'unknown'),
+        "identity": brief['identity'],
+        "boundaries_summary": {'hard': data["hard_count"], 'soft': data["soft_count"]},
+        "values_count": len(brief['values']),
+        "workflows_enabled": data["enabled_count"],
+        "pending_actions_count": brief['pending_actions_count'],
+        "evolution_proposals_count": brief['evolution_proposals_count'],
+        "handoff_context": brief.get('handoff_context'),
+        "system_prompt": system_prompt,
+        "initialized_at": datetime.utcnow().isoformat()
+    })
 
 
 @router.post("/handoff")
-async def store_session_handoff(request: SessionHandoffRequest):
+def store_session_handoff(request: SessionHandoffRequest):
     """
     Store handoff context for the next session.
     
@@ -127,81 +146,68 @@ async def store_session_handoff(request: SessionHandoffRequest):
     """
     logger.info(f"Storing handoff for session type: {request.session_type}")
     
-    try:
-        update_session_state(
-            session_type=request.session_type,
-            handoff_context=request.handoff_context,
-            key_learnings=request.key_learnings
-        )
-        
-        return {
-            "status": "success",
-            "session_type": request.session_type,
-            "stored_at": datetime.utcnow().isoformat()
-        }
-        
-    except Exception as e:
-        logger.error(f"Failed to store handoff: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    update_session_state(
+        session_type=request.session_type,
+        handoff_context=request.handoff_context,
+        key_learnings=request.key_learnings
+    )
+    
+    return {
+        "status": "success",
+        "session_type": request.session_type,
+        "stored_at": datetime.utcnow().isoformat()
+    }
 
 
+# Brain layers change rarely: cache the assembled context until a brain
+# mutation invalidates it (TTL as a backstop for jobs that write directly)
 @router.get("/context/full")
+@cached(ttl=300, key_prefix="session_context_full", tags=("brain",))
 async def get_full_context():
     """
     Get the complete brain context.
     
     This returns all brain data for sessions that need full access.
     """
-    try:
-        context = get_full_brain_context()
-        return {
-            "status": "success",
-            "context": context,
-            "retrieved_at": datetime.utcnow().isoformat()
-        }
-    except Exception as e:
-        logger.error(f"Failed to get full context: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    context = await asyncio.to_thread(get_full_brain_context)
+    return {
+        "status": "success",
+        "context": context,
+        "retrieved_at": datetime.utcnow().isoformat()
+    }
+
+
+def _identity_context() -> dict:
+    return {
+        "identity": get_core_identity(),
+        "boundaries": get_boundaries(),
+        "values": get_values()
+    }
 
 
 @router.get("/context/identity")
+@cached(ttl=300, key_prefix="session_context_identity", tags=("brain",))
 async def get_identity_context():
     """Get just the identity layer context."""
-    try:
-        identity = get_core_identity()
-        boundaries = get_boundaries()
-        values = get_values()
-        
-        return {
-            "identity": identity,
-            "boundaries": boundaries,
-            "values": values
-        }
-    except Exception as e:
-        logger.error(f"Failed to get identity context: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return await asyncio.to_thread(_identity_context)
 
 
 @router.get("/context/operational")
-async def get_operational_context():
+def get_operational_context():
     """Get operational context (workflows, pending items)."""
-    try:
-        workflows = get_workflows()
-        pending_actions = get_pending_actions()
-        evolution_proposals = get_evolution_proposals()
-        
-        return {
-            "workflows": workflows,
-            "pending_actions": pending_actions,
-            "evolution_proposals": evolution_proposals
-        }
-    except Exception as e:
-        logger.error(f"Failed to get operational context: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    workflows = get_workflows()
+    pending_actions = get_pending_actions()
+    evolution_proposals = get_evolution_proposals()
+    
+    return serialized_response({
+        "workflows": workflows,
+        "pending_actions": pending_actions,
+        "evolution_proposals": evolution_proposals
+    })
 
 
 @router.get("/health")
-async def session_health():
+def session_health():
     """Check if session initialization is available."""
     try:
         status = get_brain_status()
@@ -209,11 +215,11 @@ async def session_health():
             "status": "healthy" if status else "degraded",
             "brain_status": status.get('status') if status else 'unavailable',
             "brain_version": status.get('version') if status else 'unknown',
-            "checked_at": datetime.utcnow().isoformat()
+            "checked_at": iso_now()
         }
     except Exception as e:
         return {
             "status": "unhealthy",
             "error": str(e),
-            "checked_at": datetime.utcnow().isoformat()
+            "checked_at": iso_now()
         }
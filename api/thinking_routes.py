@@ -3,20 +3,27 @@ Athena Server v2 - Think Bursts API
 Allows ATHENA THINKING to broadcast thoughts in real-time.
 """
 
-import json
 import logging
 from datetime import datetime, timedelta
 from typing import Optional, List
-from fastapi import APIRouter, HTTPException
+import orjson
+from fastapi import APIRouter, HTTPException, Response
+from psycopg.rows import dict_row
+from psycopg.types.json import Jsonb
 from pydantic import BaseModel
 
+from api.cache import serialized_response
 from api.errors import handle_api_errors
-from db.neon import db_cursor
+from api.thought_writer import write_thought
+from db.neon import PREPARE_HOT_QUERIES, async_db_connection, async_db_cursor
 
 logger = logging.getLogger("athena.api.thinking")
 
 router = APIRouter(prefix="/thinking", tags=["thinking"])
 
+# Batches larger than this are written with COPY instead of INSERTs
+COPY_THRESHOLD = 50
+
 
 class ThoughtCreate(BaseModel):
     """Model for creating a new thought."""
@@ -28,6 +35,11 @@ class ThoughtCreate(BaseModel):
     metadata: Optional[dict] = None
 
 
+def _metadata_param(metadata: Optional[dict]) -> Optional[Jsonb]:
+    """Wrap thought metadata for the JSONB column, encoded by orjson."""
+    return Jsonb(metadata, dumps=orjson.dumps) if metadata else None
+
+
 class ThoughtResponse(BaseModel):
     """Model for thought response."""
     id: str
@@ -49,26 +61,17 @@ async def log_thought(thought: ThoughtCreate):
     """
     logger.info(f"Logging thought: type={thought.thought_type}, session={thought.session_id}")
 
-    with db_cursor() as cursor:
-        # Serialize metadata to JSON string for JSONB column
-        metadata_json = json.dumps(thought.metadata) if thought.metadata else None
-
-        cursor.execute("""
-            INSERT INTO thinking_log (session_id, thought_type, content, confidence, phase, metadata)
-            VALUES (%s, %s, %s, %s, %s, %s)
-            RETURNING id, created_at
-        """, (
-            thought.session_id,
-            thought.thought_type,
-            thought.content,
-            thought.confidence,
-            thought.phase,
-            metadata_json
-        ))
-
-        result = cursor.fetchone()
-        thought_id = str(result['id'])
-        created_at = result['created_at'].isoformat() if result['created_at'] else None
+    # Committed together with any other thoughts logged in the same ~20ms
+    thought_id, created_at = await write_thought((
+        thought.session_id,
+        thought.thought_type,
+        thought.content,
+        thought.confidence,
+        thought.phase,
+        _metadata_param(thought.metadata)
+    ))
+    thought_id = str(thought_id)
+    created_at = created_at.isoformat() if created_at else None
 
     logger.info(f"Thought logged: id={thought_id}")
 
@@ -79,6 +82,81 @@ async def log_thought(thought: ThoughtCreate):
     }
 
 
+@router.post("/log/batch")
+@handle_api_errors("log thought batch")
+async def log_thought_batch(thoughts: List[ThoughtCreate]):
+    """
+    Log many thoughts in one request.
+    
+    Large batches are streamed with COPY, which avoids per-row statement
+    overhead; small batches use a single executemany INSERT.
+    """
+    if not thoughts:
+        return {"count": 0, "message": "No thoughts to log"}
+
+    rows = [
+        (
+            t.session_id,
+            t.thought_type,
+            t.content,
+            t.confidence,
+            t.phase,
+            _metadata_param(t.metadata),
+        )
+        for t in thoughts
+    ]
+
+    async with async_db_cursor() as cursor:
+        if len(rows) > COPY_THRESHOLD:
+            async with cursor.copy("""
+                COPY thinking_log (session_id, thought_type, content, confidence, phase, metadata)
+                FROM STDIN
+            """) as copy:
+                for row in rows:
+                    await copy.write_row(row)
+        else:
+            await cursor.executemany("""
+                INSERT INTO thinking_log (session_id, thought_type, content, confidence, phase, metadata)
+                VALUES (%s, %s, %s, %s, %s, %s)
+            """, rows)
+
+    logger.info(f"Thought batch logged: count={len(rows)}")
+
+    return {
+        "count": len(rows),
+        "message": "Thoughts logged successfully"
+    }
+
+
+# /thinking/status queries, polled by sessions during think bursts: prepared
+# server-side so repeat polls skip parse/plan
+# Recent thoughts
+SQL_STATUS_THOUGHTS = """
+    SELECT id, thought_type, content, confidence, phase, metadata, created_at
+    FROM thinking_log
+    WHERE session_id = %s
+    ORDER BY created_at DESC
+    LIMIT %s
+"""
+
+# Thought counts by type
+SQL_STATUS_COUNTS = """
+    SELECT thought_type, COUNT(*) as count
+    FROM thinking_log
+    WHERE session_id = %s
+    GROUP BY thought_type
+"""
+
+# Pending questions
+SQL_STATUS_QUESTIONS = """
+    SELECT id, content, created_at
+    FROM thinking_log
+    WHERE session_id = %s AND thought_type = 'question'
+    ORDER BY created_at DESC
+    LIMIT 5
+"""
+
+
 @router.get("/status/{session_id}")
 @handle_api_errors("get thinking status")
 async def get_thinking_status(session_id: str, limit: int = 10):
@@ -86,69 +164,84 @@ async def get_thinking_status(session_id: str, limit: int = 10):
     Get the current thinking status for a session.
     Returns recent thoughts and current phase.
     """
-    with db_cursor() as cursor:
-        # Get recent thoughts
-        cursor.execute("""
-            SELECT id, thought_type, content, confidence, phase, metadata, created_at
-            FROM thinking_log
-            WHERE session_id = %s
-            ORDER BY created_at DESC
-            LIMIT %s
-        """, (session_id, limit))
-
-        rows = cursor.fetchall()
-
-        thoughts = []
-        current_phase = None
-
-        for row in rows:
-            thought = {
-                "id": str(row['id']),
-                "type": row['thought_type'],
-                "content": row['content'],
-                "confidence": row['confidence'],
-                "phase": row['phase'],
-                "metadata": row['metadata'],
-                "timestamp": row['created_at'].isoformat() if row['created_at'] else None
-            }
-            thoughts.append(thought)
-
-            # Track the most recent phase
-            if row['phase'] and not current_phase:
-                current_phase = row['phase']
-
-        # Get thought counts by type
-        cursor.execute("""
-            SELECT thought_type, COUNT(*) as count
-            FROM thinking_log
-            WHERE session_id = %s
-            GROUP BY thought_type
-        """, (session_id,))
-
-        type_counts = {row['thought_type']: row['count'] for row in cursor.fetchall()}
-
-        # Get pending questions
-        cursor.execute("""
-            SELECT id, content, created_at
-            FROM thinking_log
-            WHERE session_id = %s AND thought_type = 'question'
-            ORDER BY created_at DESC
-            LIMIT 5
-        """, (session_id,))
-
-        pending_questions = [
-            {"id": str(row['id']), "content": row['content'], "timestamp": row['created_at'].isoformat() if row['created_at'] else None}
-            for row in cursor.fetchall()
-        ]
-
-    return {
+    async with async_db_connection() as conn:
+        cursor = conn.cursor(row_factory=dict_row)
+        counts_cur = conn.cursor(row_factory=dict_row)
+        questions_cur = conn.cursor(row_factory=dict_row)
+
+        # Pipeline mode: all three queries go out in a single round trip
+        async with conn.pipeline():
+            await cursor.execute(SQL_STATUS_THOUGHTS, (session_id, limit), prepare=PREPARE_HOT_QUERIES)
+            await counts_cur.execute(SQL_STATUS_COUNTS, (session_id,), prepare=PREPARE_HOT_QUERIES)
+            await questions_cur.execute(SQL_STATUS_QUESTIONS, (session_id,), prepare=PREPARE_HOT_QUERIES)
+
+        rows = await cursor.fetchall()
+        count_rows = await counts_cur.fetchall()
+        question_rows = await questions_cur.fetchall()
+
+    thoughts = []
+    current_phase = None
+
+    for row in rows:
+        thought = {
+            "id": str(row['id']),
+            "type": row['thought_type'],
+            "content": row['content'],
+            "confidence": row['confidence'],
+            "phase": row['phase'],
+            "metadata": row['metadata'],
+            "timestamp": row['created_at'].isoformat() if row['created_at'] else None
+        }
+        thoughts.append(thought)
+
+        # Track the most recent phase
+        if row['phase'] and not current_phase:
+            current_phase = row['phase']
+
+    type_counts = {row['thought_type']: row['count'] for row in count_rows}
+
+    pending_questions = [
+        {"id": str(row['id']), "content": row['content'], "timestamp": row['created_at'].isoformat() if row['created_at'] else None}
+        for row in question_rows
+    ]
+
+    return serialized_response({
         "session_id": session_id,
         "status": "active" if thoughts else "no_activity",
         "current_phase": current_phase,
         "thought_counts": type_counts,
         "recent_thoughts": thoughts,
         "pending_questions": pending_questions
-    }
+    })
+
+
+# /thinking/recent builds its whole response body in Postgres: the JSON text is
+# passed straight through, with no row hydration or re-encoding in Python
+_RECENT_THOUGHTS_JSON = """
+    SELECT json_build_object(
+        'count', COUNT(*),
+        'hours', %s::int,
+        'thoughts', COALESCE(json_agg(json_build_object(
+            'id', id::text,
+            'session_id', session_id,
+            'type', thought_type,
+            'content', content,
+            'confidence', confidence,
+            'phase', phase,
+            'metadata', metadata,
+            'timestamp', created_at
+        ) ORDER BY created_at DESC), '[]'::json)
+    )::text
+    FROM (
+        SELECT id, session_id, thought_type, content, confidence, phase, metadata, created_at
+        FROM thinking_log
+        WHERE created_at > %s{type_filter}
+        ORDER BY created_at DESC
+        LIMIT %s
+    ) t
+"""
+SQL_RECENT_THOUGHTS_JSON = _RECENT_THOUGHTS_JSON.format(type_filter="")
+SQL_RECENT_THOUGHTS_BY_TYPE_JSON = _RECENT_THOUGHTS_JSON.format(type_filter=" AND thought_type = %s")
 
 
 @router.get("/recent")
@@ -158,47 +251,51 @@ async def get_recent_thoughts(hours: int = 24, thought_type: Optional[str] = Non
     Get recent thoughts across all sessions.
     Useful for monitoring Athena's overall thinking activity.
     """
-    with db_cursor() as cursor:
-        since = datetime.utcnow() - timedelta(hours=hours)
+    since = datetime.utcnow() - timedelta(hours=hours)
 
+    async with async_db_cursor(dict_cursor=False) as cursor:
         if thought_type:
-            cursor.execute("""
-                SELECT id, session_id, thought_type, content, confidence, phase, metadata, created_at
-                FROM thinking_log
-                WHERE created_at > %s AND thought_type = %s
-                ORDER BY created_at DESC
-                LIMIT %s
-            """, (since, thought_type, limit))
+            await cursor.execute(
+                SQL_RECENT_THOUGHTS_BY_TYPE_JSON, (hours, since, thought_type, limit), prepare=PREPARE_HOT_QUERIES
+            )
         else:
-            cursor.execute("""
-                SELECT id, session_id, thought_type, content, confidence, phase, metadata, created_at
-                FROM thinking_log
-                WHERE created_at > %s
-                ORDER BY created_at DESC
-                LIMIT %s
-            """, (since, limit))
-
-        rows = cursor.fetchall()
-
-        thoughts = [
-            {
-                "id": str(row['id']),
-                "session_id": row['session_id'],
-                "type": row['thought_type'],
-                "content": row['content'],
-                "confidence": row['confidence'],
-                "phase": row['phase'],
-                "metadata": row['metadata'],
-                "timestamp": row['created_at'].isoformat() if row['created_at'] else None
-            }
-            for row in rows
-        ]
-
-    return {
-        "count": len(thoughts),
-        "hours": hours,
-        "thoughts": thoughts
-    }
+            await cursor.execute(SQL_RECENT_THOUGHTS_JSON, (hours, since, limit), prepare=PREPARE_HOT_QUERIES)
+        (payload,) = await cursor.fetchone()
+
+    return Response(content=payload, media_type="application/json")
+
+
+SQL_ACTIVE_SESSIONS_JSON = """
+    SELECT json_build_object(
+        'count', COUNT(*),
+        'hours', %s::int,
+        'sessions', COALESCE(json_agg(json_build_object(
+            'session_id', session_id,
+            'thought_count', thought_count,
+            'first_thought', first_thought,
+            'last_thought', last_thought,
+            'thought_types', thought_types
+        ) ORDER BY last_thought DESC), '[]'::json)
+    )::text
+    FROM (
+        SELECT
+            session_id,
+            SUM(n)::bigint as thought_count,
+            MIN(first_at) as first_thought,
+            MAX(last_at) as last_thought,
+            array_agg(thought_type ORDER BY thought_type) as thought_types
+        FROM (
+            -- One hash-aggregate pass per (session, type); the outer groups are
+            -- then only a handful of rows each, so no DISTINCT sort over the log
+            SELECT session_id, thought_type, COUNT(*) as n,
+                   MIN(created_at) as first_at, MAX(created_at) as last_at
+            FROM thinking_log
+            WHERE created_at > %s
+            GROUP BY session_id, thought_type
+        ) by_type
+        GROUP BY session_id
+    ) s
+"""
 
 
 @router.get("/sessions/active")
@@ -207,40 +304,14 @@ async def get_active_thinking_sessions(hours: int = 24):
     """
     Get all sessions with thinking activity in the last N hours.
     """
-    with db_cursor() as cursor:
-        since = datetime.utcnow() - timedelta(hours=hours)
-
-        cursor.execute("""
-            SELECT
-                session_id,
-                COUNT(*) as thought_count,
-                MIN(created_at) as first_thought,
-                MAX(created_at) as last_thought,
-                array_agg(DISTINCT thought_type) as thought_types
-            FROM thinking_log
-            WHERE created_at > %s
-            GROUP BY session_id
-            ORDER BY MAX(created_at) DESC
-        """, (since,))
-
-        rows = cursor.fetchall()
-
-        sessions = [
-            {
-                "session_id": row['session_id'],
-                "thought_count": row['thought_count'],
-                "first_thought": row['first_thought'].isoformat() if row['first_thought'] else None,
-                "last_thought": row['last_thought'].isoformat() if row['last_thought'] else None,
-                "thought_types": row['thought_types'] if row['thought_types'] else []
-            }
-            for row in rows
-        ]
+    since = datetime.utcnow() - timedelta(hours=hours)
 
-    return {
-        "count": len(sessions),
-        "hours": hours,
-        "sessions": sessions
-    }
+    # Like /recent, Postgres builds the response body
+    async with async_db_cursor(dict_cursor=False) as cursor:
+        await cursor.execute(SQL_ACTIVE_SESSIONS_JSON, (hours, since), prepare=PREPARE_HOT_QUERIES)
+        (payload,) = await cursor.fetchone()
+
+    return Response(content=payload, media_type="application/json")
 
 
 @router.delete("/session/{session_id}")
@@ -250,13 +321,13 @@ async def clear_session_thoughts(session_id: str):
     Clear all thoughts for a session.
     Useful for resetting or cleanup.
     """
-    with db_cursor() as cursor:
-        cursor.execute("""
+    async with async_db_cursor() as cursor:
+        await cursor.execute("""
             DELETE FROM thinking_log WHERE session_id = %s
             RETURNING id
         """, (session_id,))
 
-        deleted = cursor.fetchall()
+        deleted = await cursor.fetchall()
 
     return {
         "message": f"Cleared {len(deleted)} thoughts for session {session_id}",
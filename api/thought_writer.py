@@ -0,0 +1,139 @@
+"""
+Athena Server v2 - Batched Thought Writes
+
+Group commit for /thinking/log. During think bursts a session logs many
+single thoughts per second, and each INSERT used to pay its own round trip
+and commit. Here each call queues its row and waits; a background task
+collects whatever arrives within BATCH_WINDOW (up to MAX_BATCH rows) and
+writes the batch in one pipelined round trip and one transaction, then hands
+each caller its own id and created_at.
+
+Like the async pool, the writer starts on first use and is stopped by the
+app lifespan (close_thought_writer), which flushes anything still queued.
+"""
+
+import asyncio
+import logging
+from typing import List, Optional, Tuple
+
+from psycopg.errors import DataError, IntegrityError
+
+from db.neon import async_db_cursor
+
+logger = logging.getLogger("athena.api.thought_writer")
+
+BATCH_WINDOW = 0.02  # seconds to wait for more thoughts after the first
+MAX_BATCH = 100
+
+INSERT_THOUGHT = """
+    INSERT INTO thinking_log (session_id, thought_type, content, confidence, phase, metadata)
+    VALUES (%s, %s, %s, %s, %s, %s)
+    RETURNING id, created_at
+"""
+
+_queue: Optional[asyncio.Queue] = None
+_worker: Optional[asyncio.Task] = None
+
+
+async def _insert_batch(rows: List[tuple]) -> List[tuple]:
+    """Insert rows in one transaction; returns (id, created_at) per row, in order."""
+    async with async_db_cursor(dict_cursor=False) as cursor:
+        # returning=True pipelines the INSERTs and keeps one result set per row;
+        # executemany prepares the statement, so each pooled connection plans it once
+        await cursor.executemany(INSERT_THOUGHT, rows, returning=True)
+        results = []
+        while True:
+            results.append(await cursor.fetchone())
+            if not cursor.nextset():
+                break
+        return results
+
+
+def _fail(batch: List[Tuple[tuple, asyncio.Future]], error: Exception):
+    for _, future in batch:
+        if not future.done():
+            future.set_exception(error)
+
+
+async def _write(batch: List[Tuple[tuple, asyncio.Future]]):
+    try:
+        results = await _insert_batch([row for row, _ in batch])
+    except (DataError, IntegrityError) as e:
+        if len(batch) == 1:
+            _fail(batch, e)
+            return
+        # Don't fail the whole batch for one bad row: retry them one by one
+        logger.warning(f"Thought batch of {len(batch)} failed ({e}); retrying rows individually")
+        for item in batch:
+            await _write([item])
+        return
+    except Exception as e:
+        # Connection/pool errors would fail every retry too (each after the
+        # pool timeout), holding up the writer: fail the batch at once
+        logger.error(f"Thought batch of {len(batch)} failed: {e}")
+        _fail(batch, e)
+        return
+
+    for (_, future), result in zip(batch, results):
+        if not future.done():
+            future.set_result(result)
+
+
+async def _run():
+    """Drain the queue: one batch per BATCH_WINDOW, or sooner when full."""
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await _queue.get()]
+        deadline = loop.time() + BATCH_WINDOW
+        while len(batch) < MAX_BATCH:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(_queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        try:
+            await _write(batch)
+        finally:
+            for _ in batch:
+                _queue.task_done()
+
+
+def _ensure_worker():
+    global _queue, _worker
+    if _worker is None or _worker.done():
+        if _queue is None:
+            _queue = asyncio.Queue()
+        _worker = asyncio.create_task(_run())
+
+
+async def write_thought(row: tuple) -> tuple:
+    """
+    Insert one thinking_log row as part of the next batch.
+
+    Args:
+        row: (session_id, thought_type, content, confidence, phase, metadata)
+
+    Returns:
+        (id, created_at) of the inserted row
+
+    Raises:
+        Exception: The database error if this row could not be inserted
+    """
+    _ensure_worker()
+    future = asyncio.get_running_loop().create_future()
+    await _queue.put((row, future))
+    return await future
+
+
+async def close_thought_writer():
+    """Flush queued thoughts and stop the batch writer."""
+    global _queue, _worker
+    if _worker is not None:
+        if not _worker.done():
+            await _queue.join()
+            _worker.cancel()
+        _worker = None
+        _queue = None
+        logger.info("Thought writer stopped")
@@ -18,6 +18,11 @@ router = APIRouter()
 
 # Get webhook secret from environment
 WEBHOOK_SECRET = os.getenv("GITHUB_WEBHOOK_SECRET", "")
+_WEBHOOK_KEY = WEBHOOK_SECRET.encode()
+
+# "sha256=" followed by the 64 hex chars of the digest
+SIGNATURE_PREFIX = "sha256="
+SIGNATURE_LENGTH = len(SIGNATURE_PREFIX) + 64
 
 
 @router.post("/webhooks/github")
@@ -157,18 +162,22 @@ def verify_signature(payload: bytes, signature: Optional[str]) -> bool:
         logger.error("GITHUB_WEBHOOK_SECRET not configured")
         return False
     
-    # Compute expected signature
-    expected = "sha256=" + hmac.new(
-        WEBHOOK_SECRET.encode(),
-        payload,
-        hashlib.sha256
-    ).hexdigest()
+    if not signature.startswith(SIGNATURE_PREFIX) or len(signature) != SIGNATURE_LENGTH:
+        logger.warning("Malformed signature header")
+        return False
+    
+    try:
+        provided = bytes.fromhex(signature[len(SIGNATURE_PREFIX):])
+    except ValueError:
+        logger.warning("Malformed signature header")
+        return False
     
-    # Constant-time comparison to prevent timing attacks
-    is_valid = hmac.compare_digest(expected, signature)
+    # Compare raw digests in constant time (no hex encoding or concatenation)
+    expected = hmac.new(_WEBHOOK_KEY, payload, hashlib.sha256).digest()
+    is_valid = hmac.compare_digest(expected, provided)
     
     if not is_valid:
-        logger.warning(f"Signature mismatch: expected {expected[:20]}..., got {signature[:20]}...")
+        logger.warning(f"Signature mismatch: got {signature[:20]}...")
     
     return is_valid
 
@@ -195,7 +204,7 @@ async def sync_from_github_task(
     logger.info(f"Message: {commit_message}")
     
     try:
-        # Import sync script
+        # Kept lazy: the script imports db.neon.get_connection, which doesn't exist
         from scripts.sync_from_github import sync_from_github
         
         # Run sync
@@ -222,9 +231,7 @@ async def sync_from_github_task(
             logger.error(f"Errors: {errors}")
         
     except Exception as e:
-        logger.error(f"Sync task failed: {e}")
-        import traceback
-        logger.error(traceback.format_exc())
+        logger.exception(f"Sync task failed: {e}")
 
 
 @router.get("/webhooks/github/status")
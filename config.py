@@ -9,38 +9,69 @@ Updated 2026-01-15: GitHub-first migration
 """
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import List
 
+# Environment is read once, at import: the process environment does not change
+# after startup, so nothing below goes back to it
+_ENV = os.environ
 
-@dataclass
+_PORT = int(_ENV.get("PORT", "3001"))
+_WEB_CONCURRENCY = int(_ENV.get("WEB_CONCURRENCY", "1"))
+_JOB_WORKERS = int(_ENV.get("JOB_WORKERS", "2"))
+_DB_MAX_CONNECTIONS = int(_ENV.get("DB_MAX_CONNECTIONS", "60"))
+_MONTHLY_AI_BUDGET = int(_ENV.get("MONTHLY_AI_BUDGET", "500"))
+
+
+def _parse_origins() -> List[str]:
+    """CORS origins from ALLOWED_ORIGINS (comma-separated, default "*")."""
+    origins = _ENV.get("ALLOWED_ORIGINS", "*")
+    return origins.split(",") if origins != "*" else ["*"]
+
+
+@dataclass(frozen=True, slots=True)
 class Settings:
-    """Application settings from environment variables."""
+    """Application settings from environment variables (read-only)."""
     
     # Server
-    PORT: int = int(os.getenv("PORT", "3001"))
-    ATHENA_API_KEY: str = os.getenv("ATHENA_API_KEY", "")
-    ALLOWED_ORIGINS: List[str] = None
+    PORT: int = _PORT
+    ATHENA_API_KEY: str = _ENV.get("ATHENA_API_KEY", "")
+    ALLOWED_ORIGINS: List[str] = field(default_factory=_parse_origins)
+    # uvicorn worker processes (uvicorn reads the same variable for --workers)
+    WEB_CONCURRENCY: int = _WEB_CONCURRENCY
+    # Job processes each web worker spawns for offloaded jobs (jobs/offload.py)
+    JOB_WORKERS: int = _JOB_WORKERS
     
     # Database
-    DATABASE_URL: str = os.getenv("DATABASE_URL", "")
+    DATABASE_URL: str = _ENV.get("DATABASE_URL", "")
+    # Executions before psycopg server-side prepares a query on a pooled
+    # connection; empty disables preparing (for poolers that reject it)
+    DB_PREPARE_THRESHOLD: str = _ENV.get("DB_PREPARE_THRESHOLD", "3")
+    # Connections the whole deployment may hold: every web worker's pools plus
+    # the fixed pools of its job processes. db/neon.py sizes the pools to fit
+    # and refuses to start when the worker counts leave no room
+    DB_MAX_CONNECTIONS: int = _DB_MAX_CONNECTIONS
+    
+    # Cache (optional shared L2 for GET responses; in-process only when unset)
+    REDIS_URL: str = _ENV.get("REDIS_URL", "")
     
     # Manus API
-    MANUS_API_KEY: str = os.getenv("MANUS_API_KEY", "")
-    MANUS_API_BASE: str = os.getenv("MANUS_API_BASE", "https://api.manus.ai/v1")
+    MANUS_API_KEY: str = _ENV.get("MANUS_API_KEY", "")
+    MANUS_API_BASE: str = _ENV.get("MANUS_API_BASE", "https://api.manus.ai/v1")
     
     # AI Models
-    OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
-    OPENAI_API_BASE: str = os.getenv("OPENAI_API_BASE", "https://api.openai.com/v1")
-    ANTHROPIC_API_KEY: str = os.getenv("ANTHROPIC_API_KEY", "")
+    OPENAI_API_KEY: str = _ENV.get("OPENAI_API_KEY", "")
+    OPENAI_API_BASE: str = _ENV.get("OPENAI_API_BASE", "https://api.openai.com/v1")
+    ANTHROPIC_API_KEY: str = _ENV.get("ANTHROPIC_API_KEY", "")
     
     # Google OAuth
-    GOOGLE_CLIENT_ID: str = os.getenv("GOOGLE_CLIENT_ID", "")
-    GOOGLE_CLIENT_SECRET: str = os.getenv("GOOGLE_CLIENT_SECRET", "")
-    GOOGLE_REFRESH_TOKEN: str = os.getenv("GOOGLE_REFRESH_TOKEN", "")
+    GOOGLE_CLIENT_ID: str = _ENV.get("GOOGLE_CLIENT_ID", "")
+    GOOGLE_CLIENT_SECRET: str = _ENV.get("GOOGLE_CLIENT_SECRET", "")
+    GOOGLE_REFRESH_TOKEN: str = _ENV.get("GOOGLE_REFRESH_TOKEN", "")
     
     # Notion
-    NOTION_API_KEY: str = os.getenv("NOTION_API_KEY", "")
+    NOTION_API_KEY: str = _ENV.get("NOTION_API_KEY", "")
     
     # DEPRECATED: Notion Page IDs (2026-01-15)
     # These are now loaded from cogos-system/docs/athena/ATHENA_INIT.md
@@ -72,20 +103,21 @@ class Settings:
     MANUS_MODEL_LITE: str = "manus-1.6-lite"
     
     # Budget
-    MONTHLY_AI_BUDGET: int = int(os.getenv("MONTHLY_AI_BUDGET", "500"))
+    MONTHLY_AI_BUDGET: int = _MONTHLY_AI_BUDGET
     
     # Monitoring
-    SENTRY_DSN: str = os.getenv("SENTRY_DSN", "")
-    ENVIRONMENT: str = os.getenv("ENVIRONMENT", "production")
-    
-    def __post_init__(self):
-        if self.ALLOWED_ORIGINS is None:
-            origins = os.getenv("ALLOWED_ORIGINS", "*")
-            self.ALLOWED_ORIGINS = origins.split(",") if origins != "*" else ["*"]
+    SENTRY_DSN: str = _ENV.get("SENTRY_DSN", "")
+    ENVIRONMENT: str = _ENV.get("ENVIRONMENT", "production")
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the process-wide Settings instance, built on first call."""
+    return Settings()
 
 
 # Global settings instance
-settings = Settings()
+settings = get_settings()
 
 
 # Manus connector UUIDs for session creation
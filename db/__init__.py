@@ -11,6 +11,7 @@ from .neon import (
     get_canonical_memory,
     get_vip_contacts,
     store_observation,
+    store_observations,
     store_pattern,
     store_synthesis,
     store_email_draft,
@@ -16,6 +16,7 @@ from db.brain.identity import (
     get_identity_value,
     update_identity_value,
     get_boundaries,
+    get_boundary_counts,
     check_boundary,
     get_values,
 )
@@ -23,6 +24,7 @@ from db.brain.identity import (
 # Layer 2: Knowledge
 from db.brain.knowledge import (
     get_workflows,
+    get_workflow_counts,
     get_workflow,
     update_workflow_execution,
     create_workflow,
@@ -113,10 +115,12 @@ __all__ = [
     "get_identity_value",
     "update_identity_value",
     "get_boundaries",
+    "get_boundary_counts",
     "check_boundary",
     "get_values",
     # Knowledge
     "get_workflows",
+    "get_workflow_counts",
     "get_workflow",
     "update_workflow_execution",
     "create_workflow",
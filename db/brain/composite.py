@@ -132,14 +132,15 @@ def store_daily_impressions_batch(impression_date: date, impressions: List[Dict]
     return ids
 
 
-def get_recent_impressions(days: int = 7, category: str = None) -> List[Dict]:
-    """Get recent impressions from synthesis_memory."""
+def get_recent_impressions(days: int = 7, category: str = None, limit: int = None) -> List[Dict]:
+    """Get recent impressions from synthesis_memory (newest first, at most limit if given)."""
     with db_cursor() as cursor:
+        # % is escaped: the query always runs with parameters
         query = """
             SELECT id, content, confidence_score, created_at
             FROM synthesis_memory
-            WHERE synthesis_type LIKE 'impression_%'
-            AND created_at > NOW() - INTERVAL '%s days'
+            WHERE synthesis_type LIKE 'impression\\_%%'
+            AND created_at > NOW() - %s * INTERVAL '1 day'
         """
         params = [days]
 
@@ -148,6 +149,9 @@ def get_recent_impressions(days: int = 7, category: str = None) -> List[Dict]:
             params.append(f"impression_{category}")
 
         query += " ORDER BY created_at DESC"
+        if limit:
+            query += " LIMIT %s"
+            params.append(limit)
         cursor.execute(query, params)
         rows = cursor.fetchall()
 
@@ -200,7 +204,7 @@ def get_recent_sessions(days: int = 7) -> List[Dict]:
         cursor.execute("""
             SELECT session_type, session_date, manus_task_id, manus_task_url, updated_at
             FROM active_sessions
-            WHERE session_date >= CURRENT_DATE - INTERVAL '%s days'
+            WHERE session_date >= CURRENT_DATE - %s * INTERVAL '1 day'
             ORDER BY session_date DESC, updated_at DESC
         """, (days,))
         return [
@@ -240,7 +244,7 @@ def get_recent_observations(limit: int = 10, hours: int = None) -> List[Dict]:
                     raw_metadata,
                     observed_at
                 FROM observations
-                WHERE observed_at > NOW() - INTERVAL '%s hours'
+                WHERE observed_at > NOW() - %s * INTERVAL '1 hour'
                 ORDER BY observed_at DESC
                 LIMIT %s
             """, (hours, limit))
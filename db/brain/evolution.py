@@ -168,29 +168,17 @@ def get_learning_analytics() -> Dict[str, Any]:
             for row in cursor.fetchall():
                 analytics["by_source"][row['source']] = row['count']
             
-            # Trends - last 7 days
+            # Trends - last 7/30 days and recent approvals, in one scan
             cursor.execute("""
-                SELECT COUNT(*) as count 
-                FROM evolution_log 
-                WHERE created_at > NOW() - INTERVAL '7 days'
-            """)
-            analytics["trends"]["last_7_days"] = cursor.fetchone()['count']
-            
-            # Trends - last 30 days
-            cursor.execute("""
-                SELECT COUNT(*) as count 
+                SELECT
+                    COUNT(*) FILTER (WHERE created_at > NOW() - INTERVAL '7 days') as last_7_days,
+                    COUNT(*) FILTER (WHERE created_at > NOW() - INTERVAL '30 days') as last_30_days,
+                    COUNT(*) FILTER (WHERE approved_at > NOW() - INTERVAL '7 days') as approvals_last_7_days
                 FROM evolution_log 
                 WHERE created_at > NOW() - INTERVAL '30 days'
+                   OR approved_at > NOW() - INTERVAL '7 days'
             """)
-            analytics["trends"]["last_30_days"] = cursor.fetchone()['count']
-            
-            # Approvals in last 7 days
-            cursor.execute("""
-                SELECT COUNT(*) as count 
-                FROM evolution_log 
-                WHERE approved_at > NOW() - INTERVAL '7 days'
-            """)
-            analytics["trends"]["approvals_last_7_days"] = cursor.fetchone()['count']
+            analytics["trends"].update(cursor.fetchone())
             
             # Top 5 categories
             analytics["top_categories"] = list(analytics["by_category"].keys())[:5]
@@ -99,6 +99,24 @@ def get_boundaries(boundary_type: str = None, active_only: bool = True) -> List[
         return cursor.fetchall()
 
 
+def get_boundary_counts() -> Dict[str, int]:
+    """
+    Count active boundaries by type without loading them.
+
+    Returns:
+        {'hard': n, 'soft': n}
+    """
+    with db_cursor() as cursor:
+        cursor.execute("""
+            SELECT
+                COUNT(*) FILTER (WHERE boundary_type = 'hard') AS hard,
+                COUNT(*) FILTER (WHERE boundary_type = 'soft') AS soft
+            FROM boundaries
+            WHERE active = TRUE
+        """)
+        return cursor.fetchone()
+
+
 def check_boundary(category: str, action: str) -> Dict[str, Any]:
     """
     Check if an action is allowed based on boundaries.
@@ -28,6 +28,16 @@ def get_workflows(enabled_only: bool = True) -> List[Dict]:
         return cursor.fetchall()
 
 
+def get_workflow_counts() -> Dict[str, int]:
+    """Count enabled and total workflows without loading them."""
+    with db_cursor() as cursor:
+        cursor.execute("""
+            SELECT COUNT(*) FILTER (WHERE enabled) AS enabled, COUNT(*) AS total
+            FROM workflows
+        """)
+        return cursor.fetchone()
+
+
 def get_workflow(workflow_name: str) -> Optional[Dict]:
     """Get a specific workflow by name."""
     with db_cursor() as cursor:
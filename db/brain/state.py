@@ -212,8 +212,7 @@ def update_session_state(
     Returns:
         True if updated
     """
-    from datetime import date as date_type
-    today = date_type.today()
+    today = date.today()
 
     if key_learnings and handoff_context:
         handoff_context['key_learnings'] = key_learnings
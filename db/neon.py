@@ -4,12 +4,18 @@ PostgreSQL connection using psycopg v3 for Python 3.13 compatibility.
 """
 
 import time
+import random
+import asyncio
 import logging
-from contextlib import contextmanager
-from typing import Optional, Generator
+import threading
+from contextlib import contextmanager, asynccontextmanager
+from datetime import datetime
+from typing import Optional, Generator, AsyncGenerator
 
 import psycopg
+from psycopg import sql
 from psycopg.rows import dict_row
+from psycopg_pool import AsyncConnectionPool, ConnectionPool, PoolTimeout
 
 from config import settings
 
@@ -17,7 +23,56 @@ logger = logging.getLogger("athena.db")
 
 # Connection pool settings
 MAX_RETRIES = 3
-RETRY_DELAY = 5  # seconds
+RETRY_BASE_DELAY = 0.5  # seconds; doubles on each attempt
+RETRY_MAX_DELAY = 5  # seconds
+# Errors worth retrying: Neon cold starts, dropped connections, pool exhaustion
+TRANSIENT_DB_ERRORS = (psycopg.OperationalError, PoolTimeout)
+# Job processes (settings.JOB_WORKERS per web worker) only use the sync pool,
+# capped at this size
+JOB_POOL_MAX_SIZE = 2
+# Each web worker gets an equal share of DB_MAX_CONNECTIONS, less what its job
+# processes may hold; two thirds of the rest go to the async request pool and
+# the remainder to the sync pool
+WORKER_DB_CONNECTIONS = (
+    settings.DB_MAX_CONNECTIONS // max(1, settings.WEB_CONCURRENCY)
+    - settings.JOB_WORKERS * JOB_POOL_MAX_SIZE
+)
+ASYNC_POOL_MAX_SIZE = min(20, WORKER_DB_CONNECTIONS * 2 // 3)
+ASYNC_POOL_MIN_SIZE = min(5, ASYNC_POOL_MAX_SIZE)
+ASYNC_POOL_TIMEOUT = 30  # seconds to wait for a free connection
+# Result sets above this many rows are streamed in STREAM_BATCH_SIZE chunks
+# instead of buffered whole; chunked streaming needs libpq 17
+STREAM_THRESHOLD = 200
+STREAM_BATCH_SIZE = 100 if psycopg.pq.version() >= 170000 else 1
+SYNC_POOL_MIN_SIZE = 1
+SYNC_POOL_MAX_SIZE = min(10, WORKER_DB_CONNECTIONS - ASYNC_POOL_MAX_SIZE)
+if ASYNC_POOL_MAX_SIZE < 1 or SYNC_POOL_MAX_SIZE < 1:
+    raise RuntimeError(
+        f"DB_MAX_CONNECTIONS={settings.DB_MAX_CONNECTIONS} is too small for "
+        f"WEB_CONCURRENCY={settings.WEB_CONCURRENCY} and JOB_WORKERS={settings.JOB_WORKERS}: "
+        f"each web worker needs {settings.JOB_WORKERS * JOB_POOL_MAX_SIZE + 2} connections"
+    )
+PREPARE_THRESHOLD = int(settings.DB_PREPARE_THRESHOLD) if settings.DB_PREPARE_THRESHOLD else None
+# execute(prepare=...) for hot request-path queries: prepared on first use
+# rather than after PREPARE_THRESHOLD runs, unless preparing is disabled
+PREPARE_HOT_QUERIES = True if PREPARE_THRESHOLD is not None else None
+
+# Shared async pool for request handlers, opened by the app lifespan
+_async_pool: Optional[AsyncConnectionPool] = None
+# Per-process sync pool behind db_cursor (threadpool helpers, scheduled jobs)
+_sync_pool: Optional[ConnectionPool] = None
+_sync_pool_lock = threading.Lock()
+
+
+def retry_delay(attempt: int) -> float:
+    """
+    Exponential backoff with jitter for a failed attempt (0-based).
+    
+    Returns:
+        Seconds to wait before the next attempt
+    """
+    delay = min(RETRY_BASE_DELAY * (2 ** attempt), RETRY_MAX_DELAY)
+    return delay * random.uniform(0.5, 1.0)
 
 
 def get_db_connection(max_retries: int = MAX_RETRIES) -> Optional[psycopg.Connection]:
@@ -44,39 +99,159 @@ def get_db_connection(max_retries: int = MAX_RETRIES) -> Optional[psycopg.Connec
         except Exception as e:
             logger.warning(f"Database connection attempt {attempt + 1} failed: {e}")
             if attempt < max_retries - 1:
-                time.sleep(RETRY_DELAY)
+                time.sleep(retry_delay(attempt))
     
     logger.error("All database connection attempts failed")
     return None
 
 
+def use_job_pool_size():
+    """
+    Cap this process's sync pool at JOB_POOL_MAX_SIZE.
+    
+    Called when a job process starts, before its first db_cursor, so the pool
+    matches the share reserved for it in the connection budget.
+    """
+    global SYNC_POOL_MAX_SIZE
+    SYNC_POOL_MAX_SIZE = JOB_POOL_MAX_SIZE
+
+
+def get_sync_pool() -> ConnectionPool:
+    """
+    Get this process's sync connection pool, creating it on first use.
+    
+    Connections are checked before being handed out, since Neon drops idle
+    connections when compute suspends between scheduled jobs.
+    
+    Returns:
+        The shared ConnectionPool
+    """
+    global _sync_pool
+    if _sync_pool is None:
+        with _sync_pool_lock:
+            if _sync_pool is None:
+                pool = ConnectionPool(
+                    settings.DATABASE_URL,
+                    min_size=SYNC_POOL_MIN_SIZE,
+                    max_size=SYNC_POOL_MAX_SIZE,
+                    timeout=ASYNC_POOL_TIMEOUT,
+                    kwargs={"connect_timeout": 30, "prepare_threshold": PREPARE_THRESHOLD},
+                    check=ConnectionPool.check_connection,
+                    open=False,
+                )
+                pool.open(wait=False)
+                _sync_pool = pool
+                logger.info("Sync database pool opened")
+    return _sync_pool
+
+
+def close_sync_pool():
+    """Close this process's sync connection pool."""
+    global _sync_pool
+    with _sync_pool_lock:
+        if _sync_pool is not None:
+            _sync_pool.close()
+            _sync_pool = None
+            logger.info("Sync database pool closed")
+
+
 @contextmanager
 def db_cursor(dict_cursor: bool = True) -> Generator:
     """
     Context manager for database operations.
     
+    Borrows a connection from the sync pool; commits on success and rolls
+    back on error.
+    
     Args:
         dict_cursor: If True, returns results as dictionaries
         
     Yields:
         Database cursor
     """
-    conn = get_db_connection()
-    if not conn:
-        raise Exception("Could not establish database connection")
-    
     try:
-        row_factory = dict_row if dict_cursor else None
-        cursor = conn.cursor(row_factory=row_factory)
-        yield cursor
-        conn.commit()
+        with get_sync_pool().connection() as conn:
+            row_factory = dict_row if dict_cursor else None
+            with conn.cursor(row_factory=row_factory) as cursor:
+                yield cursor
     except Exception as e:
-        conn.rollback()
         logger.error(f"Database operation failed: {e}")
         raise
-    finally:
-        cursor.close()
-        conn.close()
+
+
+async def open_async_pool() -> AsyncConnectionPool:
+    """
+    Open the shared async connection pool if it is not open yet.
+    
+    Called from the app lifespan; also opened lazily on first use so
+    helpers work outside the server (scripts, tests).
+    
+    Returns:
+        The shared AsyncConnectionPool
+    """
+    global _async_pool
+    if _async_pool is None:
+        _async_pool = AsyncConnectionPool(
+            settings.DATABASE_URL,
+            min_size=ASYNC_POOL_MIN_SIZE,
+            max_size=ASYNC_POOL_MAX_SIZE,
+            timeout=ASYNC_POOL_TIMEOUT,
+            # Pooled connections live long enough for hot queries to be prepared
+            kwargs={"connect_timeout": 30, "prepare_threshold": PREPARE_THRESHOLD},
+            # Ping a connection before lending it: Neon drops idle connections
+            # when compute suspends, and a dead one would fail the request
+            check=AsyncConnectionPool.check_connection,
+            open=False,
+        )
+        # Don't block startup on Neon cold starts; connections fill in the background
+        await _async_pool.open(wait=False)
+        logger.info("Async database pool opened")
+    return _async_pool
+
+
+async def close_async_pool():
+    """Close the shared async connection pool."""
+    global _async_pool
+    if _async_pool is not None:
+        await _async_pool.close()
+        _async_pool = None
+        logger.info("Async database pool closed")
+
+
+@asynccontextmanager
+async def async_db_connection() -> AsyncGenerator:
+    """
+    Async context manager that borrows a connection from the shared pool.
+    
+    Commits on success and rolls back on error. Use this instead of
+    async_db_cursor when several cursors share one round trip (pipeline mode).
+    
+    Yields:
+        Async database connection
+    """
+    pool = await open_async_pool()
+    async with pool.connection() as conn:
+        yield conn
+
+
+@asynccontextmanager
+async def async_db_cursor(dict_cursor: bool = True) -> AsyncGenerator:
+    """
+    Async context manager for database operations on the shared pool.
+    
+    Commits on success and rolls back on error, like db_cursor, but never
+    blocks the event loop and reuses pooled connections.
+    
+    Args:
+        dict_cursor: If True, returns results as dictionaries
+        
+    Yields:
+        Async database cursor
+    """
+    async with async_db_connection() as conn:
+        row_factory = dict_row if dict_cursor else None
+        async with conn.cursor(row_factory=row_factory) as cursor:
+            yield cursor
 
 
 async def check_db_health() -> bool:
@@ -86,22 +261,19 @@ async def check_db_health() -> bool:
     Returns:
         True if database is accessible, False otherwise
     """
-    for attempt in range(3):
+    for attempt in range(MAX_RETRIES):
         try:
-            conn = psycopg.connect(
-                settings.DATABASE_URL,
-                connect_timeout=30
-            )
-            cursor = conn.cursor()
-            cursor.execute("SELECT 1")
-            cursor.close()
-            conn.close()
+            async with async_db_cursor(dict_cursor=False) as cursor:
+                await cursor.execute("SELECT 1")
             logger.debug(f"Database health check passed (attempt {attempt + 1})")
             return True
-        except Exception as e:
+        except TRANSIENT_DB_ERRORS as e:
             logger.warning(f"Database health check attempt {attempt + 1} failed: {e}")
-            if attempt < 2:
-                time.sleep(5)
+            if attempt < MAX_RETRIES - 1:
+                await asyncio.sleep(retry_delay(attempt))
+        except Exception as e:
+            logger.error(f"Database health check failed: {e}")
+            return False
     
     logger.error("All database health check attempts failed")
     return False
@@ -128,6 +300,17 @@ def get_recent_observations(limit: int = 50, source_type: str = None) -> list:
         return cursor.fetchall()
 
 
+# High/urgent observations for /brief. The priority predicate is a literal
+# matching idx_observations_action_items, so the planner can use the partial
+# index. Read by batch_brief_queries.
+SQL_ACTION_ITEMS = """
+    SELECT * FROM observations
+    WHERE priority IN ('high', 'urgent')
+    ORDER BY observed_at DESC
+    LIMIT %s
+"""
+
+
 def get_unprocessed_observations(limit: int = 100) -> list:
     """Get observations not yet processed by pattern detection.
     
@@ -188,6 +371,36 @@ def get_canonical_memory() -> list:
         return cursor.fetchall()
 
 
+def estimate_row_count(table: str, cursor: Optional[psycopg.Cursor] = None) -> int:
+    """
+    Get the planner's row estimate for a table instead of counting it.
+    
+    Reads pg_class.reltuples (kept current by autovacuum/ANALYZE): one catalog
+    row instead of a full table scan. Use for metrics and status, not for
+    anything that needs an exact figure. Falls back to COUNT(*) for tables
+    that have never been analyzed.
+    
+    Args:
+        table: Table name
+        cursor: Open cursor (dict or tuple rows) to run on, so a caller that
+            already holds one does not check out a second pooled connection
+    """
+    if cursor is None:
+        with db_cursor(dict_cursor=False) as own_cursor:
+            return estimate_row_count(table, own_cursor)
+    
+    def first_value() -> int:
+        row = cursor.fetchone()
+        return row["n"] if isinstance(row, dict) else row[0]
+    
+    cursor.execute("SELECT reltuples::bigint AS n FROM pg_class WHERE oid = %s::regclass", (table,))
+    estimate = first_value()
+    if estimate >= 0:
+        return estimate
+    cursor.execute(sql.SQL("SELECT COUNT(*) AS n FROM {}").format(sql.Identifier(table)))
+    return first_value()
+
+
 def get_vip_contacts() -> list:
     """Get VIP contacts from canonical memory."""
     with db_cursor() as cursor:
@@ -223,6 +436,35 @@ def store_observation(observation: dict) -> str:
         return str(cursor.fetchone()['id'])
 
 
+def store_observations(observations: list) -> int:
+    """
+    Store many observations in one pipelined round trip.
+    Same upsert as store_observation; all rows commit or none do.
+    
+    Returns:
+        Number of observations written
+    """
+    if not observations:
+        return 0
+    with db_cursor() as cursor:
+        # executemany pipelines the statements instead of one round trip per row
+        cursor.executemany("""
+            INSERT INTO observations (
+                source_type, source_id, observed_at, category, priority,
+                requires_action, title, summary, raw_metadata
+            ) VALUES (
+                %(source_type)s, %(source_id)s, %(observed_at)s, %(category)s, %(priority)s,
+                %(requires_action)s, %(title)s, %(summary)s, %(raw_metadata)s
+            )
+            ON CONFLICT (source_type, source_id) DO UPDATE SET
+                category = EXCLUDED.category,
+                priority = EXCLUDED.priority,
+                summary = EXCLUDED.summary,
+                requires_action = EXCLUDED.requires_action
+        """, observations)
+    return len(observations)
+
+
 def mark_observations_processed_tier2(observation_ids: list):
     """Mark observations as processed by Tier 2."""
     with db_cursor() as cursor:
@@ -249,8 +491,6 @@ def store_pattern(pattern: dict) -> str:
     Schema: pattern_type, pattern_name, description, confidence, evidence,
             observation_ids, status, detected_at
     """
-    from datetime import datetime
-    
     # Calculate evidence_count from observation_ids
     observation_ids = pattern.get('observation_ids', [])
     evidence_count = len(observation_ids) if observation_ids else 0
@@ -530,6 +770,38 @@ def get_unread_broadcasts(limit: int = 10) -> list:
         return cursor.fetchall()
 
 
+def claim_unread_broadcasts(limit: int = 10) -> list:
+    """
+    Fetch unread broadcasts and mark them read by ATHENA THINKING in one statement.
+    
+    Replaces get_unread_broadcasts + mark_broadcasts_read: one round trip, and
+    SKIP LOCKED means concurrent pollers never both claim the same broadcast.
+    
+    Args:
+        limit: Maximum number of broadcasts to claim
+        
+    Returns:
+        List of claimed broadcast dicts, newest first
+    """
+    with db_cursor() as cursor:
+        cursor.execute("""
+            WITH claimed AS (
+                UPDATE broadcasts
+                SET read_by_thinking = TRUE
+                WHERE id IN (
+                    SELECT id FROM broadcasts
+                    WHERE read_by_thinking = FALSE
+                    ORDER BY created_at DESC
+                    LIMIT %s
+                    FOR UPDATE SKIP LOCKED
+                )
+                RETURNING id, session_id, title, content, broadcast_type, priority, confidence, created_at
+            )
+            SELECT * FROM claimed ORDER BY created_at DESC
+        """, (limit,))
+        return cursor.fetchall()
+
+
 def get_recent_broadcasts(hours: int = 24, limit: int = 20) -> list:
     """
     Get recent broadcasts within the specified time window.
@@ -546,7 +818,7 @@ def get_recent_broadcasts(hours: int = 24, limit: int = 20) -> list:
             SELECT id, session_id, title, content, broadcast_type, priority, confidence, 
                    read_by_thinking, notion_synced, created_at
             FROM broadcasts
-            WHERE created_at > NOW() - INTERVAL '%s hours'
+            WHERE created_at > NOW() - %s * INTERVAL '1 hour'
             ORDER BY created_at DESC
             LIMIT %s
         """, (hours, limit))
@@ -582,31 +854,234 @@ def get_broadcast_stats() -> dict:
     Returns:
         Dict with total, unread, and by_type counts
     """
-    with db_cursor() as cursor:
-        # Total today
+    with db_cursor(dict_cursor=False) as cursor:
+        # By type today; the day's total is the sum of these
         cursor.execute("""
-            SELECT COUNT(*) as total FROM broadcasts
+            SELECT broadcast_type, COUNT(*) FROM broadcasts
             WHERE DATE(created_at) = CURRENT_DATE
+            GROUP BY broadcast_type
         """)
-        total = cursor.fetchone()['total']
+        by_type = dict(cursor.fetchall())
         
         # Unread
         cursor.execute("""
-            SELECT COUNT(*) as unread FROM broadcasts
+            SELECT COUNT(*) FROM broadcasts
             WHERE read_by_thinking = FALSE
         """)
-        unread = cursor.fetchone()['unread']
-        
-        # By type today
-        cursor.execute("""
-            SELECT broadcast_type, COUNT(*) as count FROM broadcasts
-            WHERE DATE(created_at) = CURRENT_DATE
-            GROUP BY broadcast_type
-        """)
-        by_type = {row['broadcast_type']: row['count'] for row in cursor.fetchall()}
+        unread = cursor.fetchone()[0]
         
         return {
-            'total_today': total,
+            'total_today': sum(by_type.values()),
             'unread': unread,
             'by_type': by_type
         }
+
+
+# =============================================================================
+# ASYNC READS - Request-path queries on the shared async pool
+# Background jobs keep using the sync helpers above.
+# =============================================================================
+
+async def get_recent_observations_async(limit: int = 50, source_type: str = None) -> list:
+    """
+    Async variant of get_recent_observations.
+    
+    Large limits are read through stream_observations_async, so libpq never
+    holds the whole result set alongside the rows built from it.
+    """
+    if limit > STREAM_THRESHOLD:
+        return [row async for row in stream_observations_async(limit=limit, source_type=source_type)]
+    async with async_db_cursor() as cursor:
+        if source_type:
+            await cursor.execute("""
+                SELECT * FROM observations 
+                WHERE source_type = %s
+                ORDER BY observed_at DESC 
+                LIMIT %s
+            """, (source_type, limit))
+        else:
+            await cursor.execute("""
+                SELECT * FROM observations 
+                ORDER BY observed_at DESC 
+                LIMIT %s
+            """, (limit,))
+        return await cursor.fetchall()
+
+
+async def stream_observations_async(limit: int = 100, source_type: str = None) -> AsyncGenerator:
+    """
+    Stream recent observations row by row instead of fetching them all.
+    
+    Rows arrive from the server in STREAM_BATCH_SIZE chunks. Holds a pooled
+    connection until the generator is exhausted or closed.
+    
+    Yields:
+        Observation dicts, newest first
+    """
+    async with async_db_cursor() as cursor:
+        if source_type:
+            rows = cursor.stream("""
+                SELECT * FROM observations 
+                WHERE source_type = %s
+                ORDER BY observed_at DESC 
+                LIMIT %s
+            """, (source_type, limit), size=STREAM_BATCH_SIZE)
+        else:
+            rows = cursor.stream("""
+                SELECT * FROM observations 
+                ORDER BY observed_at DESC 
+                LIMIT %s
+            """, (limit,), size=STREAM_BATCH_SIZE)
+        async for row in rows:
+            yield row
+
+
+async def stream_recent_thoughts_async(hours: int = 2, limit: int = 100) -> AsyncGenerator:
+    """
+    Stream recent thinking_log entries row by row, newest first.
+    
+    Rows have the /thinking/live thought shape, with content cut to a
+    200-character preview in SQL so full thoughts never leave the database.
+    
+    Yields:
+        Thought dicts (id, session_id, type, content, confidence, phase, timestamp)
+    """
+    async with async_db_cursor() as cursor:
+        rows = cursor.stream("""
+            SELECT id::text AS id, session_id, thought_type AS type,
+                   CASE WHEN LENGTH(LEFT(content, 201)) > 200
+                        THEN LEFT(content, 200) || '...'
+                        ELSE content END AS content,
+                   confidence, phase, created_at AS timestamp
+            FROM thinking_log
+            WHERE created_at > NOW() - %s * INTERVAL '1 hour'
+            ORDER BY created_at DESC
+            LIMIT %s
+        """, (hours, limit), size=STREAM_BATCH_SIZE)
+        async for row in rows:
+            yield row
+
+
+async def get_recent_patterns_async(limit: int = 20) -> list:
+    """Async variant of get_recent_patterns."""
+    async with async_db_cursor() as cursor:
+        await cursor.execute("""
+            SELECT * FROM patterns 
+            ORDER BY detected_at DESC 
+            LIMIT %s
+        """, (limit,))
+        return await cursor.fetchall()
+
+
+async def get_latest_synthesis_async() -> Optional[dict]:
+    """Async variant of get_latest_synthesis."""
+    async with async_db_cursor() as cursor:
+        await cursor.execute("""
+            SELECT * FROM synthesis_memory 
+            ORDER BY created_at DESC 
+            LIMIT 1
+        """)
+        return await cursor.fetchone()
+
+
+async def get_pending_drafts_async() -> list:
+    """Async variant of get_pending_drafts."""
+    async with async_db_cursor() as cursor:
+        await cursor.execute("""
+            SELECT * FROM email_drafts 
+            WHERE status = 'pending_review'
+            ORDER BY created_at DESC
+        """)
+        return await cursor.fetchall()
+
+
+async def batch_brief_queries(patterns_limit: int = 10, action_items_limit: int = 20) -> dict:
+    """
+    Read everything the morning brief needs in a single round trip.
+    
+    The five SELECTs are sent together in pipeline mode on one pooled
+    connection, instead of borrowing five connections that each wait on
+    their own network round trip to Neon.
+    
+    Args:
+        patterns_limit: Most recent patterns to include
+        action_items_limit: Most recent high/urgent observations to include
+    
+    Returns:
+        Dict with synthesis, patterns, pending_drafts, action_items and
+        canonical_memory_count
+    """
+    async with async_db_connection() as conn:
+        synthesis_cur = conn.cursor(row_factory=dict_row)
+        patterns_cur = conn.cursor(row_factory=dict_row)
+        drafts_cur = conn.cursor(row_factory=dict_row)
+        actions_cur = conn.cursor(row_factory=dict_row)
+        canonical_cur = conn.cursor()
+        
+        async with conn.pipeline():
+            await synthesis_cur.execute("""
+                SELECT * FROM synthesis_memory 
+                ORDER BY created_at DESC 
+                LIMIT 1
+            """)
+            await patterns_cur.execute("""
+                SELECT * FROM patterns 
+                ORDER BY detected_at DESC 
+                LIMIT %s
+            """, (patterns_limit,))
+            await drafts_cur.execute("""
+                SELECT * FROM email_drafts 
+                WHERE status = 'pending_review'
+                ORDER BY created_at DESC
+            """)
+            # High/urgent observations, filtered in SQL (partial index)
+            await actions_cur.execute(SQL_ACTION_ITEMS, (action_items_limit,))
+            await canonical_cur.execute("SELECT COUNT(*) FROM canonical_memory WHERE active = TRUE")
+        
+        return {
+            "synthesis": await synthesis_cur.fetchone(),
+            "patterns": await patterns_cur.fetchall(),
+            "pending_drafts": await drafts_cur.fetchall(),
+            "action_items": await actions_cur.fetchall(),
+            "canonical_memory_count": (await canonical_cur.fetchone())[0],
+        }
+
+
+async def get_all_active_sessions_async() -> list:
+    """Async variant of get_all_active_sessions."""
+    async with async_db_cursor() as cursor:
+        await cursor.execute("""
+            SELECT session_type, manus_task_id, manus_task_url, session_date, updated_at
+            FROM active_sessions
+            ORDER BY session_type
+        """)
+        return await cursor.fetchall()
+
+
+async def get_todays_thinking_session_async() -> Optional[dict]:
+    """Async variant of get_todays_thinking_session."""
+    async with async_db_cursor() as cursor:
+        await cursor.execute("""
+            SELECT manus_task_id, manus_task_url, session_date, updated_at
+            FROM active_sessions
+            WHERE session_type = 'athena_thinking'
+            AND session_date = CURRENT_DATE
+        """)
+        return await cursor.fetchone()
+
+
+async def get_sessions_bundle_async() -> list:
+    """
+    Get all active sessions in one query, flagging today's THINKING session.
+    
+    Returns:
+        Active session records with an extra is_thinking boolean
+    """
+    async with async_db_cursor() as cursor:
+        await cursor.execute("""
+            SELECT session_type, manus_task_id, manus_task_url, session_date, updated_at,
+                   (session_type = 'athena_thinking' AND session_date = CURRENT_DATE) AS is_thinking
+            FROM active_sessions
+            ORDER BY session_type
+        """)
+        return await cursor.fetchall()
@@ -7,9 +7,8 @@ import logging
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 
-import httpx
-
 from config import settings
+from integrations.http_client import get_http_client
 
 logger = logging.getLogger("athena.integrations.calendar")
 
@@ -32,27 +31,27 @@ class CalendarClient:
             return False
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    TOKEN_URL,
-                    data={
-                        "client_id": settings.GOOGLE_CLIENT_ID,
-                        "client_secret": settings.GOOGLE_CLIENT_SECRET,
-                        "refresh_token": settings.GOOGLE_REFRESH_TOKEN,
-                        "grant_type": "refresh_token"
-                    }
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    self.access_token = data["access_token"]
-                    expires_in = data.get("expires_in", 3600)
-                    self.token_expires_at = datetime.utcnow() + timedelta(seconds=expires_in - 60)
-                    logger.info("Calendar access token refreshed successfully")
-                    return True
-                else:
-                    logger.error(f"Failed to refresh token: {response.status_code} - {response.text}")
-                    return False
+            client = get_http_client()
+            response = await client.post(
+                TOKEN_URL,
+                data={
+                    "client_id": settings.GOOGLE_CLIENT_ID,
+                    "client_secret": settings.GOOGLE_CLIENT_SECRET,
+                    "refresh_token": settings.GOOGLE_REFRESH_TOKEN,
+                    "grant_type": "refresh_token"
+                }
+            )
+            
+            if response.status_code == 200:
+                data = response.json()
+                self.access_token = data["access_token"]
+                expires_in = data.get("expires_in", 3600)
+                self.token_expires_at = datetime.utcnow() + timedelta(seconds=expires_in - 60)
+                logger.info("Calendar access token refreshed successfully")
+                return True
+            else:
+                logger.error(f"Failed to refresh token: {response.status_code} - {response.text}")
+                return False
                     
         except Exception as e:
             logger.error(f"Error refreshing Calendar token: {e}")
@@ -75,15 +74,15 @@ class CalendarClient:
         }
         
         try:
-            async with httpx.AsyncClient() as client:
-                url = f"{CALENDAR_API_BASE}{endpoint}"
-                response = await client.request(method, url, headers=headers, **kwargs)
-                
-                if response.status_code == 200:
-                    return response.json()
-                else:
-                    logger.error(f"Calendar API error: {response.status_code} - {response.text}")
-                    return None
+            client = get_http_client()
+            url = f"{CALENDAR_API_BASE}{endpoint}"
+            response = await client.request(method, url, headers=headers, **kwargs)
+            
+            if response.status_code == 200:
+                return response.json()
+            else:
+                logger.error(f"Calendar API error: {response.status_code} - {response.text}")
+                return None
                     
         except Exception as e:
             logger.error(f"Calendar API request failed: {e}")
@@ -9,9 +9,8 @@ from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 from email.mime.text import MIMEText
 
-import httpx
-
 from config import settings
+from integrations.http_client import get_http_client
 
 logger = logging.getLogger("athena.integrations.gmail")
 
@@ -34,27 +33,27 @@ class GmailClient:
             return False
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    TOKEN_URL,
-                    data={
-                        "client_id": settings.GOOGLE_CLIENT_ID,
-                        "client_secret": settings.GOOGLE_CLIENT_SECRET,
-                        "refresh_token": settings.GOOGLE_REFRESH_TOKEN,
-                        "grant_type": "refresh_token"
-                    }
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    self.access_token = data["access_token"]
-                    expires_in = data.get("expires_in", 3600)
-                    self.token_expires_at = datetime.utcnow() + timedelta(seconds=expires_in - 60)
-                    logger.info("Gmail access token refreshed successfully")
-                    return True
-                else:
-                    logger.error(f"Failed to refresh token: {response.status_code} - {response.text}")
-                    return False
+            client = get_http_client()
+            response = await client.post(
+                TOKEN_URL,
+                data={
+                    "client_id": settings.GOOGLE_CLIENT_ID,
+                    "client_secret": settings.GOOGLE_CLIENT_SECRET,
+                    "refresh_token": settings.GOOGLE_REFRESH_TOKEN,
+                    "grant_type": "refresh_token"
+                }
+            )
+            
+            if response.status_code == 200:
+                data = response.json()
+                self.access_token = data["access_token"]
+                expires_in = data.get("expires_in", 3600)
+                self.token_expires_at = datetime.utcnow() + timedelta(seconds=expires_in - 60)
+                logger.info("Gmail access token refreshed successfully")
+                return True
+            else:
+                logger.error(f"Failed to refresh token: {response.status_code} - {response.text}")
+                return False
                     
         except Exception as e:
             logger.error(f"Error refreshing Gmail token: {e}")
@@ -77,15 +76,15 @@ class GmailClient:
         }
         
         try:
-            async with httpx.AsyncClient() as client:
-                url = f"{GMAIL_API_BASE}{endpoint}"
-                response = await client.request(method, url, headers=headers, **kwargs)
-                
-                if response.status_code == 200:
-                    return response.json()
-                else:
-                    logger.error(f"Gmail API error: {response.status_code} - {response.text}")
-                    return None
+            client = get_http_client()
+            url = f"{GMAIL_API_BASE}{endpoint}"
+            response = await client.request(method, url, headers=headers, **kwargs)
+            
+            if response.status_code == 200:
+                return response.json()
+            else:
+                logger.error(f"Gmail API error: {response.status_code} - {response.text}")
+                return None
                     
         except Exception as e:
             logger.error(f"Gmail API request failed: {e}")
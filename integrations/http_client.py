@@ -0,0 +1,74 @@
+"""
+Athena Server v2 - Shared HTTP Client
+One keep-alive httpx.AsyncClient for outbound calls (Manus, Notion, ...).
+
+Reusing a single client keeps TCP/TLS connections warm across requests and
+lets HTTP/2 multiplex calls to the same host, instead of paying a fresh
+handshake for every `async with httpx.AsyncClient()` block.
+
+Calls are also capped per upstream with upstream_slot(), so a burst of
+requests can't flood Manus or Notion (and trip their rate limits), and a slow
+Notion never holds up Manus calls.
+
+Job processes run each job on a fresh event loop, so jobs.offload closes the
+client after every run; calls within one run still share connections.
+"""
+
+import asyncio
+import logging
+from typing import Dict, Optional
+
+import httpx
+
+logger = logging.getLogger("athena.integrations.http")
+
+HTTP_TIMEOUT = 30.0  # seconds; override per call with timeout=...
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=50, max_connections=100)
+UPSTREAM_CONCURRENCY = 20  # in-flight calls per upstream service
+
+_client: Optional[httpx.AsyncClient] = None
+_upstream_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared outbound HTTP client, creating it on first use.
+
+    Returns:
+        The shared httpx.AsyncClient
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(timeout=HTTP_TIMEOUT, http2=True, limits=HTTP_LIMITS)
+        logger.info("Shared HTTP client created")
+    return _client
+
+
+async def close_http_client():
+    """Close the shared outbound HTTP client (and its loop-bound limiters)."""
+    global _client
+    _upstream_semaphores.clear()
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+        logger.info("Shared HTTP client closed")
+
+
+def upstream_slot(upstream: str) -> asyncio.Semaphore:
+    """
+    Get the concurrency limiter for an upstream service.
+
+    Usage:
+        async with upstream_slot("notion"):
+            response = await get_http_client().post(...)
+
+    Args:
+        upstream: Upstream service name, e.g. "manus" or "notion"
+
+    Returns:
+        Semaphore allowing UPSTREAM_CONCURRENCY concurrent calls
+    """
+    semaphore = _upstream_semaphores.get(upstream)
+    if semaphore is None:
+        semaphore = _upstream_semaphores[upstream] = asyncio.Semaphore(UPSTREAM_CONCURRENCY)
+    return semaphore
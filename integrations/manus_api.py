@@ -10,13 +10,22 @@ LEAN PROMPT APPROACH:
 
 import logging
 from datetime import datetime
+from types import MappingProxyType
 from typing import Dict, Optional
 import httpx
 
 from config import settings, MANUS_CONNECTORS
+from integrations.http_client import get_http_client, upstream_slot
 
 logger = logging.getLogger("athena.integrations.manus")
 
+# Request headers for every Manus call, built once (read-only so no caller
+# can mutate the shared copy)
+MANUS_HEADERS = MappingProxyType({
+    "API_KEY": settings.MANUS_API_KEY,
+    "Content-Type": "application/json"
+})
+
 
 async def create_manus_task(
     prompt: str = None,
@@ -61,33 +70,30 @@ async def create_manus_task(
         "connectors": connectors
     }
     
-    headers = {
-        "API_KEY": settings.MANUS_API_KEY,
-        "Content-Type": "application/json"
-    }
-    
     logger.info(f"Creating Manus task: model={model}, session_type={session_type}, prompt_length={len(actual_prompt)}")
     
     try:
-        async with httpx.AsyncClient(timeout=120.0) as client:
+        client = get_http_client()
+        async with upstream_slot("manus"):
             response = await client.post(
                 f"{settings.MANUS_API_BASE}/tasks",
                 json=payload,
-                headers=headers
+                headers=MANUS_HEADERS,
+                timeout=120.0
             )
-            
-            logger.info(f"Manus API response: status={response.status_code}")
-            
-            if response.status_code == 200 or response.status_code == 201:
-                result = response.json()
-                # Normalize response - API returns task_id, we use id internally
-                if 'task_id' in result and 'id' not in result:
-                    result['id'] = result['task_id']
-                logger.info(f"Created Manus task: {result.get('id')} (session_type: {session_type})")
-                return result
-            else:
-                logger.error(f"Manus API error: {response.status_code} - {response.text}")
-                return None
+        
+        logger.info(f"Manus API response: status={response.status_code}")
+        
+        if response.status_code == 200 or response.status_code == 201:
+            result = response.json()
+            # Normalize response - API returns task_id, we use id internally
+            if 'task_id' in result and 'id' not in result:
+                result['id'] = result['task_id']
+            logger.info(f"Created Manus task: {result.get('id')} (session_type: {session_type})")
+            return result
+        else:
+            logger.error(f"Manus API error: {response.status_code} - {response.text}")
+            return None
                 
     except httpx.TimeoutException as e:
         logger.error(f"Manus API timeout: {e}")
@@ -112,25 +118,21 @@ async def rename_manus_task(task_id: str, name: str) -> bool:
         logger.error("MANUS_API_KEY not configured")
         return False
     
-    headers = {
-        "API_KEY": settings.MANUS_API_KEY,
-        "Content-Type": "application/json"
-    }
-    
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        client = get_http_client()
+        async with upstream_slot("manus"):
             response = await client.patch(
                 f"{settings.MANUS_API_BASE}/tasks/{task_id}",
                 json={"name": name},
-                headers=headers
+                headers=MANUS_HEADERS
             )
-            
-            if response.status_code == 200:
-                logger.info(f"Renamed task {task_id} to '{name}'")
-                return True
-            else:
-                logger.error(f"Failed to rename task: {response.status_code}")
-                return False
+        
+        if response.status_code == 200:
+            logger.info(f"Renamed task {task_id} to '{name}'")
+            return True
+        else:
+            logger.error(f"Failed to rename task: {response.status_code}")
+            return False
                 
     except Exception as e:
         logger.error(f"Failed to rename Manus task: {e}")
@@ -11,7 +11,7 @@ from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List
 
 from config import settings
-from db.neon import db_cursor
+from db.neon import db_cursor, estimate_row_count
 from db.brain import (
     get_brain_status, get_core_identity, get_boundaries, get_values,
     get_continuous_state_context
@@ -37,9 +37,6 @@ def get_system_metrics() -> Dict[str, Any]:
     try:
         with db_cursor() as cursor:
             # Observation counts
-            cursor.execute("SELECT COUNT(*) as total FROM observations")
-            metrics["observations"]["total"] = cursor.fetchone()["total"]
-            
             cursor.execute("""
                 SELECT COUNT(*) as count FROM observations 
                 WHERE observed_at > NOW() - INTERVAL '24 hours'
@@ -52,10 +49,11 @@ def get_system_metrics() -> Dict[str, Any]:
             """)
             for row in cursor.fetchall():
                 metrics["observations"]["by_type"][row["source_type"]] = row["count"]
+            # The GROUP BY already covers every row; no separate COUNT(*) scan
+            metrics["observations"]["total"] = sum(metrics["observations"]["by_type"].values())
             
-            # Pattern counts
-            cursor.execute("SELECT COUNT(*) as total FROM patterns")
-            metrics["patterns"]["total"] = cursor.fetchone()["total"]
+            # Pattern counts (total is the planner estimate, not an exact scan)
+            metrics["patterns"]["total"] = estimate_row_count("patterns", cursor)
             
             cursor.execute("""
                 SELECT COUNT(*) as count FROM patterns 
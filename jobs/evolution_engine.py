@@ -33,7 +33,7 @@ def get_recent_feedback(days: int = 7) -> List[Dict]:
     with db_cursor() as cursor:
         cursor.execute("""
             SELECT * FROM feedback_history
-            WHERE created_at > NOW() - INTERVAL '%s days'
+            WHERE created_at > NOW() - %s * INTERVAL '1 day'
             ORDER BY created_at DESC
         """, (days,))
         return cursor.fetchall()
@@ -44,7 +44,7 @@ def get_recent_patterns(days: int = 7) -> List[Dict]:
     with db_cursor() as cursor:
         cursor.execute("""
             SELECT * FROM patterns
-            WHERE detected_at > NOW() - INTERVAL '%s days'
+            WHERE detected_at > NOW() - %s * INTERVAL '1 day'
             ORDER BY confidence DESC
             LIMIT 50
         """, (days,))
@@ -56,7 +56,7 @@ def get_recent_synthesis(days: int = 7) -> List[Dict]:
     with db_cursor() as cursor:
         cursor.execute("""
             SELECT * FROM synthesis_memory
-            WHERE created_at > NOW() - INTERVAL '%s days'
+            WHERE created_at > NOW() - %s * INTERVAL '1 day'
             ORDER BY created_at DESC
             LIMIT 20
         """, (days,))
@@ -11,7 +11,6 @@ Manus tasks: Only spawned when there's something actionable (alerts, urgent item
 import asyncio
 import logging
 import json
-import httpx
 from datetime import datetime, time
 from typing import Dict, Any, Optional, List
 import pytz
@@ -24,6 +23,7 @@ from db.brain import (
 )
 from db.brain.composite import get_recent_observations
 from integrations.manus_api import create_manus_task
+from integrations.http_client import get_http_client
 
 logger = logging.getLogger("athena.jobs.hourly_broadcast")
 
@@ -303,52 +303,52 @@ async def send_to_notion(thought: Dict[str, Any]) -> bool:
         return False
     
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                "https://api.notion.com/v1/pages",
-                headers={
-                    "Authorization": f"Bearer {notion_api_key}",
-                    "Content-Type": "application/json",
-                    "Notion-Version": "2022-06-28"
-                },
-                json={
-                    "parent": {"database_id": settings.BROADCASTS_DATABASE_ID},
-                    "properties": {
-                        "Name": {
-                            "title": [{"text": {"content": thought["title"][:100]}}]
-                        },
-                        "Type": {
-                            "select": {"name": thought["type"]}
-                        },
-                        "Priority": {
-                            "select": {"name": thought["priority"]}
-                        },
-                        "Status": {
-                            "select": {"name": "New"}
-                        },
-                        "Session ID": {
-                            "rich_text": [{"text": {"content": thought["session_id"]}}]
-                        }
+        client = get_http_client()
+        response = await client.post(
+            "https://api.notion.com/v1/pages",
+            headers={
+                "Authorization": f"Bearer {notion_api_key}",
+                "Content-Type": "application/json",
+                "Notion-Version": "2022-06-28"
+            },
+            json={
+                "parent": {"database_id": settings.BROADCASTS_DATABASE_ID},
+                "properties": {
+                    "Name": {
+                        "title": [{"text": {"content": thought["title"][:100]}}]
                     },
-                    "children": [
-                        {
-                            "object": "block",
-                            "type": "paragraph",
-                            "paragraph": {
-                                "rich_text": [{"type": "text", "text": {"content": thought["content"][:2000]}}]
-                            }
-                        }
-                    ]
+                    "Type": {
+                        "select": {"name": thought["type"]}
+                    },
+                    "Priority": {
+                        "select": {"name": thought["priority"]}
+                    },
+                    "Status": {
+                        "select": {"name": "New"}
+                    },
+                    "Session ID": {
+                        "rich_text": [{"text": {"content": thought["session_id"]}}]
+                    }
                 },
-                timeout=30.0
-            )
-            
-            if response.status_code == 200:
-                logger.info("Sent thought burst to Notion")
-                return True
-            else:
-                logger.error(f"Failed to send to Notion: {response.status_code} - {response.text[:200]}")
-                return False
+                "children": [
+                    {
+                        "object": "block",
+                        "type": "paragraph",
+                        "paragraph": {
+                            "rich_text": [{"type": "text", "text": {"content": thought["content"][:2000]}}]
+                        }
+                    }
+                ]
+            },
+            timeout=30.0
+        )
+        
+        if response.status_code == 200:
+            logger.info("Sent thought burst to Notion")
+            return True
+        else:
+            logger.error(f"Failed to send to Notion: {response.status_code} - {response.text[:200]}")
+            return False
                 
     except Exception as e:
         logger.error(f"Error sending to Notion: {e}")
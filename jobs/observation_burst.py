@@ -14,7 +14,7 @@ from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
 
 from config import settings
-from db.neon import store_observation, db_cursor
+from db.neon import store_observation, store_observations, db_cursor
 from integrations.google_auth import get_google_credentials
 
 logger = logging.getLogger("athena.jobs.observation")
@@ -243,14 +243,19 @@ async def run_observation_burst():
     
     all_observations = gmail_obs + calendar_obs
     
-    # Store to database
-    stored_count = 0
-    for obs in all_observations:
-        try:
-            store_observation(obs)
-            stored_count += 1
-        except Exception as e:
-            logger.error(f"Failed to store observation: {e}")
+    # Store to database in one batch; fall back to row by row so one bad
+    # observation doesn't drop the rest
+    try:
+        stored_count = store_observations(all_observations)
+    except Exception as e:
+        logger.error(f"Batch observation store failed, retrying individually: {e}")
+        stored_count = 0
+        for obs in all_observations:
+            try:
+                store_observation(obs)
+                stored_count += 1
+            except Exception as e:
+                logger.error(f"Failed to store observation: {e}")
     
     duration = (datetime.utcnow() - start_time).total_seconds()
     logger.info(f"Observation burst complete: {stored_count} observations stored in {duration:.1f}s")
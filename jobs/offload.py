@@ -0,0 +1,128 @@
+"""
+Athena Server v2 - Background Job Offloading
+Run manually triggered jobs in a worker process instead of the web worker.
+
+FastAPI BackgroundTasks run on the same event loop as request handlers, so a
+long synthesis or thinking run (prompt building, JSON parsing, sync DB calls)
+stalls every other request until it finishes. Jobs submitted here run in a
+small process pool, each on its own event loop via asyncio.run().
+
+Jobs are referenced by dotted path ("jobs.synthesis:run_synthesis") so only
+strings cross the process boundary.
+"""
+
+import asyncio
+import importlib
+import logging
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Optional
+
+from config import settings
+from db.neon import use_job_pool_size
+from integrations.http_client import close_http_client
+
+logger = logging.getLogger("athena.jobs.offload")
+
+JOB_WORKERS = settings.JOB_WORKERS
+
+_executor: Optional[ProcessPoolExecutor] = None
+
+
+def _init_worker():
+    """Configure logging and the DB pool size in a freshly spawned job process."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    use_job_pool_size()
+
+
+def _run_job(job_path: str, kwargs: dict) -> Any:
+    """Import and run an async job to completion inside a worker process."""
+    module_name, func_name = job_path.split(":")
+    job = getattr(importlib.import_module(module_name), func_name)
+
+    async def _main():
+        try:
+            return await job(**kwargs)
+        finally:
+            # The shared HTTP client is bound to this run's event loop
+            await close_http_client()
+
+    return asyncio.run(_main())
+
+
+def get_job_executor() -> ProcessPoolExecutor:
+    """
+    Get the shared job process pool, creating it on first use.
+
+    Uses the spawn start method: forking a process that holds an event loop,
+    scheduler threads and open DB connections is not safe.
+
+    Returns:
+        The shared ProcessPoolExecutor
+    """
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(
+            max_workers=JOB_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+        )
+        logger.info(f"Job process pool started with {JOB_WORKERS} workers")
+    return _executor
+
+
+def shutdown_job_executor():
+    """Shut down the job process pool, cancelling jobs that have not started."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+        logger.info("Job process pool shut down")
+
+
+def _log_result(job_path: str, future: Future):
+    if future.cancelled():
+        logger.warning(f"Offloaded job {job_path} was cancelled")
+        return
+    error = future.exception()
+    if error is not None:
+        logger.error(f"Offloaded job {job_path} failed: {error}")
+    else:
+        logger.info(f"Offloaded job {job_path} completed")
+
+
+def submit_job(job_path: str, **kwargs) -> Future:
+    """
+    Run an async job in the job process pool without waiting for it.
+
+    Args:
+        job_path: "module:function" path of an async job, e.g. "jobs.synthesis:run_synthesis"
+        **kwargs: Keyword arguments for the job (must be picklable)
+
+    Returns:
+        Future for the job's result
+    """
+    future = get_job_executor().submit(_run_job, job_path, kwargs)
+    future.add_done_callback(lambda f: _log_result(job_path, f))
+    return future
+
+
+async def run_offloaded(job_path: str, **kwargs) -> Any:
+    """
+    Run an async job in the job process pool and wait for it.
+
+    Used by the scheduler: the cron job stays "running" until the worker
+    finishes, so APScheduler's overlap protection (max_instances) still
+    applies, while the event loop keeps serving requests.
+
+    Args:
+        job_path: "module:function" path of an async job
+        **kwargs: Keyword arguments for the job (must be picklable)
+
+    Returns:
+        The job's result
+    """
+    return await asyncio.wrap_future(submit_job(job_path, **kwargs))
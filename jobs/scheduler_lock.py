@@ -0,0 +1,64 @@
+"""
+Athena Server v2 - Scheduler Leader Lock
+Make sure only one web worker runs the cron scheduler.
+
+With `uvicorn --workers N` every worker runs the app lifespan, so without a
+guard each of them would start its own APScheduler and every cron job would
+fire N times. The first worker to take an exclusive lock on a file in the temp
+directory runs the scheduler; the others only serve requests. The lock is
+released when the holder exits (including crashes), so a restarted worker can
+take over.
+"""
+
+import logging
+import os
+import tempfile
+from typing import Optional, TextIO
+
+try:
+    import fcntl
+except ImportError:  # Windows dev machines: single worker, no locking needed
+    fcntl = None
+
+logger = logging.getLogger("athena.jobs.scheduler_lock")
+
+LOCK_PATH = os.path.join(tempfile.gettempdir(), "athena-scheduler.lock")
+
+_lock_file: Optional[TextIO] = None
+
+
+def acquire_scheduler_lock() -> bool:
+    """
+    Try to become this host's scheduler worker.
+
+    Returns:
+        True if this process holds the lock and should start the scheduler
+    """
+    global _lock_file
+    if fcntl is None:
+        return True
+    if _lock_file is not None:
+        return True
+
+    lock_file = open(LOCK_PATH, "w")
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock_file.close()
+        logger.info(f"Scheduler already running in another worker (pid {os.getpid()} skipping)")
+        return False
+
+    lock_file.write(str(os.getpid()))
+    lock_file.flush()
+    _lock_file = lock_file
+    logger.info(f"Scheduler lock acquired by pid {os.getpid()}")
+    return True
+
+
+def release_scheduler_lock():
+    """Release the scheduler lock if this process holds it."""
+    global _lock_file
+    if _lock_file is not None:
+        fcntl.flock(_lock_file, fcntl.LOCK_UN)
+        _lock_file.close()
+        _lock_file = None
@@ -169,10 +169,8 @@ Respond in JSON format:
             "action_recommendations": []
         }
     except Exception as e:
-        logger.error(f"Synthesis generation failed: {e}")
-        logger.error(f"Error type: {type(e).__name__}")
-        import traceback
-        logger.error(f"Traceback: {traceback.format_exc()}")
+        # logger.exception formats the traceback only if the record is emitted
+        logger.exception(f"Synthesis generation failed: {type(e).__name__}: {e}")
         return {
             "executive_summary": f"Synthesis generation failed: {str(e)}",
             "key_insights": [],
@@ -247,10 +245,7 @@ async def run_synthesis():
         logger.info(f"✅ Successfully stored synthesis #{synthesis_number} with ID {synthesis_id}")
         logger.info(f"Synthesis contains {len(synthesis_result['key_insights'])} insights, {len(synthesis_result['questions_for_user'])} questions, {len(synthesis_result['memory_proposals'])} memory proposals")
     except Exception as e:
-        logger.error(f"❌ Failed to store synthesis: {e}")
-        logger.error(f"Error type: {type(e).__name__}")
-        import traceback
-        logger.error(f"Traceback: {traceback.format_exc()}")
+        logger.exception(f"❌ Failed to store synthesis: {type(e).__name__}: {e}")
         return {"status": "error", "error": str(e)}
     
     duration = (datetime.utcnow() - start_time).total_seconds()
@@ -20,6 +20,7 @@ from db.brain import (
     get_pending_actions, get_evolution_proposals
 )
 from integrations.manus_api import create_manus_task
+from integrations.http_client import get_http_client
 
 logger = logging.getLogger("athena.jobs.synthesis_broadcast")
 
@@ -43,7 +44,7 @@ async def get_recent_bursts(hours: int = 12) -> List[Dict[str, Any]]:
             cur.execute("""
                 SELECT session_id, thought_type, content, confidence, metadata, created_at
                 FROM thinking_log
-                WHERE created_at > NOW() - INTERVAL '%s hours'
+                WHERE created_at > NOW() - %s * INTERVAL '1 hour'
                 ORDER BY created_at DESC
             """, (hours,))
             rows = cur.fetchall()
@@ -283,59 +284,58 @@ async def log_synthesis_to_notion(synthesis: Dict[str, Any]) -> bool:
         return False
     
     try:
-        import httpx
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                "https://api.notion.com/v1/pages",
-                headers={
-                    "Authorization": f"Bearer {notion_api_key}",
-                    "Content-Type": "application/json",
-                    "Notion-Version": "2022-06-28"
-                },
-                json={
-                    "parent": {"database_id": "70b8cb6eff9845d98492ce16c4e2e9aa"},
-                    "properties": {
-                        "Name": {
-                            "title": [{"text": {"content": synthesis["title"][:100]}}]
-                        },
-                        "Type": {
-                            "select": {"name": "Synthesis"}
-                        },
-                        "Priority": {
-                            "select": {"name": synthesis["priority"]}
-                        },
-                        "Status": {
-                            "select": {"name": "New"}
-                        },
-                        "Confidence": {
-                            "number": synthesis["confidence"]
-                        },
-                        "Session ID": {
-                            "rich_text": [{"text": {"content": synthesis["session_id"]}}]
-                        },
-                        "Timestamp": {
-                            "date": {"start": synthesis["timestamp"]}
-                        }
+        client = get_http_client()
+        response = await client.post(
+            "https://api.notion.com/v1/pages",
+            headers={
+                "Authorization": f"Bearer {notion_api_key}",
+                "Content-Type": "application/json",
+                "Notion-Version": "2022-06-28"
+            },
+            json={
+                "parent": {"database_id": "70b8cb6eff9845d98492ce16c4e2e9aa"},
+                "properties": {
+                    "Name": {
+                        "title": [{"text": {"content": synthesis["title"][:100]}}]
                     },
-                    "children": [
-                        {
-                            "object": "block",
-                            "type": "paragraph",
-                            "paragraph": {
-                                "rich_text": [{"type": "text", "text": {"content": synthesis["content"][:2000]}}]
-                            }
-                        }
-                    ]
+                    "Type": {
+                        "select": {"name": "Synthesis"}
+                    },
+                    "Priority": {
+                        "select": {"name": synthesis["priority"]}
+                    },
+                    "Status": {
+                        "select": {"name": "New"}
+                    },
+                    "Confidence": {
+                        "number": synthesis["confidence"]
+                    },
+                    "Session ID": {
+                        "rich_text": [{"text": {"content": synthesis["session_id"]}}]
+                    },
+                    "Timestamp": {
+                        "date": {"start": synthesis["timestamp"]}
+                    }
                 },
-                timeout=30.0
-            )
-            
-            if response.status_code in [200, 201]:
-                logger.info("Logged synthesis to Notion")
-                return True
-            else:
-                logger.warning(f"Failed to log to Notion: {response.status_code}")
-                return False
+                "children": [
+                    {
+                        "object": "block",
+                        "type": "paragraph",
+                        "paragraph": {
+                            "rich_text": [{"type": "text", "text": {"content": synthesis["content"][:2000]}}]
+                        }
+                    }
+                ]
+            },
+            timeout=30.0
+        )
+        
+        if response.status_code in [200, 201]:
+            logger.info("Logged synthesis to Notion")
+            return True
+        else:
+            logger.warning(f"Failed to log to Notion: {response.status_code}")
+            return False
     except Exception as e:
         logger.error(f"Error logging to Notion: {e}")
         return False
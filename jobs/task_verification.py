@@ -9,9 +9,9 @@ import json
 import logging
 from datetime import datetime, timedelta
 from typing import Optional
-import httpx
 
 from config import settings
+from integrations.http_client import get_http_client
 
 logger = logging.getLogger("athena.task_verification")
 
@@ -19,6 +19,16 @@ logger = logging.getLogger("athena.task_verification")
 NOTION_VERSION = "2022-06-28"
 
 
+def _safe(d, *keys, default=""):
+    """Walk nested Notion properties by key/index, returning default on any gap."""
+    try:
+        for k in keys:
+            d = d[k]
+        return d
+    except (KeyError, IndexError, TypeError):
+        return default
+
+
 class TaskVerifier:
     """Verifies and enriches tasks from Gemini."""
     
@@ -68,24 +78,24 @@ class TaskVerifier:
         }
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    url,
-                    headers=self.notion_headers,
-                    json=filter_payload,
-                    timeout=30
-                )
-                response.raise_for_status()
-                data = response.json()
-                
-                tasks = []
-                for page in data.get("results", []):
-                    task = self._parse_task_page(page)
-                    if task:
-                        tasks.append(task)
-                
-                logger.info(f"Found {len(tasks)} unverified tasks")
-                return tasks
+            client = get_http_client()
+            response = await client.post(
+                url,
+                headers=self.notion_headers,
+                json=filter_payload,
+                timeout=30
+            )
+            response.raise_for_status()
+            data = response.json()
+            
+            tasks = []
+            for page in data.get("results", []):
+                task = self._parse_task_page(page)
+                if task:
+                    tasks.append(task)
+            
+            logger.info(f"Found {len(tasks)} unverified tasks")
+            return tasks
                 
         except Exception as e:
             logger.error(f"Error querying Athena Tasks: {e}")
@@ -96,30 +106,14 @@ class TaskVerifier:
         try:
             props = page.get("properties", {})
             
-            # Extract title
-            title_prop = props.get("Task", {})
-            title = ""
-            if title_prop.get("title"):
-                title = title_prop["title"][0]["plain_text"] if title_prop["title"] else ""
-            
-            # Extract other properties
-            context = ""
-            context_prop = props.get("Context", {})
-            if context_prop.get("rich_text"):
-                context = context_prop["rich_text"][0]["plain_text"] if context_prop["rich_text"] else ""
-            
-            person = ""
-            person_prop = props.get("Person", {})
-            if person_prop.get("rich_text"):
-                person = person_prop["rich_text"][0]["plain_text"] if person_prop["rich_text"] else ""
-            
-            priority = props.get("Priority", {}).get("select", {}).get("name", "")
-            task_type = props.get("Type", {}).get("select", {}).get("name", "")
-            
-            due_date = None
-            due_prop = props.get("Due", {}).get("date")
-            if due_prop:
-                due_date = due_prop.get("start")
+            # Extract title and other properties; unset ones (null selects,
+            # empty rich_text arrays) fall back to the default
+            title = _safe(props, "Task", "title", 0, "plain_text")
+            context = _safe(props, "Context", "rich_text", 0, "plain_text")
+            person = _safe(props, "Person", "rich_text", 0, "plain_text")
+            priority = _safe(props, "Priority", "select", "name")
+            task_type = _safe(props, "Type", "select", "name")
+            due_date = _safe(props, "Due", "date", "start", default=None)
             
             return {
                 "id": page["id"],
@@ -240,16 +234,16 @@ Respond in JSON format:
             }
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.patch(
-                    url,
-                    headers=self.notion_headers,
-                    json={"properties": properties},
-                    timeout=30
-                )
-                response.raise_for_status()
-                logger.info(f"Updated task {task_id}: keep={keep}")
-                return True
+            client = get_http_client()
+            response = await client.patch(
+                url,
+                headers=self.notion_headers,
+                json={"properties": properties},
+                timeout=30
+            )
+            response.raise_for_status()
+            logger.info(f"Updated task {task_id}: keep={keep}")
+            return True
                 
         except Exception as e:
             logger.error(f"Error updating task {task_id}: {e}")
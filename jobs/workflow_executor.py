@@ -21,6 +21,11 @@ from db.brain import (
     get_workflows,
     update_workflow_execution,
     create_pending_action,
+    get_core_identity,
+    get_preferences,
+    search_entities,
+    get_vip_entities,
+    create_entity,
 )
 from config import settings
 
@@ -95,19 +100,15 @@ async def execute_query_brain(params: Dict) -> Dict:
     result = None
     
     if query_type == "get_identity":
-        from db.brain import get_core_identity
         result = get_core_identity()
     elif query_type == "get_preferences":
-        from db.brain import get_preferences
         result = get_preferences(query_params.get("category"))
     elif query_type == "get_entities":
-        from db.brain import search_entities
         result = search_entities(
             query=query_params.get("query"),
             entity_type=query_params.get("entity_type")
         )
     elif query_type == "get_vip_entities":
-        from db.brain import get_vip_entities
         result = get_vip_entities()
     else:
         return {"success": False, "error": f"Unknown query type: {query_type}"}
@@ -138,8 +139,6 @@ async def execute_update_preference(params: Dict) -> Dict:
 
 async def execute_create_entity(params: Dict) -> Dict:
     """Create an entity in the knowledge graph."""
-    from db.brain import create_entity
-    
     entity_id = create_entity(
         entity_type=params.get("entity_type", "unknown"),
         name=params.get("name", ""),
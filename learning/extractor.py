@@ -11,6 +11,8 @@ import json
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
+import anthropic
+
 from config import settings
 from db.brain import (
     create_entity,
@@ -84,8 +86,6 @@ async def extract_entities_from_text(
         return {"people": [], "companies": [], "projects": [], "topics": [], "action_items": [], "relationships": []}
 
     try:
-        import anthropic
-
         client = anthropic.Anthropic(api_key=settings.ANTHROPIC_API_KEY)
 
         response = client.messages.create(
@@ -268,8 +268,6 @@ async def learn_from_task_completion(
         return await learn_from_bad_task(task_title, completion_notes)
 
     try:
-        import anthropic
-
         client = anthropic.Anthropic(api_key=settings.ANTHROPIC_API_KEY)
 
         response = client.messages.create(
@@ -322,7 +320,6 @@ async def learn_from_bad_task(task_title: str, reason: str = "") -> Dict[str, An
     }
 
     # Store as pending boundary proposal in evolution_log
-    import json as json_module
     with db_cursor() as cursor:
         cursor.execute("""
             INSERT INTO evolution_log (
@@ -332,7 +329,7 @@ async def learn_from_bad_task(task_title: str, reason: str = "") -> Dict[str, An
             )
         """, (
             f"Avoid creating tasks like: {task_title}",
-            json_module.dumps({"rule": f"Do not create tasks like: {task_title}", "reason": reason or 'Not specified'})
+            json.dumps({"rule": f"Do not create tasks like: {task_title}", "reason": reason or 'Not specified'})
         ))
 
     logger.info(f"Learned from bad task: {task_title}")
@@ -355,7 +352,6 @@ async def store_task_learnings(learnings: Dict[str, Any]) -> None:
 
     # Store workflow suggestion if any in evolution_log
     if learnings.get("should_create_workflow") and learnings.get("workflow_suggestion"):
-        import json as json_module
         with db_cursor() as cursor:
             cursor.execute("""
                 INSERT INTO evolution_log (
@@ -365,7 +361,7 @@ async def store_task_learnings(learnings: Dict[str, Any]) -> None:
                 )
             """, (
                 learnings.get("workflow_suggestion"),
-                json_module.dumps({"task_title": learnings.get('task_title'), "suggestion": learnings.get('workflow_suggestion')})
+                json.dumps({"task_title": learnings.get('task_title'), "suggestion": learnings.get('workflow_suggestion')})
             ))
 
 
@@ -428,7 +424,6 @@ async def quick_learn(
 
     elif classification["type"] == "fact":
         # Store in canonical memory
-        import json
         with db_cursor() as cursor:
             cursor.execute("""
                 INSERT INTO canonical_memory (category, key, value, content, source, confidence, approved_at, approved_in_session)
@@ -27,15 +27,17 @@ except Exception as e:
     import pytz
     ZoneInfo = lambda tz: pytz.timezone(tz)
 from contextlib import asynccontextmanager
-from datetime import datetime
 
+import anyio.to_thread
 from fastapi import FastAPI, HTTPException, Depends, Header
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 
 from config import settings
-from db.neon import get_db_connection, check_db_health
+from db.neon import get_db_connection, check_db_health, open_async_pool, close_async_pool, close_sync_pool
 
 # Initialize Sentry for error monitoring
 try:
@@ -52,7 +54,13 @@ try:
         early_logger.info("Sentry DSN not configured, skipping initialization")
 except ImportError:
     early_logger.warning("sentry-sdk not installed, error monitoring disabled")
-from api.routes import router as api_router
+from api.cache import close_cache, invalidate
+from integrations.http_client import close_http_client
+from jobs.offload import run_offloaded, shutdown_job_executor
+from jobs.scheduler_lock import acquire_scheduler_lock, release_scheduler_lock
+from utils.clock import iso_now
+from api.routes import router as api_router, refresh_notion_broadcasts
+from api.thought_writer import close_thought_writer
 from api.brain_routes import router as brain_router
 from api.session_init import router as session_router
 from api.thinking_routes import router as thinking_router
@@ -73,16 +81,24 @@ logger = logging.getLogger("athena")
 # Scheduler for cron jobs
 scheduler = AsyncIOScheduler(timezone=ZoneInfo("Europe/London"))
 
+# Threads for plain `def` route handlers (sync DB calls); anyio defaults to 40
+THREADPOOL_SIZE = 100
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Startup and shutdown events."""
-    import os
     logger.info("Starting Athena Server v2...")
     logger.info(f"DATABASE_URL set: {bool(os.getenv('DATABASE_URL'))}")
     logger.info(f"DATABASE_URL length: {len(os.getenv('DATABASE_URL', ''))}")
     logger.info(f"DATABASE_URL prefix: {os.getenv('DATABASE_URL', '')[:50]}...")
     
+    # Sync handlers run in anyio's threadpool; give them room under load
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    
+    # Open the shared async database pool used by request handlers
+    await open_async_pool()
+    
     # Check database connection - non-fatal to allow server to start
     try:
         if not await check_db_health():
@@ -92,23 +108,33 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"Database health check exception: {e}")
     
-    # Start scheduler
-    setup_scheduled_jobs()
-    scheduler.start()
-    logger.info("Scheduler started with jobs: %s", [job.id for job in scheduler.get_jobs()])
+    # Start scheduler - in one worker only, or every cron job fires once per worker
+    if acquire_scheduler_lock():
+        setup_scheduled_jobs()
+        scheduler.start()
+        logger.info("Scheduler started with jobs: %s", [job.id for job in scheduler.get_jobs()])
     
     yield
     
     # Shutdown
     logger.info("Shutting down Athena Server v2...")
-    scheduler.shutdown()
+    if scheduler.running:
+        scheduler.shutdown()
+        release_scheduler_lock()
+    shutdown_job_executor()
+    await close_thought_writer()
+    await close_cache()
+    await close_http_client()
+    await close_async_pool()
+    close_sync_pool()
 
 
 app = FastAPI(
     title="Athena Server v2",
     description="Cognitive Extension System - Three-tier thinking model",
     version="2.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Boundary Enforcement Middleware (CRITICAL - must be first)
@@ -116,6 +142,15 @@ from api.middleware.boundary_check import BoundaryCheckMiddleware
 app.add_middleware(BoundaryCheckMiddleware)
 logger.info("Boundary enforcement middleware enabled")
 
+# ETag / Cache-Control for polled GET routes
+from api.middleware.http_cache import HttpCacheMiddleware
+app.add_middleware(HttpCacheMiddleware)
+
+# Uncaught handler errors -> JSON 500, added just inside CORS so the 500
+# carries CORS headers (an app-level exception handler runs outside CORS)
+from api.middleware.error_handler import UnhandledErrorMiddleware
+app.add_middleware(UnhandledErrorMiddleware)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -130,24 +165,31 @@ app.add_middleware(
 from api.auth import verify_api_key
 
 
+async def run_scheduled_job(job_path: str, tags: tuple = ()):
+    """
+    Run a cron job in the job process pool, then drop cached responses built
+    from the data it writes (same tags as the matching /trigger endpoint).
+    """
+    try:
+        await run_offloaded(job_path)
+    finally:
+        if tags:
+            await invalidate(*tags)
+
+
 def setup_scheduled_jobs():
-    """Configure all scheduled jobs."""
-    from jobs.observation_burst import run_observation_burst
-    from jobs.pattern_detection import run_pattern_detection
-    from jobs.synthesis import run_synthesis
-    from jobs.morning_sessions import create_agenda_workspace
-    from jobs.athena_thinking import run_athena_thinking
-    from jobs.overnight_learning import run_overnight_learning
-    from jobs.weekly_rebuild import run_weekly_rebuild
-    from jobs.notion_sync import run_notion_sync
-    from jobs.evolution_engine import run_evolution_engine
-    from jobs.hourly_broadcast import run_hourly_broadcast
-    from jobs.synthesis_broadcast import run_synthesis_broadcast
+    """
+    Configure all scheduled jobs.
+    
+    Jobs run in the job process pool (jobs.offload) so a long synthesis or
+    learning run never stalls request handling on the event loop.
+    """
     
     # Observation burst - every 30 minutes
     scheduler.add_job(
-        run_observation_burst,
+        run_scheduled_job,
         CronTrigger(minute="*/30"),
+        args=["jobs.observation_burst:run_observation_burst", ("observations",)],
         id="observation_burst",
         name="Observation Burst (Tier 1)",
         replace_existing=True
@@ -155,8 +197,9 @@ def setup_scheduled_jobs():
     
     # Pattern detection - every 30 minutes
     scheduler.add_job(
-        run_pattern_detection,
+        run_scheduled_job,
         CronTrigger(minute="*/30"),
+        args=["jobs.pattern_detection:run_pattern_detection", ("patterns", "observations")],
         id="pattern_detection",
         name="Pattern Detection (Tier 2)",
         replace_existing=True
@@ -165,8 +208,9 @@ def setup_scheduled_jobs():
     # Synthesis - 4x daily (6am, 12pm, 6pm, 10pm London)
     # NOTE: Runs at minute 0 to avoid overlap with hourly_broadcast at minute 30
     scheduler.add_job(
-        run_synthesis,
+        run_scheduled_job,
         CronTrigger(hour="6,12,18,22", minute=0),
+        args=["jobs.synthesis:run_synthesis", ("synthesis",)],
         id="synthesis",
         name="Synthesis (Tier 3)",
         replace_existing=True
@@ -175,8 +219,9 @@ def setup_scheduled_jobs():
     # ATHENA THINKING - 5:30 AM London (hybrid: server-side + Manus broadcast)
     # This also spawns the Workspace & Agenda session immediately after
     scheduler.add_job(
-        run_athena_thinking,
+        run_scheduled_job,
         CronTrigger(hour=5, minute=30),
+        args=["jobs.athena_thinking:run_athena_thinking", ("sessions", "broadcasts")],
         id="athena_thinking",
         name="ATHENA THINKING (Hybrid)",
         replace_existing=True
@@ -185,8 +230,9 @@ def setup_scheduled_jobs():
     # Workspace & Agenda - 5:35 AM London (spawned by server, not Manus scheduled)
     # Runs right after ATHENA THINKING completes
     scheduler.add_job(
-        create_agenda_workspace,
+        run_scheduled_job,
         CronTrigger(hour=5, minute=35),
+        args=["jobs.morning_sessions:create_agenda_workspace", ("sessions",)],
         id="agenda_workspace",
         name="Workspace & Agenda Session",
         replace_existing=True
@@ -198,8 +244,9 @@ def setup_scheduled_jobs():
     
     # Overnight learning - every hour from midnight to 5am
     scheduler.add_job(
-        run_overnight_learning,
+        run_scheduled_job,
         CronTrigger(hour="0-5", minute=0),
+        args=["jobs.overnight_learning:run_overnight_learning"],
         id="overnight_learning",
         name="Overnight Learning",
         replace_existing=True
@@ -207,8 +254,9 @@ def setup_scheduled_jobs():
     
     # Weekly rebuild - Sunday midnight
     scheduler.add_job(
-        run_weekly_rebuild,
+        run_scheduled_job,
         CronTrigger(day_of_week="sun", hour=0, minute=0),
+        args=["jobs.weekly_rebuild:run_weekly_rebuild", ("synthesis",)],
         id="weekly_rebuild",
         name="Weekly Synthesis Rebuild",
         replace_existing=True
@@ -216,8 +264,9 @@ def setup_scheduled_jobs():
     
     # Notion sync - every 4 hours (brain → Notion mirror)
     scheduler.add_job(
-        run_notion_sync,
+        run_scheduled_job,
         CronTrigger(hour="*/4", minute=45),
+        args=["jobs.notion_sync:run_notion_sync"],
         id="notion_sync",
         name="Notion Sync (Brain Mirror)",
         replace_existing=True
@@ -225,8 +274,9 @@ def setup_scheduled_jobs():
     
     # Evolution engine - Sunday 2 AM (after weekly rebuild)
     scheduler.add_job(
-        run_evolution_engine,
+        run_scheduled_job,
         CronTrigger(day_of_week="sun", hour=2, minute=0),
+        args=["jobs.evolution_engine:run_evolution_engine", ("brain",)],
         id="evolution_engine",
         name="Evolution Engine (Brain Learning)",
         replace_existing=True
@@ -235,13 +285,24 @@ def setup_scheduled_jobs():
     # Hourly broadcast - every hour on the half-hour (6:30am-10:30pm London)
     # Broadcasts only during active hours; overnight bursts stored but not broadcast
     scheduler.add_job(
-        run_hourly_broadcast,
+        run_scheduled_job,
         CronTrigger(hour="6-22", minute=30),
+        args=["jobs.hourly_broadcast:run_hourly_broadcast", ("broadcasts",)],
         id="hourly_broadcast",
         name="Hourly Thought Broadcast",
         replace_existing=True
     )
     
+    # Notion broadcasts cache - every minute, into Redis for /broadcasts/notion
+    # A single HTTP call, so it runs on the event loop rather than the job pool
+    scheduler.add_job(
+        refresh_notion_broadcasts,
+        IntervalTrigger(seconds=60),
+        id="notion_broadcasts_refresh",
+        name="Notion Broadcasts Cache Refresh",
+        replace_existing=True
+    )
+    
     logger.info("Scheduled jobs configured")
 
 
@@ -275,11 +336,10 @@ async def root():
 @app.get("/api/health")
 async def public_health_check():
     """Public health check endpoint."""
-    from db.neon import check_db_health
     db_healthy = await check_db_health()
     return {
         "status": "healthy" if db_healthy else "degraded",
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": iso_now(),
         "components": {
             "database": "ok" if db_healthy else "error",
             "scheduler": "ok"
@@ -302,4 +362,13 @@ app.include_router(webhook_router)  # No auth required for GitHub webhooks (sign
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=settings.PORT)
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=settings.PORT,
+        workers=settings.WEB_CONCURRENCY,
+        # uvloop/httptools when installed (everywhere but Windows dev machines)
+        loop="auto",
+        http="auto",
+        backlog=2048,
+    )
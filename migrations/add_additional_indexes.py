@@ -61,6 +61,10 @@ CREATE INDEX IF NOT EXISTS idx_entity_notes_created ON entity_notes(created_at);
 -- thinking_log: Composite index for session + phase queries
 CREATE INDEX IF NOT EXISTS idx_thinking_log_session_phase ON thinking_log(session_id, phase);
 
+-- thinking_log: Newest-first per session (/thinking/status), pending questions
+CREATE INDEX IF NOT EXISTS idx_thinking_log_session_created ON thinking_log(session_id, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_thinking_log_questions ON thinking_log(session_id, created_at DESC) WHERE thought_type = 'question';
+
 -- performance_metrics: Metric name for specific metric lookups
 CREATE INDEX IF NOT EXISTS idx_performance_metrics_name ON performance_metrics(metric_name);
 
@@ -15,7 +15,7 @@ from typing import Dict, Any, Optional, List
 from enum import Enum
 import pytz
 
-from db.neon import get_active_session, set_active_session
+from db.neon import get_active_session, set_active_session, get_all_active_sessions
 from integrations.manus_api import create_manus_task as _raw_create_manus_task
 from integrations.manus_api import rename_manus_task
 from config import MANUS_CONNECTORS
@@ -250,7 +250,6 @@ class SessionManager:
 
     def get_all_active(self) -> List[Dict[str, Any]]:
         """Get all active sessions."""
-        from db.neon import get_all_active_sessions
         return get_all_active_sessions()
 
 
@@ -63,6 +63,15 @@ def test_sentry_test_endpoint(client):
     assert response.status_code == 500
 
 
+def test_unhandled_error_has_cors_headers(client, auth_headers):
+    """Unhandled errors become a JSON 500 that still passes through CORS."""
+    headers = {**auth_headers, "Origin": "http://localhost:3000"}
+    response = client.get("/api/sentry-test", headers=headers)
+    assert response.status_code == 500
+    assert "detail" in response.json()
+    assert "access-control-allow-origin" in response.headers
+
+
 @pytest.mark.parametrize("limit", [1, 5, 10])
 def test_observations_with_different_limits(client, limit):
     """Test observations endpoint with different limit values."""
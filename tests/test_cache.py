@@ -0,0 +1,95 @@
+"""
+Test response caching for Athena Server v2
+"""
+
+import asyncio
+
+import orjson
+import pytest
+
+from api import cache
+from api.cache import MSGPACK_MEDIA_TYPE, cached, invalidate
+
+
+@pytest.fixture(autouse=True)
+def no_redis(monkeypatch):
+    """Run with the in-process L1 cache only."""
+    monkeypatch.setattr(cache, "get_redis", lambda: None)
+
+
+def _counting_handler(key_prefix, tags=()):
+    calls = []
+
+    @cached(ttl=60, key_prefix=key_prefix, tags=tags)
+    async def handler(limit: int = 10, fmt: str = "json"):
+        calls.append(limit)
+        return {"limit": limit, "call": len(calls)}
+
+    return handler, calls
+
+
+async def test_miss_then_hit():
+    """The first call computes and stores; the second is served from L1."""
+    handler, calls = _counting_handler("test_hit_miss")
+
+    first = await handler(limit=5, fmt="json")
+    second = await handler(limit=5, fmt="json")
+
+    assert first.headers["X-Cache"] == "MISS"
+    assert second.headers["X-Cache"] == "HIT"
+    assert orjson.loads(second.body) == {"limit": 5, "call": 1}
+    assert second.headers["ETag"] == first.headers["ETag"]
+    assert calls == [5]
+
+
+async def test_keys_separate_by_params_and_format():
+    """Different query params and formats are cached under their own keys."""
+    handler, calls = _counting_handler("test_key_separation")
+
+    as_json = await handler(limit=1, fmt="json")
+    as_msgpack = await handler(limit=1, fmt="msgpack")
+    other_limit = await handler(limit=2, fmt="json")
+
+    assert as_json.headers["X-Cache"] == "MISS"
+    assert as_msgpack.headers["X-Cache"] == "MISS"
+    assert as_msgpack.media_type == MSGPACK_MEDIA_TYPE
+    assert other_limit.headers["X-Cache"] == "MISS"
+    assert calls == [1, 1, 2]
+
+
+async def test_invalidate_clears_local_cache():
+    """invalidate(tag) drops L1 entries of endpoints tagged with it."""
+    handler, calls = _counting_handler("test_invalidate", tags=("test_tag",))
+
+    await handler(limit=3, fmt="json")
+    await invalidate("test_tag")
+    again = await handler(limit=3, fmt="json")
+
+    assert again.headers["X-Cache"] == "MISS"
+    assert calls == [3, 3]
+
+
+async def test_single_flight_survives_failing_handler():
+    """Concurrent misses never run the handler in parallel, even when it raises."""
+    active = 0
+    max_active = 0
+
+    @cached(ttl=60, key_prefix="test_single_flight")
+    async def failing_handler(limit: int = 10):
+        nonlocal active, max_active
+        active += 1
+        max_active = max(max_active, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        raise RuntimeError("upstream down")
+
+    first_wave = [asyncio.create_task(failing_handler(limit=1)) for _ in range(3)]
+    # Let the first call fail while the others are still queued on the lock
+    await asyncio.sleep(0.015)
+    second_wave = [asyncio.create_task(failing_handler(limit=1)) for _ in range(2)]
+
+    results = await asyncio.gather(*first_wave, *second_wave, return_exceptions=True)
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert max_active == 1
+    assert not cache._key_locks
@@ -0,0 +1,154 @@
+"""
+Test trigger idempotency for Athena Server v2
+"""
+
+import asyncio
+from concurrent.futures import Future
+
+import pytest
+
+from api import idempotency
+from api.idempotency import hold_until_done, idempotent
+
+
+@pytest.fixture(autouse=True)
+def local_claims(monkeypatch):
+    """Use the per-process claim map, starting empty."""
+    monkeypatch.setattr(idempotency, "get_redis", lambda: None)
+    monkeypatch.setattr(idempotency, "_local_claims", {})
+
+
+async def test_duplicate_within_ttl_returns_same_run_id():
+    """A repeat call inside the window is answered without running the handler."""
+    calls = []
+    job = Future()
+
+    @idempotent("test:duplicate", ttl=60)
+    async def trigger():
+        calls.append(1)
+        hold_until_done(job)
+        return {"status": "running"}
+
+    first = await trigger()
+    second = await trigger()
+
+    assert first["status"] == "running"
+    assert second["status"] == "duplicate"
+    assert second["run_id"] == first["run_id"]
+    assert len(calls) == 1
+    job.set_result(None)
+    await asyncio.gather(*idempotency._keepalive_tasks)
+
+
+async def test_failed_handler_releases_claim():
+    """If the handler raises, the next call runs again instead of being a duplicate."""
+    attempts = []
+
+    @idempotent("test:release", ttl=60)
+    async def trigger():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError("failed to start")
+        return {"status": "running"}
+
+    with pytest.raises(RuntimeError):
+        await trigger()
+    retry = await trigger()
+
+    assert retry["status"] == "running"
+    assert len(attempts) == 2
+
+
+async def test_failure_result_releases_claim():
+    """A handler that catches its own error and returns a failure dict can be retried."""
+    attempts = []
+
+    @idempotent("test:failure-result", ttl=60)
+    async def trigger():
+        attempts.append(1)
+        if len(attempts) == 1:
+            return {"message": "failed", "error": "boom"}
+        return {"message": "completed"}
+
+    failed = await trigger()
+    retry = await trigger()
+
+    assert failed["error"] == "boom"
+    assert retry["message"] == "completed"
+    assert len(attempts) == 2
+
+
+async def test_inline_run_is_duplicate_only_while_running():
+    """A sync handler blocks repeats while it runs and frees the key when done."""
+    gate = asyncio.Event()
+
+    @idempotent("test:inline", ttl=60)
+    async def trigger():
+        await gate.wait()
+        return {"message": "completed"}
+
+    first = asyncio.create_task(trigger())
+    await asyncio.sleep(0)
+    during = await trigger()
+    gate.set()
+    done = await first
+    after = await trigger()
+
+    assert during["status"] == "duplicate"
+    assert during["run_id"] == done["run_id"]
+    assert after["message"] == "completed"
+    assert after["run_id"] != done["run_id"]
+
+
+async def test_different_kwargs_claim_separately():
+    """force=True is a different run from the default call."""
+    job = Future()
+
+    @idempotent("test:kwargs", ttl=60)
+    async def trigger(force: bool = False):
+        hold_until_done(job)
+        return {"status": "running", "force": force}
+
+    default = await trigger(force=False)
+    forced = await trigger(force=True)
+    forced_again = await trigger(force=True)
+
+    assert default["status"] == "running"
+    assert forced["status"] == "running"
+    assert forced["run_id"] != default["run_id"]
+    assert forced_again["status"] == "duplicate"
+    assert forced_again["run_id"] == forced["run_id"]
+    job.set_result(None)
+    await asyncio.gather(*idempotency._keepalive_tasks)
+
+
+async def test_hold_until_done_outlives_ttl():
+    """A claim held for a running job is not released when the window passes."""
+    job = Future()
+
+    @idempotent("test:hold", ttl=0.1)
+    async def trigger():
+        hold_until_done(job)
+        return {"status": "running"}
+
+    first = await trigger()
+    await asyncio.sleep(0.25)
+    second = await trigger()
+    job.set_result(None)
+    await asyncio.gather(*idempotency._keepalive_tasks)
+
+    assert second["status"] == "duplicate"
+    assert second["run_id"] == first["run_id"]
+
+
+async def test_refresh_does_not_recreate_released_claim():
+    """A keep-alive for a run whose claim is gone leaves the key free."""
+    claimed, run_id = await idempotency.claim("test:refresh", ttl=60)
+    claim_key = idempotency._claim_key("test:refresh", {})
+    await idempotency.release("test:refresh")
+
+    await idempotency._refresh(claim_key, run_id, 60)
+    claimed_again, _ = await idempotency.claim("test:refresh", ttl=60)
+
+    assert claimed
+    assert claimed_again
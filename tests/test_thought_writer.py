@@ -0,0 +1,69 @@
+"""
+Test the batched thought writer for Athena Server v2
+"""
+
+import asyncio
+
+import psycopg
+import pytest
+from psycopg.errors import DataError
+
+from api import thought_writer
+
+
+def _row(content):
+    return ("session-1", "observation", content, None, None, None)
+
+
+@pytest.fixture
+async def insert_calls(monkeypatch):
+    """Replace the database insert; rows with content "bad" fail the batch."""
+    calls = []
+
+    async def fake_insert_batch(rows):
+        calls.append(rows)
+        if any(row[2] == "bad" for row in rows):
+            raise DataError("invalid input")
+        return [(f"id-{row[2]}", None) for row in rows]
+
+    monkeypatch.setattr(thought_writer, "_insert_batch", fake_insert_batch)
+    yield calls
+    await thought_writer.close_thought_writer()
+
+
+async def test_bad_row_fails_alone(insert_calls):
+    """A row-level error only fails its own row; the rest of the batch gets ids."""
+    results = await asyncio.gather(
+        thought_writer.write_thought(_row("a")),
+        thought_writer.write_thought(_row("bad")),
+        thought_writer.write_thought(_row("b")),
+        return_exceptions=True,
+    )
+
+    assert results[0] == ("id-a", None)
+    assert isinstance(results[1], DataError)
+    assert results[2] == ("id-b", None)
+    # One batch attempt, then one retry per row
+    assert len(insert_calls[0]) == 3
+    assert len(insert_calls) == 4
+
+
+async def test_connection_error_fails_batch_at_once(monkeypatch):
+    """Connection errors fail every row of the batch without per-row retries."""
+    calls = []
+
+    async def failing_insert_batch(rows):
+        calls.append(rows)
+        raise psycopg.OperationalError("connection refused")
+
+    monkeypatch.setattr(thought_writer, "_insert_batch", failing_insert_batch)
+    try:
+        results = await asyncio.gather(
+            *(thought_writer.write_thought(_row(str(i))) for i in range(3)),
+            return_exceptions=True,
+        )
+    finally:
+        await thought_writer.close_thought_writer()
+
+    assert all(isinstance(r, psycopg.OperationalError) for r in results)
+    assert len(calls) == 1
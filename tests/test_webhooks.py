@@ -0,0 +1,59 @@
+"""
+Test GitHub webhook signature verification for Athena Server v2
+"""
+
+import hashlib
+import hmac
+
+import pytest
+
+from api import webhooks
+from api.webhooks import verify_signature
+
+SECRET = "test-secret"
+PAYLOAD = b'{"ref": "refs/heads/master"}'
+
+
+@pytest.fixture(autouse=True)
+def webhook_secret(monkeypatch):
+    """Configure a known webhook secret."""
+    monkeypatch.setattr(webhooks, "WEBHOOK_SECRET", SECRET)
+    monkeypatch.setattr(webhooks, "_WEBHOOK_KEY", SECRET.encode())
+
+
+def _sign(payload: bytes, secret: str = SECRET) -> str:
+    return "sha256=" + hmac.new(secret.encode(), payload, hashlib.sha256).hexdigest()
+
+
+def test_valid_signature():
+    assert verify_signature(PAYLOAD, _sign(PAYLOAD)) is True
+
+
+def test_missing_signature():
+    assert verify_signature(PAYLOAD, None) is False
+
+
+def test_wrong_prefix():
+    digest = _sign(PAYLOAD)[len("sha256="):]
+    assert verify_signature(PAYLOAD, "sha1=" + digest) is False
+
+
+def test_wrong_length():
+    assert verify_signature(PAYLOAD, _sign(PAYLOAD)[:-2]) is False
+    assert verify_signature(PAYLOAD, _sign(PAYLOAD) + "00") is False
+
+
+def test_non_hex_characters():
+    signature = _sign(PAYLOAD)
+    assert verify_signature(PAYLOAD, signature[:-1] + "z") is False
+
+
+def test_mismatched_digest():
+    assert verify_signature(PAYLOAD, _sign(b"other payload")) is False
+    assert verify_signature(PAYLOAD, _sign(PAYLOAD, secret="other-secret")) is False
+
+
+def test_empty_secret_rejects_everything(monkeypatch):
+    monkeypatch.setattr(webhooks, "WEBHOOK_SECRET", "")
+    monkeypatch.setattr(webhooks, "_WEBHOOK_KEY", b"")
+    assert verify_signature(PAYLOAD, _sign(PAYLOAD, secret="")) is False
@@ -0,0 +1,34 @@
+"""
+Cached UTC timestamps for status responses.
+
+Health and status endpoints are polled constantly (load balancers, uptime
+checks) and only need second resolution, so the ISO string is formatted once
+per second instead of on every request.
+"""
+
+import time
+
+# (epoch second, formatted string) for the last call
+_iso_cache = (0, "")
+
+
+def iso_now() -> str:
+    """
+    Current UTC time as an ISO 8601 string, at one-second resolution.
+
+    Returns:
+        e.g. "2026-01-01T12:00:00+00:00"
+    """
+    global _iso_cache
+    sec = int(time.time())
+    cached_sec, cached = _iso_cache
+    if sec != cached_sec:
+        # Same output as datetime.fromtimestamp(sec, timezone.utc).isoformat(),
+        # without building a datetime
+        t = time.gmtime(sec)
+        cached = (
+            f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+            f"T{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}+00:00"
+        )
+        _iso_cache = (sec, cached)
+    return cached
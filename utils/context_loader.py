@@ -14,6 +14,8 @@ from pathlib import Path
 from typing import Dict, Optional
 from datetime import datetime, timedelta
 
+from db.neon import db_cursor
+
 logger = logging.getLogger("athena.context_loader")
 
 # Cache for context files (in-memory, 5-minute TTL)
@@ -175,8 +177,6 @@ def cleanup_expired_rules() -> Dict[str, int]:
     counts = {"boundaries": 0, "preferences": 0, "canonical_memory": 0}
     
     try:
-        from db.neon import db_cursor
-        
         with db_cursor() as cur:
             # Deactivate expired boundaries
             cur.execute("""
@@ -221,8 +221,6 @@ def load_active_rules_from_db() -> str:
         Formatted markdown string with active rules from the database
     """
     try:
-        from db.neon import db_cursor
-        
         sections = []
         
         with db_cursor() as cur: